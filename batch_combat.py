@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 일괄 전투 계산기
+GameState.attack_monster와 같은 규칙으로 수많은 플레이어/몬스터 조합의 전투 결과를
+NumPy 벡터 연산 한 번으로 계산 (밸런스 분석용, numpy 필요)
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from game_core import MonsterTemplate
+
+
+@dataclass
+class CombatOutcome:
+    turns_to_kill: np.ndarray  # 몬스터를 쓰러뜨리는 데 필요한 공격 횟수
+    turns: np.ndarray          # 실제로 진행된 공격 횟수
+    damage_taken: np.ndarray   # 플레이어가 받은 총 피해
+    final_hp: np.ndarray       # 전투 후 플레이어 체력 (패배 시 1)
+    survived: np.ndarray       # 몬스터를 쓰러뜨렸는지 여부
+    exp: np.ndarray            # 획득 경험치
+    gold: np.ndarray           # 획득 골드
+
+
+def monster_arrays(monsters: Dict[str, MonsterTemplate]) -> Tuple[List[str], Dict[str, np.ndarray]]:
+    """몬스터 데이터베이스를 (키 목록, 능력치 배열) 형태로 변환"""
+    keys = list(monsters)
+    templates = [monsters[key] for key in keys]
+    arrays = {
+        "hp": np.array([m.max_hp for m in templates], dtype=np.int64),
+        "attack": np.array([m.attack for m in templates], dtype=np.int64),
+        "defense": np.array([m.defense for m in templates], dtype=np.int64),
+        "exp": np.array([m.exp_reward for m in templates], dtype=np.int64),
+        "gold": np.array([m.gold_reward for m in templates], dtype=np.int64),
+    }
+    return keys, arrays
+
+
+def resolve(player_attack, player_defense, player_hp,
+            monster_hp, monster_attack, monster_defense, monster_exp, monster_gold,
+            weapon_attack=0, armor_defense=0) -> CombatOutcome:
+    """전투 결과 일괄 계산
+
+    모든 인자는 스칼라 또는 배열이며 NumPy 브로드캐스팅 규칙을 따른다.
+    플레이어 배열에 [:, None]을 붙이면 (플레이어 × 몬스터) 전체 조합을 계산한다.
+    플레이어가 먼저 공격하고, 살아남은 몬스터가 반격하는 순서는 attack_monster와 같다.
+    처치 후 레벨업에 의한 체력 회복은 final_hp에 반영하지 않는다.
+    """
+    total_attack = np.asarray(player_attack, dtype=np.int64) + weapon_attack
+    total_defense = np.asarray(player_defense, dtype=np.int64) + armor_defense
+    player_hp = np.asarray(player_hp, dtype=np.int64)
+
+    player_damage = np.maximum(1, total_attack - monster_defense)
+    monster_damage = np.maximum(1, monster_attack - total_defense)
+
+    # 올림 나눗셈: 몬스터/플레이어를 쓰러뜨리는 데 필요한 타격 수
+    turns_to_kill = -(-np.asarray(monster_hp, dtype=np.int64) // player_damage)
+    hits_to_die = -(-player_hp // monster_damage)
+
+    # 몬스터는 마지막 공격 전까지 turns_to_kill - 1번 반격한다
+    survived = turns_to_kill - 1 < hits_to_die
+    monster_hits = np.minimum(turns_to_kill - 1, hits_to_die)
+    damage_taken = monster_hits * monster_damage
+
+    return CombatOutcome(
+        turns_to_kill=turns_to_kill,
+        turns=np.where(survived, turns_to_kill, hits_to_die),
+        damage_taken=damage_taken,
+        final_hp=np.where(survived, player_hp - damage_taken, 1),
+        survived=survived,
+        exp=np.where(survived, monster_exp, 0),
+        gold=np.where(survived, monster_gold, 0),
+    )
+
+
+def resolve_grid(player_attack, player_defense, player_hp, monsters: Dict[str, MonsterTemplate],
+                 weapon_attack=0, armor_defense=0) -> Tuple[List[str], CombatOutcome]:
+    """플레이어 배열 × 몬스터 데이터베이스 전체 조합 계산 (결과 형태: (플레이어 수, 몬스터 수))"""
+    keys, m = monster_arrays(monsters)
+
+    def column(values):
+        return np.asarray(values, dtype=np.int64)[..., None]
+
+    outcome = resolve(
+        column(player_attack), column(player_defense), column(player_hp),
+        m["hp"], m["attack"], m["defense"], m["exp"], m["gold"],
+        weapon_attack=column(weapon_attack), armor_defense=column(armor_defense),
+    )
+    return keys, outcome
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+일괄 전투 계산 벤치마크
+NumPy 일괄 계산과 GameState.attack_monster 반복 실행의 조합당 비용 비교
+
+    python -m benchmarks.bench_batch_combat [--players N]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from batch_combat import resolve_grid
+from game_core import GameState
+
+
+def python_loop(attack, defense, hp, monster_key) -> int:
+    """GameState로 한 조합을 끝까지 싸워 진행된 공격 횟수 반환"""
+    game = GameState()
+    game.player_attack, game.player_defense, game.player_hp = attack, defense, hp
+    game.start_combat(game.monsters_database[monster_key].spawn())
+    turns = 0
+    while game.in_combat:
+        game.attack_monster()
+        turns += 1
+    return turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 전투 계산 벤치마크")
+    parser.add_argument("--players", type=int, default=1_000_000, help="플레이어 능력치 조합 수")
+    parser.add_argument("--loop-sample", type=int, default=2_000, help="파이썬 반복 측정 표본 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    attack = rng.integers(5, 60, args.players)
+    defense = rng.integers(0, 40, args.players)
+    hp = rng.integers(50, 400, args.players)
+    weapon = rng.choice([0, 5, 15], args.players)
+    armor = rng.choice([0, 3, 8], args.players)
+    database = GameState().monsters_database
+
+    start = time.perf_counter()
+    keys, outcome = resolve_grid(attack, defense, hp, database, weapon_attack=weapon, armor_defense=armor)
+    batch_elapsed = time.perf_counter() - start
+    matchups = outcome.turns.size
+
+    start = time.perf_counter()
+    for i in range(args.loop_sample):
+        python_loop(int(attack[i] + weapon[i]), int(defense[i] + armor[i]), int(hp[i]), keys[i % len(keys)])
+    loop_elapsed = time.perf_counter() - start
+
+    batch_per = batch_elapsed / matchups
+    loop_per = loop_elapsed / args.loop_sample
+    print(f"일괄 계산: {matchups:,}개 조합, {batch_elapsed:.3f}초 (조합당 {batch_per * 1e9:.1f}ns)")
+    print(f"파이썬 반복: {args.loop_sample:,}개 조합, {loop_elapsed:.3f}초 (조합당 {loop_per * 1e6:.1f}µs)")
+    print(f"속도 향상: {loop_per / batch_per:,.0f}배")
+    for col, key in enumerate(keys):
+        print(f"  {key:<8} 생존율 {outcome.survived[:, col].mean():6.1%}  평균 공격 횟수 {outcome.turns[:, col].mean():6.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+데모 화면 출력 벤치마크
+demo.py 화면을 명령어마다 다시 그리는 비용을 가상 터미널 없이 메모리 출력으로 측정
+이전 방식(줄마다 print, 화면 지우기용 셸 실행) vs 바뀐 줄만 한 번에 쓰는 FrameRenderer
+(높이 제한 없는 출력과 24줄 터미널 둘 다, 프레임이 화면보다 길면 전체를 다시 그리므로 전체 다시 그리기 횟수도 셈)
+
+    python -m benchmarks.bench_demo_render [--frames N]
+"""
+
+import argparse
+import io
+import os
+import time
+from contextlib import redirect_stdout
+
+from commands import COMMANDS
+from demo import game_frame
+from frame_renderer import CLEAR_SCREEN, FrameRenderer
+from game_core import GameState
+from ring_buffer import RingBuffer
+
+
+SCRIPT = ["주변", "인벤토리", "줍기", "북", "공격", "공격", "공격", "공격", "남", "동", "공격", "도망", "서", "도움말"]
+
+
+class CountingSink(io.TextIOBase):
+    """내용은 버리고 write 호출 수와 문자 수만 세는 출력"""
+
+    def __init__(self):
+        self.writes = 0
+        self.chars = 0
+        self.full_redraws = 0
+
+    def write(self, text: str) -> int:
+        self.writes += 1
+        self.chars += len(text)
+        self.full_redraws += text.startswith(CLEAR_SCREEN)
+        return len(text)
+
+    def isatty(self) -> bool:
+        return False
+
+
+def play(frames: int, draw) -> float:
+    """스크립트를 반복 실행하며 명령어마다 화면을 그린 총 시간"""
+    game = GameState(seed=0)
+    game.player_hp = game.player_max_hp = 10 ** 9
+    log: RingBuffer[str] = RingBuffer(100)
+    elapsed = 0.0
+    for i in range(frames):
+        command = SCRIPT[i % len(SCRIPT)]
+        _, messages = COMMANDS.dispatch(game, command)
+        log.append(f"> {command}")
+        log.extend(messages)
+        start = time.perf_counter()
+        draw(game, log)
+        elapsed += time.perf_counter() - start
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="데모 화면 출력 벤치마크")
+    parser.add_argument("--frames", type=int, default=20_000, help="그릴 프레임 수")
+    args = parser.parse_args()
+
+    legacy_sink = CountingSink()
+
+    def legacy_draw(game, log):
+        with redirect_stdout(legacy_sink):
+            for line in game_frame(game, log):
+                print(line)
+
+    def diff_draw(renderer: FrameRenderer):
+        return lambda game, log: renderer.render(game_frame(game, log, renderer.screen_height()))
+
+    renderer_sink = CountingSink()
+    terminal_sink = CountingSink()
+    legacy = play(args.frames, legacy_draw)
+    diffed = play(args.frames, diff_draw(FrameRenderer(renderer_sink)))
+    terminal = play(args.frames, diff_draw(FrameRenderer(terminal_sink, height=24)))
+
+    spawns = 50
+    start = time.perf_counter()
+    for _ in range(spawns):
+        os.system(":" if os.name != "nt" else "rem")  # clear_screen()이 프레임마다 하던 셸 실행
+    spawn = (time.perf_counter() - start) / spawns
+
+    print(f"프레임 {args.frames:,}개")
+    print(f"줄마다 print:     {args.frames / legacy:10,.0f} 프레임/초, 프레임당 write {legacy_sink.writes / args.frames:5.1f}회, "
+          f"{legacy_sink.chars / args.frames:6.0f}자 (+ 화면 지우기 셸 실행 {spawn * 1e3:.2f}ms → 최대 {1 / (spawn + legacy / args.frames):,.0f} 프레임/초)")
+    for title, seconds, sink in (("FrameRenderer:   ", diffed, renderer_sink), ("FrameRenderer 24줄:", terminal, terminal_sink)):
+        print(f"{title} {args.frames / seconds:10,.0f} 프레임/초, 프레임당 write {sink.writes / args.frames:5.1f}회, "
+              f"{sink.chars / args.frames:6.0f}자, 전체 다시 그리기 {sink.full_redraws:,}회")
+
+
+if __name__ == "__main__":
+    main()
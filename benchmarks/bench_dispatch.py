@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+명령어 디스패치 마이크로 벤치마크
+모든 별칭에 대해 명령어 테이블 조회 비용을 기존 if/elif 목록 검색 방식과 비교
+
+    python -m benchmarks.bench_dispatch [--number N]
+"""
+
+import argparse
+import timeit
+from typing import Optional
+
+from commands import COMMANDS
+
+
+def legacy_lookup(command: str) -> Optional[str]:
+    """기존 process_command의 if/elif 체인 (호출마다 별칭 목록 재생성)"""
+    if command in ["북", "n", "north"]:
+        return "north"
+    elif command in ["남", "s", "south"]:
+        return "south"
+    elif command in ["동", "e", "east"]:
+        return "east"
+    elif command in ["서", "w", "west"]:
+        return "west"
+    elif command in ["공격", "attack", "a"]:
+        return "attack"
+    elif command in ["도망", "flee", "f"]:
+        return "flee"
+    elif command in ["주변", "look", "l"]:
+        return "look"
+    elif command in ["줍기", "get", "g"]:
+        return "get"
+    elif command in ["인벤토리", "inventory", "i"]:
+        return "inventory"
+    elif command in ["사용", "use", "u"]:
+        return "use"
+    elif command in ["도움말", "help", "h", "?"]:
+        return "help"
+    elif command in ["종료", "quit", "q", "exit"]:
+        return "quit"
+    return None
+
+
+def ns_per_call(func, alias: str, number: int) -> float:
+    """호출당 평균 시간(ns)"""
+    elapsed = timeit.timeit("func(alias)", globals={"func": func, "alias": alias}, number=number)
+    return elapsed / number * 1e9
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명령어 디스패치 벤치마크")
+    parser.add_argument("--number", type=int, default=200_000, help="별칭당 반복 횟수")
+    args = parser.parse_args()
+
+    print(f"{'별칭':<12} {'명령어':<10} {'테이블(ns)':>12} {'기존(ns)':>12}")
+    print("-" * 50)
+
+    table_total = 0.0
+    legacy_total = 0.0
+    aliases = COMMANDS.aliases + ["unknown"]
+    for alias in aliases:
+        command, _ = COMMANDS.parse(alias)
+        table_ns = ns_per_call(COMMANDS.parse, alias, args.number)
+        legacy_ns = ns_per_call(legacy_lookup, alias, args.number)
+        table_total += table_ns
+        legacy_total += legacy_ns
+        name = command.name if command else "-"
+        print(f"{alias:<12} {name:<10} {table_ns:>12.1f} {legacy_ns:>12.1f}")
+
+    print("-" * 50)
+    print(f"{'평균':<23} {table_total / len(aliases):>12.1f} {legacy_total / len(aliases):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+헤드리스 엔진 처리량 벤치마크
+스크립트된 플레이를 여러 세션에서 실행하고 초당 명령어 수를 측정
+
+    python -m benchmarks.bench_engine [--sessions N] [--metrics]
+"""
+
+import argparse
+import time
+
+from engine import Engine
+from metrics import CommandMetrics
+
+
+PLAYTHROUGH = [
+    "주변", "줍기", "인벤토리", "사용",
+    "북", "공격", "공격", "공격", "공격", "공격", "줍기", "사용",
+    "북", "공격", "공격", "공격", "도망", "도망", "줍기", "줍기",
+    "남", "남", "동", "공격", "공격", "공격", "공격", "도망",
+    "동", "공격", "공격", "도망", "도망", "북", "공격", "도망", "도망",
+    "인벤토리", "도움말", "알수없음", "종료",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="헤드리스 엔진 처리량 벤치마크")
+    parser.add_argument("--sessions", type=int, default=5_000, help="실행할 세션 수")
+    parser.add_argument("--seed", type=int, default=0, help="첫 세션의 시드 (세션마다 1씩 증가)")
+    parser.add_argument("--notify", action="store_true", help="같은 방 알림 포함 (모든 세션이 한 방에서 시작)")
+    parser.add_argument("--metrics", action="store_true", help="명령어 지연 측정을 켜고 통계 출력 (측정 비용 확인용)")
+    args = parser.parse_args()
+
+    engine = Engine(notify_rooms=args.notify, metrics=CommandMetrics() if args.metrics else None)
+
+    start = time.perf_counter()
+    sessions = [engine.create_session(f"bot{i}", seed=args.seed + i) for i in range(args.sessions)]
+    create_elapsed = time.perf_counter() - start
+
+    commands = 0
+    events = 0
+    start = time.perf_counter()
+    for session in sessions:
+        for command in PLAYTHROUGH:
+            events += len(engine.step(session, command))
+            commands += 1
+    step_elapsed = time.perf_counter() - start
+
+    print(f"세션 생성: {args.sessions:,}개, {create_elapsed:.3f}초 ({args.sessions / create_elapsed:,.0f} 세션/초)")
+    print(f"명령어 실행: {commands:,}개, {step_elapsed:.3f}초 ({commands / step_elapsed:,.0f} 명령어/초)")
+    print(f"이벤트: {events:,}개, 명령어당 {step_elapsed / commands * 1e6:.2f}µs")
+    if engine.metrics is not None:
+        print("\n".join(engine.metrics.report()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+게임 로그 벤치마크
+100만 줄까지 쌓인 로그에 명령어 결과(여러 줄)를 추가하는 비용과 스크롤한 화면을 그리는 비용 측정
+원형 버퍼 GameLog vs Textual Log(max_lines) (textual 필요)
+
+    python -m benchmarks.bench_game_log [--lines N]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from textual.app import App
+from textual.widgets import Log
+
+from mud_game import GameLog
+from ring_buffer import RingBuffer
+
+
+BATCH = ["당신이 고블린에게 7의 피해를 입혔습니다!", "고블린이(가) 당신에게 3의 피해를 입혔습니다!", "> 공격"]
+
+
+def measure_storage(lines: int, batches: int):
+    """상한에 도달한 뒤 줄 추가 비용: 원형 버퍼 vs 리스트 앞부분 삭제"""
+    buffer = RingBuffer(lines)
+    buffer.extend(f"줄 {i}" for i in range(lines))
+    start = time.perf_counter()
+    for _ in range(batches):
+        buffer.extend(BATCH)
+    ring = (time.perf_counter() - start) / batches
+
+    plain = [f"줄 {i}" for i in range(lines)]
+    start = time.perf_counter()
+    for _ in range(batches):
+        plain.extend(BATCH)
+        del plain[:len(plain) - lines]
+    trimmed = (time.perf_counter() - start) / batches
+    return ring, trimmed
+
+
+class LogApp(App):
+    def __init__(self, widget):
+        super().__init__()
+        self.widget = widget
+
+    def compose(self):
+        yield self.widget
+
+
+async def measure_widget(widget, add, lines: int, batches: int):
+    """가득 찬 로그에 여러 줄 추가 비용과 임의 위치로 스크롤한 화면 한 장 그리는 비용"""
+    app = LogApp(widget)
+    async with app.run_test(size=(100, 30)) as pilot:
+        chunk = 10_000
+        for offset in range(0, lines, chunk):
+            add([f"줄 {i} 몬스터가 나타났습니다" for i in range(offset, min(offset + chunk, lines))])
+        await pilot.pause()
+
+        start = time.perf_counter()
+        for _ in range(batches):
+            add(BATCH)
+        write = (time.perf_counter() - start) / batches
+        await pilot.pause()
+
+        rng = random.Random(0)
+        height = widget.size.height
+        start = time.perf_counter()
+        for _ in range(batches):
+            widget.scroll_to(y=rng.randrange(lines), animate=False, immediate=True)
+            for y in range(height):
+                widget.render_line(y)
+        render = (time.perf_counter() - start) / batches
+    return write, render
+
+
+def main():
+    parser = argparse.ArgumentParser(description="게임 로그 벤치마크")
+    parser.add_argument("--lines", type=int, default=1_000_000, help="로그 상한 (미리 채울 줄 수)")
+    parser.add_argument("--batches", type=int, default=1_000, help="측정할 추가/그리기 횟수")
+    args = parser.parse_args()
+
+    ring, trimmed = measure_storage(args.lines, args.batches)
+    print(f"로그 {args.lines:,}줄, 추가 1회 = {len(BATCH)}줄")
+    print(f"저장소 추가:   원형 버퍼 {ring * 1e6:9.2f}µs, 리스트 앞부분 삭제 {trimmed * 1e6:9.2f}µs")
+
+    game_log = GameLog(max_lines=args.lines)
+    write, render = asyncio.run(measure_widget(game_log, game_log.add_messages, args.lines, args.batches))
+    textual_log = Log(max_lines=args.lines)
+    log_write, log_render = asyncio.run(measure_widget(textual_log, textual_log.write_lines, args.lines, args.batches))
+    print(f"GameLog:       추가 {write * 1e6:9.2f}µs, 화면 그리기 {render * 1e6:9.2f}µs")
+    print(f"Textual Log:   추가 {log_write * 1e6:9.2f}µs, 화면 그리기 {log_render * 1e6:9.2f}µs")
+
+
+if __name__ == "__main__":
+    main()
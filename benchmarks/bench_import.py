@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+가져오기(import) 시간 벤치마크
+새 파이썬 프로세스마다 모듈 하나를 불러오는 데 드는 시간을 재고 (워커 프로세스를 자주 띄울 때 매번 내는 비용),
+`python -X importtime`으로 함께 불러온 UI 라이브러리(textual/rich)와 오래 걸린 직접 가져오기를 보여줌
+(-X importtime은 모듈마다 측정 비용이 더해지므로 시간은 측정 없이 따로 잼)
+게임 로직만 쓰는 모듈은 HEADLESS_BUDGET 안에 들어와야 하고 Textual을 불러오지 않아야 함
+
+    python -m benchmarks.bench_import [--runs N] [모듈 ...]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+HEADLESS = ("game_core", "commands", "engine", "mud_game")  # Textual 없이 불러와야 하는 모듈
+MODULES = HEADLESS + ("tui",)
+HEADLESS_BUDGET = 0.05  # 게임 로직 가져오기 예산 (초)
+UI_PACKAGES = ("textual", "rich")
+STDLIB_FLOOR = "typing, dataclasses, enum, random"  # 게임 코어가 쓰는 표준 라이브러리만 (줄일 수 없는 바닥)
+
+
+def import_seconds(module: str) -> float:
+    """새 프로세스에서 module 하나를 불러오는 시간 (인터프리터 시작 비용 제외)"""
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return float(result.stdout)
+
+
+def import_profile(module: str) -> Tuple[float, Dict[str, float], List[str]]:
+    """-X importtime으로 module을 불러와 (누적 시간, 직접 가져온 모듈별 누적 시간, 불러온 UI 패키지) 반환"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    total = 0.0
+    children: Dict[str, float] = {}
+    packages = set()
+    # 자식 모듈이 부모보다 먼저 출력되므로 module 줄 바로 앞의 한 단계 들여쓴 줄들이 직접 가져온 모듈
+    pending: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        name = name.strip()
+        if name.split(".")[0] in UI_PACKAGES:
+            packages.add(name.split(".")[0])
+        if depth == 1:
+            pending[name] = int(cumulative) / 1e6
+        elif depth == 0:
+            if name == module:
+                total, children = int(cumulative) / 1e6, pending
+            pending = {}
+    return total, children, sorted(packages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가져오기 시간 벤치마크")
+    parser.add_argument("modules", nargs="*", default=list(MODULES), help="측정할 모듈")
+    parser.add_argument("--runs", type=int, default=7, help="모듈마다 새 프로세스 실행 횟수 (중앙값 사용)")
+    args = parser.parse_args()
+
+    print(f"{'모듈':<10} {'중앙값':>9} {'최소':>9}  불러온 UI 패키지 / 오래 걸린 직접 가져오기 (-X importtime)")
+    floor = [import_seconds(STDLIB_FLOOR) for _ in range(args.runs)]
+    print(f"{'표준 라이브러리':<10} {statistics.median(floor) * 1e3:7.1f}ms {min(floor) * 1e3:7.1f}ms  ({STDLIB_FLOOR})")
+    over = []
+    for module in args.modules:
+        times = [import_seconds(module) for _ in range(args.runs)]
+        median = statistics.median(times)
+        _, children, packages = import_profile(module)
+        heaviest = sorted(children.items(), key=lambda child: -child[1])[:3]
+        detail = ", ".join(f"{name} {seconds * 1e3:.1f}ms" for name, seconds in heaviest)
+        print(f"{module:<10} {median * 1e3:7.1f}ms {min(times) * 1e3:7.1f}ms  {'+'.join(packages) or '없음'} / {detail}")
+        if module in HEADLESS and (median > HEADLESS_BUDGET or packages):
+            over.append(module)
+
+    if over:
+        print(f"\n게임 로직 가져오기 예산({HEADLESS_BUDGET * 1e3:.0f}ms, UI 패키지 없음)을 넘은 모듈: {', '.join(over)}")
+    else:
+        print(f"\n게임 로직 모듈은 모두 예산({HEADLESS_BUDGET * 1e3:.0f}ms) 안, Textual/rich 없이 불러옴")
+
+
+if __name__ == "__main__":
+    main()
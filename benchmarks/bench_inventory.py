@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+인벤토리 벤치마크
+아이템 N개가 든 인벤토리에서 추가/이름으로 찾기/개수 세기/제거 비용을 리스트 방식과 비교
+
+    python -m benchmarks.bench_inventory [--items N]
+"""
+
+import argparse
+import random
+import time
+
+from game_core import World
+from inventory import Inventory
+
+
+def per_op_us(func, ops) -> float:
+    start = time.perf_counter()
+    for op in ops:
+        func(op)
+    return (time.perf_counter() - start) / len(ops) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인벤토리 벤치마크")
+    parser.add_argument("--items", type=int, default=10_000, help="인벤토리 아이템 수")
+    parser.add_argument("--ops", type=int, default=2_000, help="측정할 연산 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    templates = list(World.default().items.values())
+    contents = [rng.choice(templates) for _ in range(args.items)]
+    queries = [rng.choice(templates) for _ in range(args.ops)]
+
+    listed = list(contents)
+    stacked = Inventory()
+    for item in contents:
+        stacked.add(item)
+
+    def list_find(item):
+        return next((other for other in listed if other.name == item.name), None)
+
+    def list_remove_add(item):
+        listed.remove(item)
+        listed.append(item)
+
+    def stacked_remove_add(item):
+        stacked.remove(item)
+        stacked.add(item)
+
+    rows = [
+        ("이름으로 찾기", lambda item: list_find(item), lambda item: stacked.find(item.name)),
+        ("개수 세기", lambda item: listed.count(item), lambda item: stacked.count(item)),
+        ("제거 + 추가", list_remove_add, stacked_remove_add),
+    ]
+    print(f"인벤토리 아이템 {args.items:,}개 (종류 {len(stacked.stacks())}개)")
+    for title, list_op, stacked_op in rows:
+        list_us = per_op_us(list_op, queries)
+        stacked_us = per_op_us(stacked_op, queries)
+        print(f"{title:<10} 리스트 {list_us:9.3f}µs, Inventory {stacked_us:7.3f}µs ({list_us / stacked_us:,.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+메모리 보고서
+절차적 월드(기본 1백만 개 방)에서 방/아이템/몬스터당 바이트를 측정하고,
+슬롯 + 출구 표 구조를 예전의 객체마다 __dict__ 와 출구 dict를 두는 구조와 비교
+
+    python -m benchmarks.bench_memory [--rooms N]
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from game_core import Direction, Item, ItemType, MonsterTemplate
+from worldgen import generate_world
+
+
+@dataclass
+class DictRoom:
+    """비교용 예전 방 구조 (인스턴스마다 __dict__, 출구는 방향 → 방 id dict)"""
+    name: str
+    description: str
+    exits: Dict[Direction, str]
+    items: Tuple[Item, ...]
+    monsters: Tuple[MonsterTemplate, ...]
+    npcs: Tuple[str, ...]
+    is_safe: bool = False
+
+
+@dataclass(frozen=True, eq=False)
+class DictItem:
+    name: str
+    item_type: ItemType
+    attack: int = 0
+    defense: int = 0
+    heal: int = 0
+    value: int = 0
+    description: str = ""
+
+
+def traced(build) -> Tuple[object, int]:
+    """build()가 만든 객체와 그동안 늘어난 메모리 (바이트)"""
+    gc.collect()
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="메모리 보고서")
+    parser.add_argument("--rooms", type=int, default=1_000_000)
+    parser.add_argument("--monsters", type=int, default=1_000_000, help="측정할 몬스터 개체 수")
+    args = parser.parse_args()
+
+    world, world_bytes = traced(lambda: generate_world(args.rooms, seed=1))
+    rooms = list(world.rooms.values())
+    legacy, legacy_bytes = traced(lambda: [
+        DictRoom(room.name, room.description, dict(room.exits), room.items, room.monsters, room.npcs, room.is_safe)
+        for room in rooms
+    ])
+    slotted_room = sys.getsizeof(rooms[0]) + sys.getsizeof(rooms[0].exits)
+    dict_room = sys.getsizeof(legacy[0]) + sys.getsizeof(legacy[0].__dict__) + sys.getsizeof(legacy[0].exits)
+    del legacy
+
+    print(f"방 {args.rooms:,}개")
+    print(f"  월드 전체        {world_bytes / args.rooms:8,.0f} B/방 (id·이름 문자열, rooms dict 항목 포함)")
+    print(f"  방 객체 + 출구    {slotted_room:8,} B   (예전 구조 {dict_room:,} B)")
+    print(f"  출구 표          {world.exit_table.targets.itemsize * 4:8,} B/방 (정수 방 번호 4칸)")
+    print(f"  예전 구조로 복사  {legacy_bytes / args.rooms:8,.0f} B/방 (방 객체와 출구 dict만)")
+
+    template = world.items["health_potion"]
+    dict_item = DictItem(template.name, template.item_type, description=template.description)
+    print(f"아이템 템플릿 {len(world.items)}종 (방과 인벤토리는 참조만 보유, 참조당 8 B)")
+    print(f"  Item             {sys.getsizeof(template):8,} B   "
+          f"(예전 구조 {sys.getsizeof(dict_item) + sys.getsizeof(dict_item.__dict__):,} B)")
+
+    templates = list(world.monsters.values())
+    monsters, monster_bytes = traced(lambda: [templates[i % len(templates)].spawn() for i in range(args.monsters)])
+    print(f"몬스터 개체 {args.monsters:,}개")
+    print(f"  Monster          {(monster_bytes - sys.getsizeof(monsters)) / args.monsters:8,.0f} B/개 (템플릿 참조 + 체력)")
+    print(f"  MonsterTemplate  {sys.getsizeof(templates[0]):8,} B   (종류당 하나, {len(templates)}종)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+몬스터 개체 메모리 벤치마크
+살아있는 스폰 N개를 만들 때 템플릿 + 슬롯 개체 방식과
+모든 능력치를 개체마다 복사하던 기존 dataclass 방식의 메모리 사용량 비교
+
+    python -m benchmarks.bench_monster_memory [--spawns N]
+"""
+
+import argparse
+import tracemalloc
+from dataclasses import dataclass
+
+from game_core import GameState
+
+
+@dataclass
+class LegacyMonster:
+    """분리 이전의 몬스터 (개체마다 모든 능력치 보유)"""
+    name: str
+    hp: int
+    max_hp: int
+    attack: int
+    defense: int
+    exp_reward: int
+    gold_reward: int
+    description: str = ""
+
+
+def measure(factory, count: int) -> int:
+    """count개 생성 시 증가한 메모리(바이트)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    spawns = [factory(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del spawns
+    return after - before
+
+
+def main():
+    parser = argparse.ArgumentParser(description="몬스터 개체 메모리 벤치마크")
+    parser.add_argument("--spawns", type=int, default=100_000, help="생성할 스폰 수")
+    args = parser.parse_args()
+
+    templates = list(GameState().monsters_database.values())
+
+    def spawn(i):
+        return templates[i % len(templates)].spawn()
+
+    def legacy(i):
+        t = templates[i % len(templates)]
+        # 기존 방식은 데이터베이스 값을 복사해 체력을 따로 보유해야 했다
+        return LegacyMonster(t.name, t.max_hp, t.max_hp, t.attack, t.defense,
+                             t.exp_reward, t.gold_reward, t.description)
+
+    slotted = measure(spawn, args.spawns)
+    full = measure(legacy, args.spawns)
+    print(f"스폰 {args.spawns:,}개")
+    print(f"템플릿 + 슬롯 개체: {slotted / 1024 / 1024:8.2f} MiB (개체당 {slotted / args.spawns:6.1f} B)")
+    print(f"개체별 dataclass:   {full / 1024 / 1024:8.2f} MiB (개체당 {full / args.spawns:6.1f} B)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+몬테카를로 플레이 시뮬레이터 확장성 벤치마크
+같은 플레이 수를 워커 1, 2, 4, ... cpu_count개로 나눠 실행해 플레이/초, 속도 향상, 코어당 효율을 측정하고
+워커 수와 관계없이 통계가 같은지 확인
+
+    python -m benchmarks.bench_montecarlo [--runs N] [--workers 1,2,4]
+"""
+
+import argparse
+import os
+import time
+
+from montecarlo import SHARD_SIZE, simulate
+
+
+def main():
+    cores = os.cpu_count() or 1
+    default_workers = sorted({1, *(1 << power for power in range(cores.bit_length()) if 1 << power <= cores), cores})
+    parser = argparse.ArgumentParser(description="몬테카를로 플레이 시뮬레이터 확장성 벤치마크")
+    parser.add_argument("--runs", type=int, default=4000, help="워커 수마다 실행할 플레이 수")
+    parser.add_argument("--workers", default=",".join(map(str, default_workers)), help="쉼표로 구분한 워커 수")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="샤드 하나의 플레이 수")
+    args = parser.parse_args()
+
+    print(f"CPU {cores}개, 플레이 {args.runs:,}회, 샤드 {args.shard_size}회")
+    print(f"{'워커':>4} {'시간':>8} {'플레이/초':>10} {'향상':>6} {'효율':>6}")
+    base_rate = None
+    expected = None
+    for workers in (int(value) for value in args.workers.split(",")):
+        start = time.perf_counter()
+        stats = simulate(args.runs, seed=0, workers=workers, shard_size=args.shard_size)
+        elapsed = time.perf_counter() - start
+        rate = stats.runs / elapsed
+        base_rate = base_rate or rate
+        same = "" if expected is None or stats.to_dict() == expected else "  ← 통계 불일치"
+        expected = expected or stats.to_dict()
+        print(f"{workers:>4} {elapsed:7.2f}s {rate:10,.0f} {rate / base_rate:5.2f}배 {rate / base_rate / workers:6.0%}{same}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+방 점유 색인 벤치마크
+세션 N개가 큰 월드에 흩어져 있을 때 방송 한 번의 비용을 방 색인 vs 전체 세션 순회로 비교
+
+    python -m benchmarks.bench_occupancy [--sessions N] [--rooms N]
+"""
+
+import argparse
+import random
+import time
+
+from engine import Engine, Event
+from game_core import GameState
+from worldgen import generate_world
+
+
+def naive_broadcast(engine: Engine, room_id: str, event: Event) -> int:
+    """색인 없이 모든 세션의 위치를 확인하는 방송"""
+    delivered = 0
+    for session in engine.sessions.values():
+        if session.game.current_room_id == room_id:
+            session.outbox.append(event)
+            delivered += 1
+    return delivered
+
+
+def measure(broadcast, rooms, repeat: int) -> float:
+    event = Event("bench", "알림")
+    start = time.perf_counter()
+    for room_id in rooms[:repeat]:
+        broadcast(room_id, event)
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="방 점유 색인 벤치마크")
+    parser.add_argument("--sessions", type=int, default=10_000, help="접속 세션 수")
+    parser.add_argument("--rooms", type=int, default=10_000, help="월드의 방 수")
+    parser.add_argument("--repeat", type=int, default=1_000, help="방송 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    world = generate_world(args.rooms, args.seed)
+    rng = random.Random(args.seed)
+    room_ids = list(world.rooms)
+    engine = Engine()
+    for _ in range(args.sessions):
+        game = GameState(world)
+        game.current_room_id = rng.choice(room_ids)
+        engine.create_session(game=game)
+
+    # 사람이 있는 방만 대상으로 방송 (빈 방은 색인 쪽이 더 유리하므로 제외)
+    occupied = [rng.choice(room_ids) for _ in range(args.repeat)]
+    occupied = [room_id for room_id in occupied if engine.occupancy.count(room_id)] or room_ids[:1]
+    indexed = measure(engine.broadcast, occupied, len(occupied))
+    naive = measure(lambda room_id, event: naive_broadcast(engine, room_id, event), occupied, len(occupied))
+    crowd = sum(engine.occupancy.count(room_id) for room_id in occupied) / len(occupied)
+
+    print(f"세션 {args.sessions:,}개, 방 {args.rooms:,}개 (방송 대상 방 평균 {crowd:.1f}명)")
+    print(f"방 색인:        {indexed * 1e6:10.2f}µs/방송")
+    print(f"전체 세션 순회: {naive * 1e6:10.2f}µs/방송 ({naive / indexed:,.0f}배)")
+
+
+if __name__ == "__main__":
+    main()
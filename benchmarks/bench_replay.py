@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+세션 기록 재실행 벤치마크
+기록 모드 엔진으로 무작위 명령어 세션 N개를 기록한 뒤, 기록 파일에서 다시 읽어 재실행/해시 검증하는 속도 측정
+
+    python -m benchmarks.bench_replay [--sessions N] [--commands N]
+"""
+
+import argparse
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from engine import Engine
+from replay import from_session, load_recordings, save_recordings, verify
+
+
+COMMAND_POOL = ["북", "남", "동", "서", "공격", "공격", "공격", "도망", "줍기", "사용 체력 물약", "주변", "인벤토리"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 기록 재실행 벤치마크")
+    parser.add_argument("--sessions", type=int, default=2_000, help="기록할 세션 수")
+    parser.add_argument("--commands", type=int, default=200, help="세션당 명령어 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    engine = Engine(record=True)
+    start = time.perf_counter()
+    recordings = []
+    for i in range(args.sessions):
+        session = engine.create_session(seed=args.seed + i)
+        for _ in range(args.commands):
+            engine.step(session, rng.choice(COMMAND_POOL))
+        recordings.append(from_session(session))
+        engine.close_session(session)
+    record_elapsed = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "sessions.jsonl"
+        save_recordings(path, recordings)
+        size = path.stat().st_size
+        start = time.perf_counter()
+        failed = sum(not verify(recording) for recording in load_recordings(path))
+        replay_elapsed = time.perf_counter() - start
+
+    total = args.sessions * args.commands
+    print(f"세션 {args.sessions:,}개 × 명령어 {args.commands}개, 기록 파일 {size / 1024 / 1024:.2f} MiB")
+    print(f"기록 (엔진 실행): {record_elapsed:.2f}초 ({total / record_elapsed:,.0f} 명령어/초)")
+    print(f"재실행 + 검증:    {replay_elapsed:.2f}초 ({total / replay_elapsed:,.0f} 명령어/초, "
+          f"{args.sessions / replay_elapsed:,.0f} 세션/초), 불일치 {failed}개")
+
+
+if __name__ == "__main__":
+    main()
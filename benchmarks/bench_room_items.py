@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+방 아이템 벤치마크
+드롭이 N개 쌓인 방(dragon_lair의 금화처럼)에서 한 개씩 줍기/모두 줍기 비용을 리스트 방식과 비교
+
+    python -m benchmarks.bench_room_items [--drops N]
+"""
+
+import argparse
+import random
+import time
+
+from game_core import World
+from inventory import Inventory
+
+
+def main():
+    parser = argparse.ArgumentParser(description="방 아이템 벤치마크")
+    parser.add_argument("--drops", type=int, default=10_000, help="방에 쌓인 아이템 수")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    templates = list(World.default().items.values())
+    drops = [rng.choice(templates) for _ in range(args.drops)]
+
+    # 한 개씩 줍기: 이름으로 찾아서 방에서 빼고 인벤토리에 넣기
+    listed, carried = list(drops), []
+    start = time.perf_counter()
+    while listed:
+        name = listed[-1].name
+        item = next(other for other in listed if other.name == name)
+        listed.remove(item)
+        carried.append(item)
+    list_one = time.perf_counter() - start
+
+    stacked, inventory = Inventory.of(drops), Inventory()
+    start = time.perf_counter()
+    while stacked:
+        item = stacked.find(stacked.first().name)
+        stacked.remove(item)
+        inventory.add(item)
+    stacked_one = time.perf_counter() - start
+
+    # 모두 줍기
+    listed, carried = list(drops), []
+    start = time.perf_counter()
+    carried.extend(listed)
+    listed.clear()
+    list_all = time.perf_counter() - start
+
+    stacked, inventory = Inventory.of(drops), Inventory()
+    start = time.perf_counter()
+    inventory.add_stacks(stacked.take_all())
+    stacked_all = time.perf_counter() - start
+
+    print(f"방 아이템 {args.drops:,}개 (종류 {len(Inventory.of(drops).stacks())}개)")
+    print(f"한 개씩 줍기  리스트 {list_one * 1e3:9.2f}ms, Inventory {stacked_one * 1e3:7.2f}ms")
+    print(f"모두 줍기     리스트 {list_all * 1e6:9.1f}µs, Inventory {stacked_all * 1e6:7.1f}µs "
+          f"(인벤토리 갱신 1회, 종류 수에 비례)")
+
+
+if __name__ == "__main__":
+    main()
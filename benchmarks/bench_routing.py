@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+경로 색인 벤치마크
+큰 절차적 월드에서 목적지 테이블 생성 비용, 걸음당 다음 칸 조회 비용을
+걸음마다 BFS를 새로 하는 방식과 비교
+
+    python -m benchmarks.bench_routing [--rooms N] [--trips N]
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+
+from routing import RouteIndex
+from worldgen import generate_world
+
+
+def fresh_bfs_next_hop(world, source, destination):
+    """색인 없이 매 걸음 BFS로 다음 방향 계산"""
+    first = {source: None}
+    queue = deque([source])
+    while queue:
+        room_id = queue.popleft()
+        if room_id == destination:
+            return first[room_id]
+        for direction, target in world[room_id].exits.items():
+            if target not in first:
+                first[target] = first[room_id] or direction
+                queue.append(target)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경로 색인 벤치마크")
+    parser.add_argument("--rooms", type=int, default=100_000)
+    parser.add_argument("--trips", type=int, default=20, help="측정할 이동 수")
+    args = parser.parse_args()
+
+    world = generate_world(args.rooms, seed=1)
+    routes = RouteIndex(world)
+    rng = random.Random(0)
+    ids = list(world.rooms)
+    trips = [(rng.choice(ids), rng.choice(ids)) for _ in range(args.trips)]
+
+    start = time.perf_counter()
+    for _, destination in trips:
+        routes.table(destination)
+    build_elapsed = time.perf_counter() - start
+
+    steps = 0
+    start = time.perf_counter()
+    for source, destination in trips:
+        room_id = source
+        while room_id != destination:
+            room_id = world[room_id].exits[routes.next_hop(room_id, destination)]
+            steps += 1
+    walk_elapsed = time.perf_counter() - start
+
+    sample = trips[:2]
+    bfs_steps = 0
+    start = time.perf_counter()
+    for source, destination in sample:
+        room_id = source
+        for _ in range(20):  # 걸음마다 BFS는 느리므로 처음 20걸음만
+            if room_id == destination:
+                break
+            room_id = world[room_id].exits[fresh_bfs_next_hop(world, room_id, destination)]
+            bfs_steps += 1
+    bfs_elapsed = time.perf_counter() - start
+
+    print(f"방 {args.rooms:,}개, 이동 {len(trips)}회, 평균 {steps / len(trips):,.0f}걸음")
+    print(f"목적지 테이블 생성: 개당 {build_elapsed / len(trips) * 1000:.1f}ms")
+    print(f"색인 조회:         걸음당 {walk_elapsed / steps * 1e6:.2f}µs")
+    print(f"매번 BFS:          걸음당 {bfs_elapsed / bfs_steps * 1000:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
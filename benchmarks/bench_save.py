@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+저장/불러오기 벤치마크
+큰 인벤토리와 여러 방의 아이템이 바뀐 GameState의 스냅샷 저장/복원 시간과 파일 크기,
+저널 기록/재실행 비용 측정 (marshal 스냅샷 vs JSON, pickle)
+
+    python -m benchmarks.bench_save [--rooms N] [--inventory N] [--dirty-rooms N]
+"""
+
+import argparse
+import json
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from game_core import GameState
+from inventory import Inventory
+from save import SaveFile, dump_snapshot, load_snapshot, restore_state, snapshot_state
+from worldgen import generate_world
+
+
+def timed(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="저장/불러오기 벤치마크")
+    parser.add_argument("--rooms", type=int, default=100_000, help="월드의 방 수")
+    parser.add_argument("--inventory", type=int, default=10_000, help="인벤토리 아이템 수")
+    parser.add_argument("--dirty-rooms", type=int, default=10_000, help="아이템이 바뀐 방 수")
+    parser.add_argument("--journal", type=int, default=10_000, help="저널 명령어 수")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    world = generate_world(args.rooms, seed=0)
+    rng = random.Random(0)
+    items = list(world.items.values())
+    room_ids = list(world.rooms)
+    game = GameState(world)
+    for _ in range(args.inventory):
+        game.inventory.add(rng.choice(items))
+    for room_id in rng.sample(room_ids, min(args.dirty_rooms, len(room_ids))):
+        game.room_items[room_id] = Inventory.of(rng.choice(items) for _ in range(rng.randint(0, 3)))
+
+    print(f"방 {args.rooms:,}개, 인벤토리 {args.inventory:,}개, 바뀐 방 {args.dirty_rooms:,}개")
+    raw = dump_snapshot(game)
+    save_time = timed(lambda: dump_snapshot(game), args.repeat)
+    load_time = timed(lambda: load_snapshot(raw, world), args.repeat)
+    print(f"marshal 스냅샷: 저장 {save_time * 1e3:7.2f}ms, 복원 {load_time * 1e3:7.2f}ms, {len(raw) / 1024:8.1f} KiB")
+
+    data = snapshot_state(game)
+    encoded = json.dumps(data, ensure_ascii=False).encode("utf-8")
+    save_time = timed(lambda: json.dumps(snapshot_state(game), ensure_ascii=False).encode("utf-8"), args.repeat)
+    load_time = timed(lambda: restore_state(json.loads(encoded), world), args.repeat)
+    print(f"JSON 스냅샷:    저장 {save_time * 1e3:7.2f}ms, 복원 {load_time * 1e3:7.2f}ms, {len(encoded) / 1024:8.1f} KiB")
+
+    # 키로 바꾸지 않고 객체를 그대로 pickle (월드는 제외)
+    objects = (game.inventory, game.room_items)
+    pickled = pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL)
+    save_time = timed(lambda: pickle.dumps(objects, protocol=pickle.HIGHEST_PROTOCOL), args.repeat)
+    load_time = timed(lambda: pickle.loads(pickled), args.repeat)
+    print(f"객체 pickle:    저장 {save_time * 1e3:7.2f}ms, 복원 {load_time * 1e3:7.2f}ms, {len(pickled) / 1024:8.1f} KiB")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        save = SaveFile(Path(tmp) / "slot", checkpoint_every=args.journal + 1)
+        small = save.load(world)
+        commands = ["주변", "인벤토리", "북", "남"]
+        start = time.perf_counter()
+        for i in range(args.journal):
+            save.record(small, commands[i % len(commands)])
+        record_time = (time.perf_counter() - start) / args.journal
+        save.close()
+        start = time.perf_counter()
+        SaveFile(Path(tmp) / "slot").load(world)
+        replay_time = time.perf_counter() - start
+    print(f"저널 기록: {record_time * 1e6:.2f}µs/명령어, 명령어 {args.journal:,}개 재실행: {replay_time * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+월드 틱 스케줄러 벤치마크
+타이머 N개(기본 1백만 개, 1시간 = 36,000틱 안에 고르게 분포)를 등록하고 모두 만기될 때까지 진행,
+틱당 비용이 전체 타이머 수가 아닌 만기 수에 비례하는지 힙(heapq)과 비교
+
+    python -m benchmarks.bench_scheduler [--timers N] [--span TICKS]
+"""
+
+import argparse
+import heapq
+import random
+import time
+
+from scheduler import TimerWheel
+
+
+def noop():
+    pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월드 틱 스케줄러 벤치마크")
+    parser.add_argument("--timers", type=int, default=1_000_000)
+    parser.add_argument("--span", type=int, default=36_000, help="만기 분포 구간 (틱)")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    delays = [rng.randint(1, args.span) for _ in range(args.timers)]
+
+    wheel = TimerWheel()
+    start = time.perf_counter()
+    for delay in delays:
+        wheel.schedule(delay, noop)
+    wheel_schedule = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fired = wheel.advance(args.span)
+    wheel_run = time.perf_counter() - start
+
+    heap = []
+    start = time.perf_counter()
+    for i, delay in enumerate(delays):
+        heapq.heappush(heap, (delay, i, noop))
+    heap_schedule = time.perf_counter() - start
+    start = time.perf_counter()
+    for now in range(1, args.span + 1):
+        while heap and heap[0][0] <= now:
+            heapq.heappop(heap)[2]()
+    heap_run = time.perf_counter() - start
+
+    # 만기가 드문 틱: 먼 미래 타이머 N개만 있을 때 빈 틱 비용
+    sparse = TimerWheel()
+    for delay in delays:
+        sparse.schedule(delay + 10_000_000, noop)
+    start = time.perf_counter()
+    sparse.advance(args.span)
+    idle_tick = (time.perf_counter() - start) / args.span
+
+    print(f"타이머 {args.timers:,}개, {args.span:,}틱 동안 만기 ({fired:,}개 실행)")
+    print(f"등록          휠 {wheel_schedule / args.timers * 1e6:6.2f}µs/개, 힙 {heap_schedule / args.timers * 1e6:6.2f}µs/개")
+    print(f"만기 처리      휠 {wheel_run / args.timers * 1e6:6.2f}µs/개, 힙 {heap_run / args.timers * 1e6:6.2f}µs/개")
+    print(f"빈 틱 (대기 {args.timers:,}개) {idle_tick * 1e6:6.2f}µs/틱")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+멀티플레이어 서버 벤치마크
+localhost에 서버를 띄우고 동시 접속 클라이언트들이 명령어를 보내
+초당 명령어 수와 응답 지연(p50/p99)을 측정
+
+    python -m benchmarks.bench_server [--clients N] [--commands M]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import List
+
+from server import PROMPT, MUDServer
+
+
+SCRIPT = ["주변", "인벤토리", "줍기", "북", "공격", "도망", "남", "동", "공격", "도망", "서", "도움말"]
+
+
+async def run_client(port: int, commands: int, latencies: List[float]):
+    """명령어를 하나씩 보내고 프롬프트가 돌아올 때까지의 시간을 기록"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    await reader.readuntil(PROMPT)
+    for i in range(commands):
+        command = SCRIPT[i % len(SCRIPT)]
+        start = time.perf_counter()
+        writer.write(command.encode("utf-8") + b"\r\n")
+        await reader.readuntil(PROMPT)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+    await writer.wait_closed()
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(len(sorted_values) * fraction))
+    return sorted_values[index]
+
+
+async def run(clients: int, commands: int):
+    server = MUDServer(port=0)
+    await server.start()
+    latencies: List[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(*(run_client(server.port, commands, latencies) for _ in range(clients)))
+    elapsed = time.perf_counter() - start
+    await server.stop()
+
+    latencies.sort()
+    total = len(latencies)
+    print(f"클라이언트 {clients:,}명 × 명령어 {commands}개 = {total:,}개, {elapsed:.2f}초")
+    print(f"처리량: {total / elapsed:,.0f} 명령어/초")
+    print(f"지연: p50 {percentile(latencies, 0.5) * 1000:.2f}ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f}ms, 최대 {latencies[-1] * 1000:.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="멀티플레이어 서버 벤치마크")
+    parser.add_argument("--clients", type=int, default=1_000, help="동시 접속 클라이언트 수")
+    parser.add_argument("--commands", type=int, default=50, help="클라이언트당 명령어 수")
+    args = parser.parse_args()
+    asyncio.run(run(args.clients, args.commands))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+세션 생성 비용 벤치마크
+GameState N개를 만들 때의 세션당 메모리와 생성 시간 측정
+
+    python -m benchmarks.bench_session_memory [--sessions N]
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from game_core import GameState
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 생성 비용 벤치마크")
+    parser.add_argument("--sessions", type=int, default=10_000, help="생성할 세션 수")
+    args = parser.parse_args()
+
+    GameState()  # 공유 데이터가 있다면 미리 만들어 두고 세션 비용만 측정
+
+    start = time.perf_counter()
+    sessions = [GameState() for _ in range(args.sessions)]
+    elapsed = time.perf_counter() - start
+    del sessions
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    sessions = [GameState() for _ in range(args.sessions)]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    print(f"세션 {args.sessions:,}개")
+    print(f"생성 시간: {elapsed:.3f}초 (세션당 {elapsed / args.sessions * 1e6:.1f}µs)")
+    print(f"메모리: {used / 1024 / 1024:.2f} MiB (세션당 {used / args.sessions:,.0f} B)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+TUI 입력 → 화면 반영 지연 벤치마크
+헤드리스 Textual pilot으로 실제 사용자처럼 #command-input에 명령어를 타이핑하고 전투 버튼을 클릭해
+입력(Enter/클릭)부터 그 결과가 담긴 첫 프레임이 그려질 때까지의 지연 백분위와 전체 프레임 수를 측정 (textual 필요)
+프레임 시각은 Textual 공개 훅 App.post_display_hook으로 기록 (화면 갱신 한 번마다 호출,
+헤드리스 드라이버는 터미널에 쓰지 않으므로 실제 터미널 출력 비용은 포함하지 않음)
+
+    python -m benchmarks.bench_tui_pilot [--rounds N] [--size 120x40]
+"""
+
+import argparse
+import asyncio
+import bisect
+import time
+from typing import Dict, List, Tuple
+
+from metrics import LatencyHistogram, format_us
+from mud_game import MUDGame
+
+
+# 한 라운드: 둘러보고 북쪽 숲에서 버튼으로 싸운 뒤 돌아와 아이템 줍기
+# ("type", 명령어)는 입력창에 타이핑 후 Enter, ("click", 버튼 id)는 마우스 클릭
+SCRIPT: List[Tuple[str, str]] = [
+    ("type", "주변"), ("type", "인벤토리"), ("type", "북"),
+    ("click", "attack-button"), ("click", "attack-button"), ("click", "attack-button"),
+    ("click", "flee-button"),
+    ("type", "남"), ("type", "동"), ("type", "서"), ("type", "줍기"), ("type", "도움말"),
+]
+FRAME_TIMEOUT = 1.0  # 입력 후 이 시간 안에 프레임이 없으면 화면이 바뀌지 않은 것으로 봄
+
+
+class PilotGame(MUDGame):
+    """화면을 갱신할 때마다 시각을 기록하는 앱"""
+
+    def __init__(self):
+        super().__init__()
+        self.frames: List[float] = []
+
+    def post_display_hook(self) -> None:
+        self.frames.append(time.perf_counter())
+
+    async def wait_frame(self, pilot, since: float) -> float:
+        """since 이후 첫 프레임까지 기다려 지연(초) 반환 (없으면 FRAME_TIMEOUT)"""
+        deadline = since + FRAME_TIMEOUT
+        while time.perf_counter() < deadline:
+            index = bisect.bisect_right(self.frames, since)
+            if index < len(self.frames):
+                return self.frames[index] - since
+            await pilot.pause()
+        return FRAME_TIMEOUT
+
+
+def prepare_fight(app: PilotGame):
+    """전투 버튼을 누를 수 있도록 현재 방에서 전투 시작 (이미 처치해 리스폰 대기 중이어도)"""
+    game = app.game_state
+    if not game.in_combat:
+        game.start_combat(game.world.monsters["goblin"].spawn())
+        app.update_ui()
+
+
+async def run(rounds: int, size: Tuple[int, int]) -> Tuple[Dict[str, LatencyHistogram], int, int, float]:
+    app = PilotGame()
+    histograms = {"type": LatencyHistogram(), "click": LatencyHistogram()}
+    async with app.run_test(size=size) as pilot:
+        game = app.game_state
+        game.player_hp = game.player_max_hp = 10 ** 9  # 전투가 길어져도 쓰러지지 않도록
+        command_input = app.query_one("#command-input")
+        start_frames, start = len(app.frames), time.perf_counter()
+        actions = 0
+        for _ in range(rounds):
+            for kind, target in SCRIPT:
+                if kind == "type":
+                    if not command_input.has_focus:  # 처음에는 게임 로그, 버튼을 누른 뒤에는 버튼에 포커스
+                        await pilot.click("#command-input")
+                    await pilot.press(*target)
+                else:
+                    prepare_fight(app)
+                await pilot.pause()
+                since = time.perf_counter()
+                if kind == "type":
+                    await pilot.press("enter")
+                else:
+                    await pilot.click(f"#{target}")
+                histograms[kind].record(await app.wait_frame(pilot, since))
+                actions += 1
+        elapsed = time.perf_counter() - start
+        frames = len(app.frames) - start_frames
+    return histograms, actions, frames, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TUI 입력 → 화면 반영 지연 벤치마크")
+    parser.add_argument("--rounds", type=int, default=10, help=f"스크립트 반복 횟수 (한 번에 입력 {len(SCRIPT)}개)")
+    parser.add_argument("--size", default="120x40", help="헤드리스 터미널 크기 (가로x세로)")
+    args = parser.parse_args()
+    size = tuple(int(value) for value in args.size.lower().split("x"))
+
+    histograms, actions, frames, elapsed = asyncio.run(run(args.rounds, size))
+    print(f"입력 {actions:,}회, {elapsed:.1f}초, 프레임 {frames:,}개 (입력당 {frames / actions:.1f}개)")
+    print(f"{'입력':<6} {'횟수':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'최대':>9}")
+    for kind, title in (("type", "타이핑"), ("click", "버튼")):
+        histogram = histograms[kind]
+        print(f"{title:<6} {histogram.count:>6} {format_us(histogram.percentile(0.5))} {format_us(histogram.percentile(0.95))} "
+              f"{format_us(histogram.percentile(0.99))} {format_us(histogram.worst)}")
+
+
+if __name__ == "__main__":
+    main()
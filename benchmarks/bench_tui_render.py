@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+TUI 갱신 비용 벤치마크
+헤드리스 Textual 앱에서 명령어 한 번당 UI 갱신 비용을 측정
+변경된 라벨만 갱신하는 현재 update_ui vs 매번 query_one으로 모든 라벨을 다시 쓰는 방식 (textual 필요)
+
+    python -m benchmarks.bench_tui_render [--commands N]
+"""
+
+import argparse
+import asyncio
+import time
+
+from commands import COMMANDS
+from mud_game import CharacterPanel, CombatPanel, MUDGame, RoomPanel
+
+
+# 상태가 거의 바뀌지 않는 명령어가 대부분인 일반적인 플레이
+SCRIPT = ["주변", "인벤토리", "북", "공격", "공격", "공격", "공격", "공격", "남", "줍기", "주변", "도움말"]
+
+
+def full_update(app: MUDGame):
+    """모든 라벨을 매번 찾아서 다시 쓰는 이전 방식의 update_ui"""
+    game = app.game_state
+    character = app.query_one(CharacterPanel)
+    character.query_one("#level-label").update(f"레벨: {game.player_level}")
+    character.query_one("#hp-label").update(f"체력: {game.player_hp}/{game.player_max_hp}")
+    character.query_one("#exp-label").update(f"경험치: {game.player_exp}/{game.player_exp_needed}")
+    character.query_one("#attack-label").update(f"공격력: {game.total_attack}")
+    character.query_one("#defense-label").update(f"방어력: {game.total_defense}")
+    character.query_one("#gold-label").update(f"골드: {game.player_gold}")
+
+    room_panel = app.query_one(RoomPanel)
+    room = game.get_current_room()
+    room_panel.query_one("#room-name-label").update(f"장소: {room.name}")
+    room_panel.query_one("#room-description-label").update(f"설명: {room.description}")
+    room_panel.query_one("#room-exits-label").update(f"출구: {', '.join(exit.value for exit in room.exits)}")
+    room_items = game.get_room_items()
+    room_panel.query_one("#room-items-label").update(
+        f"아이템: {room_items.summary() if room_items else '없음'}")
+    room_panel.query_one("#room-monsters-label").update(
+        f"몬스터: {', '.join(monster.name for monster in room.monsters) if room.monsters else '없음'}")
+
+    combat = app.query_one(CombatPanel)
+    if game.in_combat and game.current_monster:
+        monster = game.current_monster
+        combat.query_one("#combat-status-label").update(f"{monster.name} (HP: {monster.hp}/{monster.max_hp})")
+        combat.add_class("visible")
+    else:
+        combat.remove_class("visible")
+
+
+async def measure(update, commands: int, render: bool) -> float:
+    """명령어당 (디스패치 + UI 갱신 [+ 화면 다시 그리기]) 평균 시간"""
+    app = MUDGame()
+    async with app.run_test() as pilot:
+        game = app.game_state
+        game.player_hp = game.player_max_hp = 10 ** 9  # 긴 전투에도 상태가 초기화되지 않도록
+        await pilot.pause()
+        elapsed = 0.0
+        for i in range(commands):
+            start = time.perf_counter()
+            COMMANDS.dispatch(game, SCRIPT[i % len(SCRIPT)])
+            update(app)
+            if render:
+                await pilot.pause()
+            elapsed += time.perf_counter() - start
+    return elapsed / commands
+
+
+def main():
+    parser = argparse.ArgumentParser(description="TUI 갱신 비용 벤치마크")
+    parser.add_argument("--commands", type=int, default=300, help="측정할 명령어 수")
+    args = parser.parse_args()
+
+    for render in (False, True):
+        full = asyncio.run(measure(full_update, args.commands, render))
+        dirty = asyncio.run(measure(MUDGame.update_ui, args.commands, render))
+        title = "갱신 + 화면 그리기" if render else "갱신만"
+        print(f"{title}: 전체 갱신 {full * 1e6:8.1f}µs/명령어, 변경분 갱신 {dirty * 1e6:8.1f}µs/명령어 ({full / dirty:.1f}배)")
+
+
+if __name__ == "__main__":
+    main()
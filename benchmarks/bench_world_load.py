@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+월드 파일 시작 시간 벤치마크
+절차적으로 생성한 큰 월드 JSON을 만들어 파싱+검증과 바이너리 캐시 읽기 시간을 비교
+
+    python -m benchmarks.bench_world_load [--rooms N]
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from world_data import load_world, world_to_data
+from worldgen import generate_world
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월드 파일 시작 시간 벤치마크")
+    parser.add_argument("--rooms", type=int, default=10_000, help="생성할 방 수")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "world.json"
+        path.write_text(json.dumps(world_to_data(generate_world(args.rooms)), ensure_ascii=False), encoding="utf-8")
+        cache_dir = Path(tmp) / "cache"
+
+        _, parse_elapsed = timed(lambda: load_world(path, use_cache=False))
+        _, write_elapsed = timed(lambda: load_world(path, cache_dir=cache_dir))
+        world, cached_elapsed = timed(lambda: load_world(path, cache_dir=cache_dir))
+        cache_size = sum(f.stat().st_size for f in cache_dir.iterdir())
+
+        print(f"방 {len(world):,}개, JSON {path.stat().st_size / 1024:,.0f} KiB, 캐시 {cache_size / 1024:,.0f} KiB")
+        print(f"파싱 + 검증:    {parse_elapsed * 1000:8.1f}ms")
+        print(f"첫 실행(캐시 저장): {write_elapsed * 1000:8.1f}ms")
+        print(f"캐시 읽기:      {cached_elapsed * 1000:8.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
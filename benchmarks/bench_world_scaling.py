@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+월드 크기별 확장성 벤치마크
+절차적 월드(1천 ~ 1백만 개 방)마다 생성 시간, 방당 메모리, 명령어별 지연을 측정
+
+    python -m benchmarks.bench_world_scaling [--sizes 1000 10000 100000 1000000] [--tui]
+"""
+
+import argparse
+import asyncio
+import gc
+import random
+import time
+import tracemalloc
+
+from engine import Engine
+from game_core import GameState, World
+from worldgen import generate_world
+
+
+def per_call_us(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count * 1e6
+
+
+def random_walk(game: GameState, rng: random.Random):
+    """무작위 출구로 이동하고 방 이벤트 확인 (전투는 바로 끝내 계속 이동)"""
+    room = game.get_current_room()
+    game.move(rng.choice(list(room.exits)))
+    game.check_room_events()
+    game.in_combat = False
+    game.current_monster = None
+
+
+def measure_update_room(world: World, count: int) -> float:
+    """헤드리스 Textual 앱에서 RoomPanel.update_room 호출 비용"""
+    from mud_game import MUDGame, RoomPanel
+
+    async def run() -> float:
+        app = MUDGame(world)
+        async with app.run_test():
+            panel = app.query_one(RoomPanel)
+            rng = random.Random(0)
+
+            def step():
+                random_walk(app.game_state, rng)
+                panel.update_room()
+            return per_call_us(step, count)
+    return asyncio.run(run())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="월드 크기별 확장성 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--commands", type=int, default=20_000, help="크기별 명령어 측정 횟수")
+    parser.add_argument("--tui", action="store_true", help="RoomPanel.update_room도 측정 (textual 필요)")
+    args = parser.parse_args()
+
+    header = f"{'방 수':>10} {'생성(s)':>9} {'방당 B':>8} {'방 조회':>9} {'이동+이벤트':>11} {'주변(µs)':>9}"
+    if args.tui:
+        header += f" {'update_room':>12}"
+    print(header)
+
+    for size in args.sizes:
+        gc.collect()
+        start = time.perf_counter()
+        world = generate_world(size, seed=size)
+        build_elapsed = time.perf_counter() - start
+        del world
+        gc.collect()
+
+        tracemalloc.start()
+        world = generate_world(size, seed=size)
+        room_bytes = tracemalloc.get_traced_memory()[0] / size
+        tracemalloc.stop()
+
+        game = GameState(world)
+        rng = random.Random(0)
+        lookup_us = per_call_us(game.get_current_room, args.commands)
+        walk_us = per_call_us(lambda: random_walk(game, rng), args.commands)
+        engine = Engine()
+        session = engine.create_session(game=game)
+        look_us = per_call_us(lambda: engine.step(session, "주변"), args.commands)
+
+        row = f"{size:>10,} {build_elapsed:>9.2f} {room_bytes:>8,.0f} {lookup_us:>9.2f} {walk_us:>11.2f} {look_us:>9.2f}"
+        if args.tui:
+            row += f" {measure_update_room(world, min(args.commands, 2_000)):>12.1f}"
+        print(row)
+        del world, game, session
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+벤치마크 모음과 회귀 검사
+GameState 생성, 명령어별 처리 경로, 긴 전투, 상태 저장/복원, update_ui를 측정해 JSON으로 저장하고
+저장된 기준값(benchmarks/baseline.json)보다 threshold 이상 느려진 항목이 있으면 종료 코드 1로 실패
+
+    python -m benchmarks.suite                     # 기준값과 비교
+    python -m benchmarks.suite --save-baseline     # 이 기기에서 기준값 다시 저장
+    python -m benchmarks.suite -k command -o results.json --threshold 0.3
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from commands import COMMANDS
+from game_core import GameState, World
+from metrics import CommandMetrics
+from save import dump_snapshot, load_snapshot, restore_state, snapshot_state
+
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+THRESHOLD = 0.3  # 기준값보다 30% 넘게 느려지면 회귀
+MIN_RUN_SECONDS = 0.1  # 반복 한 번에 최소한 걸리도록 맞추는 시간
+REPEAT = 7  # 반복 횟수 (가장 빠른 값 사용)
+RETRIES = 2  # 회귀로 보이는 항목은 다시 재서 더 빠른 값 사용 (일시적인 부하로 인한 오탐 방지)
+
+# 측정 함수: 연산 하나를 받아 연산당 최소 시간(초)을 반환
+Measure = Callable[[Callable[[], object]], float]
+CASES: Dict[str, Callable[[Measure], float]] = {}
+
+
+def case(name: str):
+    """벤치마크 등록 데코레이터 (함수는 measure로 잰 연산당 시간을 반환)"""
+    def decorator(func: Callable[[Measure], float]) -> Callable[[Measure], float]:
+        CASES[name] = func
+        return func
+    return decorator
+
+
+def measure(op: Callable[[], object], repeat: Optional[int] = None) -> float:
+    """반복마다 MIN_RUN_SECONDS 이상 걸리도록 횟수를 맞춘 뒤 연산당 최소 시간 반환 (timeit처럼 GC는 끔)
+
+    repeat가 없으면 호출할 때의 REPEAT 사용
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _measure(op, repeat if repeat is not None else REPEAT)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def _measure(op: Callable[[], object], repeat: int) -> float:
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_RUN_SECONDS:
+            break
+        loops *= 10 if elapsed < MIN_RUN_SECONDS / 10 else 2
+    best = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(loops):
+            op()
+        best = min(best, (time.perf_counter() - start) / loops)
+    return best
+
+
+@case("game_state.new")
+def bench_new_game_state(measure: Measure) -> float:
+    World.default()
+    return measure(GameState)
+
+
+def command_case(name: str, line: str, prepare: Callable[[GameState], None] = lambda game: None,
+                 reset: Callable[[GameState], None] = lambda game: None):
+    """명령어 한 줄 처리 경로 (prepare로 한 번 준비, 매번 reset으로 상태를 되돌림)"""
+    @case(f"command.{name}")
+    def bench_command(measure: Measure) -> float:
+        game = GameState(seed=0)
+        prepare(game)
+
+        def op():
+            reset(game)
+            COMMANDS.dispatch(game, line)
+        return measure(op)
+
+
+def back_to_start(game: GameState):
+    game.current_room_id = game.world.start_room_id
+    game.in_combat = False
+    game.current_monster = None
+
+
+def endless_fight(game: GameState):
+    game.player_hp = game.player_max_hp = 10 ** 9
+    game.start_combat(game.world.monsters["dragon"].spawn())
+
+
+def refill_potion(game: GameState):
+    if not game.inventory:
+        game.inventory.add(game.world.items["health_potion"])
+
+
+command_case("look", "주변")
+command_case("move", "북", reset=back_to_start)
+command_case("goto", "가기 드래곤의 둥지", reset=back_to_start)
+command_case("attack", "공격", prepare=endless_fight, reset=lambda game: setattr(game.current_monster, "hp", 10 ** 9))
+command_case("flee", "도망", reset=lambda game: setattr(game, "in_combat", True))
+command_case("get_drop", "줍기 모두", reset=lambda game: game.drop_item(game.inventory.first()) if game.inventory else None)
+command_case("inventory", "인벤토리", prepare=lambda game: [game.inventory.add(item, 3) for item in game.world.items.values()])
+command_case("use", "사용 체력 물약", reset=refill_potion)
+command_case("help", "도움말")
+command_case("stats", "통계", prepare=lambda game: setattr(game, "metrics", CommandMetrics()))
+command_case("unknown", "춤추기")
+
+
+@case("combat.long_fight")
+def bench_long_fight(measure: Measure) -> float:
+    """방어력이 높은 드래곤을 공격력 1로 끝까지 싸움 (한 번에 약 200턴)"""
+    game = GameState(seed=0)
+    dragon = game.world.monsters["dragon"]
+
+    def op():
+        game.player_attack, game.player_exp = 1, 0  # 레벨업으로 전투가 짧아지지 않도록
+        game.player_hp = game.player_max_hp = 10 ** 9
+        game.start_combat(dragon.spawn())
+        while game.in_combat:
+            game.attack_monster()
+    return measure(op)
+
+
+def played_state() -> GameState:
+    """아이템과 바뀐 방이 있는 저장 대상 상태"""
+    game = GameState(seed=0)
+    for item in game.world.items.values():
+        game.inventory.add(item, 10)
+    for room_id in game.world.rooms:
+        game.current_room_id = room_id
+        game.pick_up_all()
+    return game
+
+
+@case("save.snapshot_restore")
+def bench_snapshot_restore(measure: Measure) -> float:
+    game = played_state()
+    return measure(lambda: restore_state(snapshot_state(game)))
+
+
+@case("save.dump_load")
+def bench_dump_load(measure: Measure) -> float:
+    game = played_state()
+    return measure(lambda: load_snapshot(dump_snapshot(game)))
+
+
+def tui_case(name: str, change: Callable[[GameState], None]):
+    """헤드리스 Textual 앱에서 상태를 바꾼 뒤 update_ui 한 번"""
+    @case(f"ui.{name}")
+    def bench_update_ui(measure: Measure) -> float:
+        from mud_game import MUDGame
+
+        async def run() -> float:
+            app = MUDGame()
+            async with app.run_test():
+                game = app.game_state
+
+                def op():
+                    change(game)
+                    app.update_ui()
+                return measure(op)
+        return asyncio.run(run())
+
+
+tui_case("update_unchanged", lambda game: None)
+tui_case("update_gold", lambda game: setattr(game, "player_gold", game.player_gold + 1))
+
+
+def run_cases(names: List[str]) -> Dict[str, float]:
+    results = {}
+    for name in names:
+        results[name] = CASES[name](measure)
+        print(f"  {name:<26} {results[name] * 1e6:10.2f}µs", flush=True)
+    return results
+
+
+def regressed(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    return [name for name, seconds in results.items() if name in baseline and seconds / baseline[name] - 1 > threshold]
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """기준값 대비 변화 출력, 회귀한 항목 이름 반환"""
+    regressions = regressed(results, baseline, threshold)
+    print(f"{'벤치마크':<26} {'기준(µs)':>10} {'현재(µs)':>10} {'변화':>8}")
+    for name, seconds in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<26} {'-':>10} {seconds * 1e6:10.2f} {'새 항목':>8}")
+            continue
+        mark = "  ← 회귀" if name in regressions else ""
+        print(f"{name:<26} {base * 1e6:10.2f} {seconds * 1e6:10.2f} {seconds / base - 1:+8.0%}{mark}")
+    return regressions
+
+
+def environment() -> Dict[str, str]:
+    return {"python": platform.python_version(), "platform": platform.platform(), "machine": platform.machine()}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크 모음과 회귀 검사")
+    parser.add_argument("-k", "--filter", default="", help="이름에 이 문자열이 들어간 벤치마크만 실행")
+    parser.add_argument("-o", "--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH), help="기준값 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값으로 저장 (비교하지 않음)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="회귀로 볼 느려진 비율 (0.3 = 30%%)")
+    args = parser.parse_args(argv)
+
+    names = [name for name in CASES if args.filter in name]
+    if not names:
+        parser.error(f"'{args.filter}'에 맞는 벤치마크가 없습니다")
+    print(f"벤치마크 {len(names)}개 실행")
+    results = run_cases(names)
+    report = {"environment": environment(), "results": results}
+    baseline_path = Path(args.baseline)
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8")) if baseline_path.exists() else None
+
+    if baseline is not None and not args.save_baseline:
+        for _ in range(RETRIES):
+            suspects = regressed(results, baseline["results"], args.threshold)
+            if not suspects:
+                break
+            print(f"다시 측정: {', '.join(suspects)}")
+            for name, seconds in run_cases(suspects).items():
+                results[name] = min(results[name], seconds)
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        saved = baseline["results"] if baseline is not None else {}
+        report["results"] = {**saved, **results}  # -k로 일부만 실행해도 나머지 기준값은 유지
+        baseline_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"기준값 저장: {baseline_path}")
+        return 0
+    if baseline is None:
+        print(f"기준값 파일이 없습니다: {baseline_path} (--save-baseline으로 먼저 저장하세요)")
+        return 0
+
+    if baseline.get("environment") != report["environment"]:
+        print(f"참고: 기준값은 다른 환경에서 측정되었습니다 ({baseline.get('environment')})")
+    print()
+    regressions = compare(results, baseline["results"], args.threshold)
+    if regressions:
+        print(f"\n회귀 {len(regressions)}건 (기준값보다 {args.threshold:.0%} 넘게 느려짐): {', '.join(regressions)}")
+        return 1
+    print(f"\n회귀 없음 (허용 {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 명령어 테이블
+mud_game.py와 demo.py가 공유하는 별칭 → 핸들러 디스패치
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from game_core import Direction, GameState, Item
+from metrics import STATS_ENV
+
+
+# 핸들러는 (게임 상태, 인자 목록)을 받아 출력할 메시지 줄 목록을 반환한다
+CommandHandler = Callable[[GameState, List[str]], List[str]]
+
+
+@dataclass(frozen=True)
+class Command:
+    name: str
+    aliases: Tuple[str, ...]
+    handler: CommandHandler
+    description: str = ""
+
+
+class CommandTable:
+    """별칭 → 명령어 테이블 (시작 시 한 번 구성, O(1) 조회)"""
+
+    def __init__(self):
+        self._commands: Dict[str, Command] = {}
+        self._aliases: Dict[str, Command] = {}
+
+    def register(self, name: str, aliases: Iterable[str], description: str = ""):
+        """핸들러 등록 데코레이터"""
+        def decorator(handler: CommandHandler) -> CommandHandler:
+            self.add(Command(name, tuple(aliases), handler, description))
+            return handler
+        return decorator
+
+    def add(self, command: Command):
+        """명령어 추가"""
+        if command.name in self._commands:
+            raise ValueError(f"이미 등록된 명령어입니다: {command.name}")
+        for alias in command.aliases:
+            if alias in self._aliases:
+                raise ValueError(f"이미 등록된 별칭입니다: {alias}")
+        self._commands[command.name] = command
+        for alias in command.aliases:
+            self._aliases[alias] = command
+
+    def lookup(self, alias: str) -> Optional[Command]:
+        """별칭으로 명령어 조회"""
+        return self._aliases.get(alias)
+
+    def parse(self, line: str) -> Tuple[Optional[Command], List[str]]:
+        """입력 줄을 명령어와 인자로 분리"""
+        # 인자 없는 별칭이 대부분이므로 분리 전에 그대로 조회
+        command = self._aliases.get(line)
+        if command is not None:
+            return command, []
+        parts = line.split()
+        if not parts:
+            return None, []
+        return self._aliases.get(parts[0].lower()), parts[1:]
+
+    def dispatch(self, game: GameState, line: str) -> Tuple[Optional[Command], List[str]]:
+        """명령어 실행 후 (명령어, 메시지 줄 목록) 반환"""
+        if game.metrics is not None:
+            return self._timed_dispatch(game, line)
+        command, args = self.parse(line)
+        if command is None:
+            return None, [f"알 수 없는 명령어: {line.strip()}"]
+        return command, command.handler(game, args)
+
+    def _timed_dispatch(self, game: GameState, line: str) -> Tuple[Optional[Command], List[str]]:
+        """dispatch와 같지만 파싱/핸들러 시간을 game.metrics에 기록"""
+        start = time.perf_counter()
+        command, args = self.parse(line)
+        parsed = time.perf_counter()
+        if command is None:
+            game.metrics.record("unknown", "dispatch", parsed - start)
+            return None, [f"알 수 없는 명령어: {line.strip()}"]
+        messages = command.handler(game, args)
+        game.metrics.record(command.name, "dispatch", parsed - start)
+        game.metrics.record(command.name, "logic", time.perf_counter() - parsed)
+        return command, messages
+
+    @property
+    def commands(self) -> List[Command]:
+        return list(self._commands.values())
+
+    @property
+    def aliases(self) -> List[str]:
+        return list(self._aliases)
+
+
+HELP_TEXT = """
+=== 환상의 세계 MUD 도움말 ===
+
+이동 명령어:
+  북/남/동/서, n/s/e/w, north/south/east/west
+  가기/goto <장소> - 장소까지 자동 이동 (몬스터를 만나면 멈춤)
+
+전투 명령어:
+  공격/attack/a - 몬스터 공격
+  도망/flee/f - 전투에서 도망
+
+기타 명령어:
+  주변/look/l - 주변 탐색
+  줍기/get/g [이름|번호|n.이름|모두] - 아이템 줍기
+  인벤토리/inventory/i - 인벤토리 확인
+  사용/use/u [이름|번호|n.이름] - 아이템 사용
+  버리기/drop <이름|번호|n.이름> - 아이템 버리기
+  도움말/help/h - 이 도움말 표시
+  통계/stats - 명령어별 지연 통계 (MUD_STATS 설정 시)
+  종료/quit/q - 게임 종료
+
+게임 목표:
+  - 몬스터를 물리쳐 경험치와 골드를 획득하세요
+  - 레벨업하여 더 강해지세요
+  - 드래곤을 물리쳐 전설의 영웅이 되세요!
+"""
+
+COMMANDS = CommandTable()
+
+
+def _register_move(direction: Direction, label: str, aliases: Tuple[str, ...]):
+    """이동 명령어 등록"""
+    def handle_move(game: GameState, args: List[str]) -> List[str]:
+        if game.move(direction):
+            return [f"{label}으로 이동했습니다."] + game.check_room_events()
+        return [f"{label}으로 갈 수 없습니다."]
+
+    COMMANDS.add(Command(direction.name.lower(), aliases, handle_move, f"{label}으로 이동"))
+
+
+_register_move(Direction.NORTH, "북쪽", ("북", "n", "north"))
+_register_move(Direction.SOUTH, "남쪽", ("남", "s", "south"))
+_register_move(Direction.EAST, "동쪽", ("동", "e", "east"))
+_register_move(Direction.WEST, "서쪽", ("서", "w", "west"))
+
+
+@COMMANDS.register("goto", ("가기", "goto"), "장소까지 자동 이동")
+def handle_goto(game: GameState, args: List[str]) -> List[str]:
+    if not args:
+        return ["어디로 갈까요? 예: 가기 어두운 동굴"]
+    if game.in_combat:
+        return ["전투 중에는 이동할 수 없습니다."]
+    query = " ".join(args)
+    destination = game.world.find_room(query)
+    if destination is None:
+        return [f"알 수 없는 장소: {query}"]
+    if destination == game.current_room_id:
+        return ["이미 그곳에 있습니다."]
+
+    routes = game.world.routes
+    taken: List[str] = []
+    lines: List[str] = []
+    while game.current_room_id != destination:
+        direction = routes.next_hop(game.current_room_id, destination)
+        if direction is None:
+            return [f"{game.world[destination].name}(으)로 가는 길이 없습니다."]
+        game.move(direction)
+        taken.append(direction.value)
+        lines = game.check_room_events()
+        if lines:
+            break
+
+    summary = f"이동 경로: {' → '.join(taken)} ({len(taken)}칸)"
+    if lines:
+        return [summary, f"{game.get_current_room().name}에서 멈췄습니다."] + lines
+    return [summary, f"{game.get_current_room().name}에 도착했습니다."]
+
+
+@COMMANDS.register("attack", ("공격", "attack", "a"), "몬스터 공격")
+def handle_attack(game: GameState, args: List[str]) -> List[str]:
+    if not game.in_combat:
+        return ["전투 중이 아닙니다."]
+    return game.attack_monster().split("\n")
+
+
+@COMMANDS.register("flee", ("도망", "flee", "f"), "전투에서 도망")
+def handle_flee(game: GameState, args: List[str]) -> List[str]:
+    if not game.in_combat:
+        return ["전투 중이 아닙니다."]
+    return [game.flee_combat()]
+
+
+@COMMANDS.register("look", ("주변", "look", "l"), "주변 탐색")
+def handle_look(game: GameState, args: List[str]) -> List[str]:
+    room = game.get_current_room()
+    lines = [f"=== {room.name} ===", room.description]
+    items = game.get_room_items()
+    if items:
+        lines.append("아이템: " + items.summary())
+    monsters = game.get_room_monsters()
+    if monsters:
+        lines.append("몬스터: " + ", ".join(monster.name for monster in monsters))
+    return lines
+
+
+def find_inventory_item(game: GameState, query: str) -> Optional[Item]:
+    """인벤토리에서 이름, 칸 번호, 데이터 키(예: health_potion)로 아이템 찾기"""
+    item = game.inventory.find(query)
+    if item is None:
+        item = game.items_database.get(query)
+        if item is not None and item not in game.inventory:
+            return None
+    return item
+
+
+def find_room_item(game: GameState, query: str) -> Optional[Item]:
+    """방 아이템에서 이름, 번호, 데이터 키로 아이템 찾기"""
+    items = game.get_room_items()
+    item = items.find(query)
+    if item is None:
+        item = game.items_database.get(query)
+        if item is not None and item not in items:
+            return None
+    return item
+
+
+PICK_UP_ALL = ("모두", "전부", "all")
+
+
+@COMMANDS.register("get", ("줍기", "get", "g"), "아이템 줍기")
+def handle_get(game: GameState, args: List[str]) -> List[str]:
+    items = game.get_room_items()
+    if not items:
+        return ["줍을 아이템이 없습니다."]
+    if not args:
+        return [game.pick_up_item(items.first())]  # 첫 번째 아이템 줍기
+    query = " ".join(args)
+    if query in PICK_UP_ALL:
+        return [game.pick_up_all()]
+    item = find_room_item(game, query)
+    if item is None:
+        return [f"여기에는 {query}이(가) 없습니다."]
+    return [game.pick_up_item(item)]
+
+
+@COMMANDS.register("inventory", ("인벤토리", "inventory", "i"), "인벤토리 확인")
+def handle_inventory(game: GameState, args: List[str]) -> List[str]:
+    if not game.inventory:
+        return ["인벤토리가 비어있습니다."]
+    lines = ["=== 인벤토리 ==="]
+    for i, (item, count) in enumerate(game.inventory.stacks(), 1):
+        stack = f" x{count}" if count > 1 else ""
+        lines.append(f"{i}. {item.name}{stack} - {item.description}")
+    return lines
+
+
+@COMMANDS.register("use", ("사용", "use", "u"), "아이템 사용")
+def handle_use(game: GameState, args: List[str]) -> List[str]:
+    if not game.inventory:
+        return ["사용할 아이템이 없습니다."]
+    if not args:
+        return [game.use_item(game.inventory.first())]  # 첫 번째 칸의 아이템 사용
+    query = " ".join(args)
+    item = find_inventory_item(game, query)
+    if item is None:
+        return [f"{query}을(를) 가지고 있지 않습니다."]
+    return [game.use_item(item)]
+
+
+@COMMANDS.register("drop", ("버리기", "drop"), "아이템 버리기")
+def handle_drop(game: GameState, args: List[str]) -> List[str]:
+    if not args:
+        return ["버릴 아이템을 지정하세요. (예: 버리기 녹슨 검)"]
+    query = " ".join(args)
+    item = find_inventory_item(game, query)
+    if item is None:
+        return [f"{query}을(를) 가지고 있지 않습니다."]
+    return [game.drop_item(item)]
+
+
+@COMMANDS.register("help", ("도움말", "help", "h", "?"), "도움말 표시")
+def handle_help(game: GameState, args: List[str]) -> List[str]:
+    return HELP_TEXT.strip().split("\n")
+
+
+@COMMANDS.register("stats", ("통계", "stats"), "명령어 지연 통계")
+def handle_stats(game: GameState, args: List[str]) -> List[str]:
+    if game.metrics is None:
+        return [f"통계 측정이 꺼져 있습니다. 환경 변수 {STATS_ENV}=<저장 경로>를 설정하고 실행하세요."]
+    return game.metrics.report()
+
+
+@COMMANDS.register("quit", ("종료", "quit", "q", "exit"), "게임 종료")
+def handle_quit(game: GameState, args: List[str]) -> List[str]:
+    return ["게임을 종료합니다."]
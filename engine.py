@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 헤드리스 엔진
+렌더링 없이 여러 GameState 세션을 명령어 단위로 구동 (밸런스 테스트, 봇 트래픽용)
+"""
+
+from dataclasses import dataclass, field
+from typing import Collection, Dict, List, NamedTuple, Optional, Tuple
+
+from commands import COMMANDS, CommandTable
+from game_core import OPPOSITE_DIRECTION, Direction, GameState
+from metrics import CommandMetrics
+from spawns import MonsterSpawns
+
+
+OUTBOX_LIMIT = 100  # 꺼내가지 않는 세션의 알림은 오래된 것부터 버림
+
+
+class Event(NamedTuple):
+    kind: str  # 명령어 이름 ("north", "attack", ...), 알 수 없는 명령어는 "unknown"
+    text: str
+
+
+@dataclass(eq=False)
+class Session:
+    session_id: int
+    game: GameState = field(default_factory=GameState)
+    name: str = ""
+    commands_run: int = 0
+    closed: bool = False
+    outbox: List[Event] = field(default_factory=list)  # 다른 플레이어의 행동으로 받은 이벤트
+    history: List[str] = field(default_factory=list)  # 기록 중이면 실행한 명령어 (replay.py로 재실행)
+
+    @property
+    def display_name(self) -> str:
+        return self.name or f"모험가{self.session_id}"
+
+
+class RoomOccupancy:
+    """방 id → 그 방에 있는 세션 색인 (방송 비용이 전체 접속자가 아닌 방 인원에 비례)"""
+
+    def __init__(self):
+        self._rooms: Dict[str, Dict[int, Session]] = {}
+
+    def add(self, room_id: str, session: Session):
+        self._rooms.setdefault(room_id, {})[session.session_id] = session
+
+    def remove(self, room_id: str, session: Session):
+        occupants = self._rooms.get(room_id)
+        if occupants is not None:
+            occupants.pop(session.session_id, None)
+            if not occupants:
+                del self._rooms[room_id]
+
+    def move(self, session: Session, old_room_id: str, new_room_id: str):
+        self.remove(old_room_id, session)
+        self.add(new_room_id, session)
+
+    def occupants(self, room_id: str) -> Collection[Session]:
+        occupants = self._rooms.get(room_id)
+        return occupants.values() if occupants is not None else ()
+
+    def count(self, room_id: str) -> int:
+        occupants = self._rooms.get(room_id)
+        return len(occupants) if occupants is not None else 0
+
+
+class Engine:
+    """세션 관리와 명령어 실행만 담당하는 헤드리스 엔진"""
+
+    def __init__(self, commands: Optional[CommandTable] = None, notify_rooms: bool = True, record: bool = False,
+                 spawns: Optional[MonsterSpawns] = None, metrics: Optional[CommandMetrics] = None):
+        self.commands = commands if commands is not None else COMMANDS
+        self.notify_rooms = notify_rooms  # False면 같은 방 알림을 보내지 않음 (봇/밸런스 테스트용)
+        self.record = record
+        self.spawns = spawns  # 있으면 모든 세션이 몬스터 처치/리스폰/배회를 공유 (월드 틱은 호출하는 쪽이 진행)
+        self.metrics = metrics  # 있으면 모든 세션의 명령어 지연을 함께 기록
+        if spawns is not None:
+            spawns.on_event = lambda room_id, text: self.broadcast(room_id, Event("world", text))
+        self.sessions: Dict[int, Session] = {}
+        self.occupancy = RoomOccupancy()
+        self._pending: Dict[int, Session] = {}  # outbox에 이벤트가 쌓인 세션
+        self._next_session_id = 1
+
+    def create_session(self, name: str = "", game: Optional[GameState] = None, seed: Optional[int] = None) -> Session:
+        """새 세션 생성 (seed를 주면 같은 명령어에 항상 같은 결과)"""
+        session = Session(self._next_session_id, game if game is not None else GameState(seed=seed), name)
+        self._next_session_id += 1
+        self.sessions[session.session_id] = session
+        self.occupancy.add(session.game.current_room_id, session)
+        if self.spawns is not None:
+            session.game.spawns = self.spawns
+        if self.metrics is not None:
+            session.game.metrics = self.metrics
+        session.game.on_move = lambda old, new, direction: self._session_moved(session, old, new, direction)
+        return session
+
+    def close_session(self, session: Session):
+        """세션 종료"""
+        session.closed = True
+        session.game.on_move = None
+        self.sessions.pop(session.session_id, None)
+        self.occupancy.remove(session.game.current_room_id, session)
+        self._pending.pop(session.session_id, None)
+
+    def step(self, session: Session, command: str) -> List[Event]:
+        """명령어 하나를 실행하고 발생한 이벤트 목록 반환"""
+        if session.closed:
+            return []
+        line = command.strip().lower()
+        if not line:
+            return []
+
+        game = session.game
+        room_id = game.current_room_id
+        watched = self.notify_rooms and self.occupancy.count(room_id) > 1
+        if watched:
+            monster = game.current_monster
+            inventory_size = len(game.inventory)
+
+        cmd, messages = self.commands.dispatch(game, line)
+        session.commands_run += 1
+        if self.record:
+            session.history.append(line)
+        kind = cmd.name if cmd is not None else "unknown"
+
+        if watched:
+            if kind == "attack" and monster is not None:
+                self.broadcast(room_id, Event("attack", f"{session.display_name}이(가) {monster.name}와(과) 싸우고 있습니다."), session)
+            elif kind == "get" and len(game.inventory) > inventory_size:
+                picked = len(game.inventory) - inventory_size
+                what = game.inventory.last_added.name if picked == 1 else f"아이템 {picked}개"
+                self.broadcast(room_id, Event("get", f"{session.display_name}이(가) {what}을(를) 주웠습니다."), session)
+        if kind == "quit":
+            self.close_session(session)
+        return [Event(kind, message) for message in messages]
+
+    def run_script(self, session: Session, script: List[str]) -> List[Event]:
+        """명령어 목록을 순서대로 실행"""
+        events: List[Event] = []
+        for command in script:
+            events.extend(self.step(session, command))
+        return events
+
+    def broadcast(self, room_id: str, event: Event, exclude: Optional[Session] = None) -> int:
+        """방 안의 세션들에게 이벤트 전달, 받은 세션 수 반환"""
+        delivered = 0
+        for other in self.occupancy.occupants(room_id):
+            if other is not exclude:
+                outbox = other.outbox
+                if len(outbox) >= OUTBOX_LIMIT:
+                    del outbox[0]
+                outbox.append(event)
+                self._pending[other.session_id] = other
+                delivered += 1
+        return delivered
+
+    def drain(self, session: Session) -> List[Event]:
+        """세션이 받은 이벤트를 꺼냄"""
+        events = session.outbox
+        session.outbox = []
+        self._pending.pop(session.session_id, None)
+        return events
+
+    def drain_pending(self) -> List[Tuple[Session, List[Event]]]:
+        """받은 이벤트가 있는 모든 세션의 이벤트를 꺼냄"""
+        pending = list(self._pending.values())
+        return [(session, self.drain(session)) for session in pending]
+
+    def _session_moved(self, session: Session, old_room_id: str, new_room_id: str, direction: Direction):
+        """이동 시 점유 색인 갱신 후 떠난 방/도착한 방에 알림"""
+        self.occupancy.move(session, old_room_id, new_room_id)
+        if not self.notify_rooms:
+            return
+        name = session.display_name
+        self.broadcast(old_room_id, Event("leave", f"{name}이(가) {direction.value}쪽으로 떠났습니다."))
+        self.broadcast(new_room_id, Event("arrive", f"{name}이(가) {OPPOSITE_DIRECTION[direction].value}쪽에서 왔습니다."), session)
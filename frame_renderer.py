@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 터미널 프레임 렌더러
+한 프레임을 줄 목록으로 만든 뒤 이전 프레임과 비교해 바뀐 줄만 ANSI 커서 이동으로 다시 쓴다
+(외부 프로세스나 화면 전체 지우기 없이 한 번의 write)
+"""
+
+import shutil
+import sys
+import unicodedata
+from typing import List, Optional, TextIO
+
+
+CSI = "\x1b["
+CLEAR_SCREEN = CSI + "2J"
+CLEAR_LINE = CSI + "K"  # 커서부터 줄 끝까지
+CLEAR_BELOW = CSI + "J"  # 커서부터 화면 끝까지
+
+
+def char_width(char: str) -> int:
+    """터미널에서 글자가 차지하는 칸 수 (한글 등 전각 문자는 2칸)"""
+    return 2 if unicodedata.east_asian_width(char) in "WF" else 1
+
+
+def fit(text: str, width: int) -> str:
+    """text를 width칸에 맞춰 자르거나 공백으로 채움"""
+    used = 0
+    for index, char in enumerate(text):
+        size = char_width(char)
+        if used + size > width:
+            return text[:index] + " " * (width - used)
+        used += size
+    return text + " " * (width - used)
+
+
+def wrap(text: str, width: int) -> List[str]:
+    """text를 width칸 줄들로 나눔 (빈 문자열은 빈 줄 하나)"""
+    lines, line, used = [], "", 0
+    for char in text:
+        size = char_width(char)
+        if used + size > width:
+            lines.append(line)
+            line, used = "", 0
+        line += char
+        used += size
+    lines.append(line)
+    return lines
+
+
+def move_to(row: int) -> str:
+    """row번째 줄(0부터) 맨 앞으로 커서 이동"""
+    return f"{CSI}{row + 1};1H"
+
+
+class FrameRenderer:
+    """이전 프레임을 기억하고 바뀐 줄만 출력하는 렌더러"""
+
+    def __init__(self, out: Optional[TextIO] = None, height: Optional[int] = None):
+        self.out = out if out is not None else sys.stdout
+        self.height = height  # None이면 터미널 크기를 매번 확인 (tty가 아니면 제한 없음)
+        self._previous: List[str] = []
+
+    def invalidate(self):
+        """다음 프레임은 화면을 지우고 전부 다시 그림 (다른 출력이 화면을 덮었을 때)"""
+        self._previous = []
+
+    def screen_height(self) -> Optional[int]:
+        """출력할 화면의 줄 수 (모르면 None)"""
+        if self.height is not None:
+            return self.height
+        if self.out.isatty():
+            return shutil.get_terminal_size().lines
+        return None
+
+    def frame_diff(self, lines: List[str]) -> str:
+        """이전 프레임에서 lines로 바꾸는 출력 문자열"""
+        previous = self._previous
+        height = self.screen_height()
+        # 프레임이 화면보다 길면 스크롤되어 줄 위치를 믿을 수 없으므로 전체를 다시 그림
+        if not previous or (height is not None and len(lines) + 1 > height):
+            parts = [CLEAR_SCREEN, move_to(0), "\n".join(lines), "\n", CLEAR_BELOW]
+        else:
+            parts = []
+            for row, line in enumerate(lines):
+                if row >= len(previous) or previous[row] != line:
+                    parts.append(move_to(row) + line + CLEAR_LINE)
+            # 프레임 아래(지난 프레임의 남은 줄, 입력 프롬프트 줄)는 지우고 커서를 그곳에 둔다
+            parts.append(move_to(len(lines)) + CLEAR_BELOW)
+        self._previous = lines
+        return "".join(parts)
+
+    def render(self, lines: List[str]) -> int:
+        """프레임 출력, 실제로 쓴 문자 수 반환"""
+        output = self.frame_diff(lines)
+        self.out.write(output)
+        self.out.flush()
+        return len(output)
@@ -0,0 +1,547 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 게임 코어
+UI 없이 사용할 수 있는 게임 데이터와 로직
+"""
+
+import random
+from array import array
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from enum import Enum
+
+from inventory import Inventory
+
+if TYPE_CHECKING:
+    from metrics import CommandMetrics
+    from spawns import MonsterSpawns
+
+
+class Direction(Enum):
+    NORTH = "북"
+    SOUTH = "남"
+    EAST = "동"
+    WEST = "서"
+
+
+OPPOSITE_DIRECTION = {
+    Direction.NORTH: Direction.SOUTH,
+    Direction.SOUTH: Direction.NORTH,
+    Direction.EAST: Direction.WEST,
+    Direction.WEST: Direction.EAST,
+}
+
+EXIT_SLOTS = {direction: slot for slot, direction in enumerate(Direction)}  # 출구 표에서 방향별 칸
+EXIT_DIRECTIONS = tuple(EXIT_SLOTS)
+# 출구가 있는 칸을 비트로 모은 값 → 방향 튜플 (16가지를 모든 방이 공유)
+EXIT_MASKS = tuple(tuple(direction for slot, direction in enumerate(EXIT_DIRECTIONS) if mask >> slot & 1)
+                   for mask in range(1 << len(EXIT_DIRECTIONS)))
+NO_EXIT = -1
+REGEN_TICKS = 10  # 전투 밖에서 체력 1 회복하는 월드 틱 간격 (1초)
+
+
+class ItemType(Enum):
+    WEAPON = "무기"
+    ARMOR = "방어구"
+    POTION = "물약"
+    TREASURE = "보물"
+
+
+@dataclass(frozen=True, eq=False, slots=True)
+class Item:
+    """아이템 템플릿 (모든 방/인벤토리가 공유, 같은 객체끼리만 같은 아이템)"""
+    name: str
+    item_type: ItemType
+    attack: int = 0
+    defense: int = 0
+    heal: int = 0
+    value: int = 0
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class MonsterTemplate:
+    """몬스터 템플릿 (변하지 않는 능력치, 여러 방이 공유)"""
+    name: str
+    max_hp: int
+    attack: int
+    defense: int
+    exp_reward: int
+    gold_reward: int
+    description: str = ""
+
+    def spawn(self) -> "Monster":
+        """새 몬스터 개체 생성"""
+        return Monster(self)
+
+
+class Monster:
+    """조우할 때마다 생성되는 몬스터 개체 (체력과 템플릿 참조만 보유)"""
+
+    __slots__ = ("template", "hp")
+
+    def __init__(self, template: MonsterTemplate, hp: Optional[int] = None):
+        self.template = template
+        self.hp = template.max_hp if hp is None else hp
+
+    def __repr__(self) -> str:
+        return f"Monster({self.template.name!r}, hp={self.hp}/{self.template.max_hp})"
+
+    @property
+    def name(self) -> str:
+        return self.template.name
+
+    @property
+    def max_hp(self) -> int:
+        return self.template.max_hp
+
+    @property
+    def attack(self) -> int:
+        return self.template.attack
+
+    @property
+    def defense(self) -> int:
+        return self.template.defense
+
+    @property
+    def exp_reward(self) -> int:
+        return self.template.exp_reward
+
+    @property
+    def gold_reward(self) -> int:
+        return self.template.gold_reward
+
+    @property
+    def description(self) -> str:
+        return self.template.description
+
+
+class ExitTable:
+    """월드 전체의 출구 표: 방마다 방향 4칸에 도착 방 번호(정수 id)를 담은 배열 하나"""
+
+    __slots__ = ("room_ids", "targets")
+
+    def __init__(self, room_ids: List[str]):
+        self.room_ids = room_ids  # 방 번호 → 방 id
+        self.targets = array("i", [NO_EXIT]) * (len(room_ids) * len(EXIT_SLOTS))
+
+
+class Exits(Mapping):
+    """방 하나의 출구 (방향 → 방 id), 출구 표의 자기 칸을 가리키는 읽기 전용 뷰"""
+
+    __slots__ = ("_table", "_base")
+
+    def __init__(self, table: ExitTable, index: int):
+        self._table = table
+        self._base = index * len(EXIT_SLOTS)
+
+    def __reduce__(self):
+        return Exits, (self._table, self.index)
+
+    @property
+    def index(self) -> int:
+        """방 번호"""
+        return self._base // len(EXIT_SLOTS)
+
+    def __getitem__(self, direction: Direction) -> str:
+        target = self._table.targets[self._base + EXIT_SLOTS[direction]]
+        if target == NO_EXIT:
+            raise KeyError(direction)
+        return self._table.room_ids[target]
+
+    def get(self, direction: Direction, default=None):
+        target = self._table.targets[self._base + EXIT_SLOTS[direction]]
+        return default if target == NO_EXIT else self._table.room_ids[target]
+
+    def __contains__(self, direction) -> bool:
+        slot = EXIT_SLOTS.get(direction)
+        return slot is not None and self._table.targets[self._base + slot] != NO_EXIT
+
+    def directions(self) -> Tuple[Direction, ...]:
+        """출구가 있는 방향 (북, 남, 동, 서 순서)"""
+        targets, base = self._table.targets, self._base
+        return EXIT_MASKS[(targets[base] != NO_EXIT) | (targets[base + 1] != NO_EXIT) << 1
+                          | (targets[base + 2] != NO_EXIT) << 2 | (targets[base + 3] != NO_EXIT) << 3]
+
+    def __iter__(self) -> Iterator[Direction]:
+        return iter(self.directions())
+
+    def __len__(self) -> int:
+        return len(self.directions())
+
+    def items(self) -> List[Tuple[Direction, str]]:
+        targets, base, room_ids = self._table.targets, self._base, self._table.room_ids
+        return [(direction, room_ids[targets[base + EXIT_SLOTS[direction]]]) for direction in self.directions()]
+
+    def values(self) -> List[str]:
+        return [room_id for _, room_id in self.items()]
+
+    def __repr__(self) -> str:
+        return f"Exits({dict(self.items())!r})"
+
+    def _set(self, direction: Direction, target: int):
+        self._table.targets[self._base + EXIT_SLOTS[direction]] = target
+
+
+@dataclass(slots=True)
+class Room:
+    name: str
+    description: str
+    exits: Mapping  # 생성 시 방향 → 방 id dict, World에 넣으면 출구 표 뷰(Exits)로 바뀜
+    items: Tuple[Item, ...]  # 처음 배치된 아이템 (공유, 읽기 전용)
+    monsters: Tuple[MonsterTemplate, ...]
+    npcs: Tuple[str, ...]
+    is_safe: bool = False
+
+
+class World:
+    """여러 GameState가 공유하는 정적 월드 (방, 출구, 아이템/몬스터 템플릿)"""
+
+    _default: Optional["World"] = None
+
+    def __init__(self, rooms: Dict[str, Room], items: Dict[str, Item],
+                 monsters: Dict[str, MonsterTemplate], start_room_id: str = "start_village"):
+        self.rooms = rooms
+        self.items = items
+        self.monsters = monsters
+        self.start_room_id = start_room_id
+        self.exit_table = self._pack_exits(rooms)
+        self._routes = None
+        self._room_names: Optional[Dict[str, str]] = None
+        self._keys: Optional[Dict[int, str]] = None
+
+    def __getstate__(self):
+        # 경로/이름/키 색인은 캐시 파일에 넣지 않고 필요할 때 다시 만든다
+        state = self.__dict__.copy()
+        state["_routes"] = None
+        state["_room_names"] = None
+        state["_keys"] = None
+        return state
+
+    @staticmethod
+    def _pack_exits(rooms: Dict[str, Room]) -> ExitTable:
+        """방마다 있던 출구 dict를 정수 방 번호 배열 하나로 옮김"""
+        table = ExitTable(list(rooms))
+        index = {room_id: i for i, room_id in enumerate(table.room_ids)}
+        targets, width = table.targets, len(EXIT_SLOTS)
+        for i, room in enumerate(rooms.values()):
+            for direction, target in room.exits.items():
+                targets[i * width + EXIT_SLOTS[direction]] = index[target]
+            room.exits = Exits(table, i)
+        return table
+
+    @classmethod
+    def default(cls) -> "World":
+        """기본 월드 (data/world.json, 처음 요청될 때 한 번만 읽음)"""
+        if cls._default is None:
+            from world_data import load_world
+            cls._default = load_world()
+        return cls._default
+
+    def __getitem__(self, room_id: str) -> Room:
+        return self.rooms[room_id]
+
+    def __contains__(self, room_id: str) -> bool:
+        return room_id in self.rooms
+
+    def __len__(self) -> int:
+        return len(self.rooms)
+
+    @property
+    def routes(self):
+        """목적지별 다음 칸 경로 색인 (routing.RouteIndex)"""
+        if self._routes is None:
+            from routing import RouteIndex
+            self._routes = RouteIndex(self)
+        return self._routes
+
+    def find_room(self, query: str) -> Optional[str]:
+        """방 id 또는 방 이름으로 방 id 찾기"""
+        if query in self.rooms:
+            return query
+        if self._room_names is None:
+            self._room_names = {room.name: room_id for room_id, room in self.rooms.items()}
+        return self._room_names.get(query)
+
+    def key_of(self, obj) -> str:
+        """공유 아이템/몬스터 템플릿 객체의 데이터 키 (세이브 파일, 월드 파일에서 사용)"""
+        if self._keys is None:
+            keys = {id(item): key for key, item in self.items.items()}
+            keys.update({id(monster): key for key, monster in self.monsters.items()})
+            self._keys = keys
+        return self._keys[id(obj)]
+
+    def set_exit(self, room_id: str, direction: Direction, target: Optional[str]):
+        """출구 변경 (target이 None이면 제거), 경로 색인도 함께 갱신"""
+        exits = self.rooms[room_id].exits
+        old_target = exits.get(direction)
+        if old_target == target:
+            return
+        if target is not None and target not in self.rooms:
+            raise KeyError(target)
+        if old_target is not None:
+            exits._set(direction, NO_EXIT)
+            if self._routes is not None:
+                self._routes.exit_removed(room_id, direction, old_target)
+        if target is not None:
+            exits._set(direction, self.rooms[target].exits.index)
+            if self._routes is not None:
+                self._routes.exit_added(room_id, direction, target)
+
+
+class GameState:
+    def __init__(self, world: Optional[World] = None, seed: Optional[int] = None):
+        self.player_level = 1
+        self.player_hp = 100
+        self.player_max_hp = 100
+        self.player_exp = 0
+        self.player_exp_needed = 100
+        self.player_attack = 10
+        self.player_defense = 5
+        self.player_gold = 0
+        self.world = world if world is not None else World.default()
+        self.current_room_id = self.world.start_room_id
+        self.inventory = Inventory()
+        self.equipped_weapon: Optional[Item] = None
+        self.equipped_armor: Optional[Item] = None
+        self.in_combat = False
+        self.current_monster: Optional[Monster] = None
+
+        # 방 아이템은 처음 바뀔 때만 플레이어별로 복사 (copy-on-write), 아이템별 개수로 보관
+        self.room_items: Dict[str, Inventory] = {}
+
+        # 세션별 난수 (같은 시드와 명령어면 같은 결과), 처음 쓸 때 생성
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self._rng: Optional[random.Random] = None
+
+        # 월드 공유 몬스터 상태 (spawns.MonsterSpawns), 없으면 방에 들어갈 때마다 새 몬스터가 나타남
+        self.spawns: Optional["MonsterSpawns"] = None
+        # 혼자 하는 게임에서 지난 월드 틱 수 (체력 회복 주기, 저장 저널의 시각)
+        self.world_ticks = 0
+
+        # 명령어 지연 측정 (metrics.CommandMetrics), None이면 측정하지 않음
+        self.metrics: Optional["CommandMetrics"] = None
+
+        # 이동 알림 (이전 방 id, 새 방 id, 방향), 엔진의 방 점유 색인이 사용
+        self.on_move: Optional[Callable[[str, str, Direction], None]] = None
+
+    @property
+    def rng(self) -> random.Random:
+        if self._rng is None:
+            self._rng = random.Random(self.seed)
+        return self._rng
+
+    @property
+    def items_database(self) -> Dict[str, Item]:
+        return self.world.items
+
+    @property
+    def monsters_database(self) -> Dict[str, MonsterTemplate]:
+        return self.world.monsters
+
+    @property
+    def total_attack(self) -> int:
+        """장착된 무기를 포함한 총 공격력"""
+        base = self.player_attack
+        if self.equipped_weapon:
+            base += self.equipped_weapon.attack
+        return base
+
+    @property
+    def total_defense(self) -> int:
+        """장착된 방어구를 포함한 총 방어력"""
+        base = self.player_defense
+        if self.equipped_armor:
+            base += self.equipped_armor.defense
+        return base
+
+    def get_current_room(self) -> Room:
+        return self.world[self.current_room_id]
+
+    def get_room_items(self, room_id: Optional[str] = None) -> Inventory:
+        """이 플레이어에게 보이는 방 아이템 (기본값: 현재 방), 읽기 전용으로 사용"""
+        if room_id is None:
+            room_id = self.current_room_id
+        items = self.room_items.get(room_id)
+        return items if items is not None else Inventory.of(self.world[room_id].items)
+
+    def get_room_monsters(self, room_id: Optional[str] = None) -> Sequence[MonsterTemplate]:
+        """방에 있는 몬스터 (기본값: 현재 방)"""
+        if room_id is None:
+            room_id = self.current_room_id
+        if self.spawns is not None:
+            return self.spawns.monsters(room_id)
+        return self.world[room_id].monsters
+
+    def _own_room_items(self, room_id: str) -> Inventory:
+        """수정할 방 아이템 (처음 수정할 때 공유 데이터에서 복사)"""
+        items = self.room_items.get(room_id)
+        if items is None:
+            items = self.room_items[room_id] = Inventory.of(self.world[room_id].items)
+        return items
+    
+    def move(self, direction: Direction) -> bool:
+        """플레이어 이동"""
+        target = self.get_current_room().exits.get(direction)
+        if target is not None:
+            previous_room_id = self.current_room_id
+            self.current_room_id = target
+            if self.on_move is not None:
+                self.on_move(previous_room_id, self.current_room_id, direction)
+            return True
+        return False
+    
+    def attack_monster(self) -> str:
+        """몬스터 공격"""
+        if not self.in_combat or not self.current_monster:
+            return "전투 중이 아닙니다."
+        
+        # 플레이어 공격
+        damage = max(1, self.total_attack - self.current_monster.defense)
+        self.current_monster.hp -= damage
+
+        result = f"당신이 {self.current_monster.name}에게 {damage}의 피해를 입혔습니다!"
+        
+        # 몬스터가 죽었는지 확인
+        if self.current_monster.hp <= 0:
+            exp_gain = self.current_monster.exp_reward
+            gold_gain = self.current_monster.gold_reward
+            self.player_exp += exp_gain
+            self.player_gold += gold_gain
+            
+            result += f"\n{self.current_monster.name}을(를) 물리쳤습니다!"
+            result += f"\n경험치 {exp_gain} 획득! 골드 {gold_gain} 획득!"
+            if self.spawns is not None:
+                self.spawns.killed(self.current_room_id, self.current_monster.template)
+            
+            # 레벨업 체크
+            if self.player_exp >= self.player_exp_needed:
+                self.level_up()
+            
+            self.in_combat = False
+            self.current_monster = None
+            return result
+        
+        # 몬스터 반격
+        monster_damage = max(1, self.current_monster.attack - self.total_defense)
+        self.player_hp -= monster_damage
+
+        result += f"\n{self.current_monster.name}이(가) 당신에게 {monster_damage}의 피해를 입혔습니다!"
+        
+        # 플레이어가 죽었는지 확인
+        if self.player_hp <= 0:
+            self.player_hp = 1
+            self.in_combat = False
+            self.current_monster = None
+            result += "\n치명적인 공격을 받았지만 간신히 살아남았습니다!"
+        
+        return result
+    
+    def world_tick(self) -> bool:
+        """혼자 하는 게임의 월드 한 틱 진행 (tick_spawns 후 regen_tick, 저장 저널을 다시 실행할 때 사용), 회복했으면 True"""
+        self.tick_spawns()
+        return self.regen_tick()
+
+    def tick_spawns(self):
+        """월드 틱 단계: 자기 spawns의 리스폰/배회 타이머 (spawns가 없으면 아무것도 안 함)"""
+        if self.spawns is not None:
+            self.spawns.wheel.tick()
+
+    def regen_tick(self) -> bool:
+        """월드 틱 단계: 틱 수를 세고 REGEN_TICKS마다 체력 회복, 회복했으면 True
+
+        월드 틱 수는 저장 저널에 기록되므로 다시 실행하면 같은 시점에 회복함
+        """
+        self.world_ticks += 1
+        return self.world_ticks % REGEN_TICKS == 0 and self.regenerate()
+
+    def regenerate(self, amount: int = 1) -> bool:
+        """전투 중이 아니면 체력 회복, 회복했으면 True"""
+        if self.in_combat or self.player_hp >= self.player_max_hp:
+            return False
+        self.player_hp = min(self.player_max_hp, self.player_hp + amount)
+        return True
+
+    def level_up(self):
+        """레벨업"""
+        self.player_level += 1
+        self.player_exp -= self.player_exp_needed
+        self.player_exp_needed = int(self.player_exp_needed * 1.5)
+        self.player_max_hp += 20
+        self.player_hp = self.player_max_hp
+        self.player_attack += 3
+        self.player_defense += 2
+    
+    def start_combat(self, monster: Monster):
+        """전투 시작"""
+        self.in_combat = True
+        self.current_monster = monster
+    
+    def flee_combat(self) -> str:
+        """전투에서 도망"""
+        if not self.in_combat:
+            return "전투 중이 아닙니다."
+        
+        if self.rng.random() < 0.7:  # 70% 확률로 도망 성공
+            self.in_combat = False
+            self.current_monster = None
+            return "성공적으로 도망쳤습니다!"
+        else:
+            return "도망에 실패했습니다!"
+    
+    def pick_up_item(self, item: Item) -> str:
+        """아이템 줍기"""
+        self.inventory.add(item)
+        if item in self.get_room_items():
+            self._own_room_items(self.current_room_id).remove(item)
+        return f"{item.name}을(를) 획득했습니다!"
+
+    def pick_up_all(self) -> str:
+        """방의 아이템을 한 번에 모두 줍기 (아이템 종류 수에 비례)"""
+        if not self.get_room_items():
+            return "줍을 아이템이 없습니다."
+        room_items = self._own_room_items(self.current_room_id)
+        summary = room_items.summary()
+        self.inventory.add_stacks(room_items.take_all())
+        return f"{summary}을(를) 획득했습니다!"
+    
+    def drop_item(self, item: Item) -> str:
+        """아이템 버리기 (현재 방에 놓음)"""
+        if not self.inventory.remove(item):
+            return f"{item.name}을(를) 가지고 있지 않습니다."
+        if item not in self.inventory:
+            if self.equipped_weapon is item:
+                self.equipped_weapon = None
+            if self.equipped_armor is item:
+                self.equipped_armor = None
+        self._own_room_items(self.current_room_id).add(item)
+        return f"{item.name}을(를) 버렸습니다."
+
+    def use_item(self, item: Item) -> str:
+        """아이템 사용"""
+        if item.item_type == ItemType.POTION:
+            if item.heal > 0:
+                self.player_hp = min(self.player_max_hp, self.player_hp + item.heal)
+                self.inventory.remove(item)
+                return f"{item.name}을(를) 사용하여 체력을 회복했습니다!"
+        elif item.item_type == ItemType.WEAPON:
+            self.equipped_weapon = item
+            return f"{item.name}을(를) 장착했습니다!"
+        elif item.item_type == ItemType.ARMOR:
+            self.equipped_armor = item
+            return f"{item.name}을(를) 장착했습니다!"
+        
+        return f"{item.name}을(를) 사용할 수 없습니다."
+
+    def check_room_events(self) -> List[str]:
+        """방 진입 시 이벤트 체크"""
+        monsters = self.get_room_monsters()
+
+        # 몬스터와 조우
+        if monsters and not self.in_combat:
+            monster = self.rng.choice(monsters).spawn()
+            self.start_combat(monster)
+            return [f"!!! {monster.name}이(가) 나타났습니다! !!!", monster.description]
+
+        return []
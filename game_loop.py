@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 고정 간격 게임 루프
+틱마다 월드 시스템(리스폰, 배회, 회복 등)을 순서대로 실행하고 시스템별 소요 시간과 예산 초과 틱을 기록
+TUI는 Textual set_interval로, 헤드리스/서버는 asyncio(TickLoop.run)로 tick()을 호출한다
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from ring_buffer import RingBuffer
+from scheduler import TICK_SECONDS
+
+
+MAX_CATCH_UP = 5  # 늦었을 때 한 번에 따라잡는 최대 틱 수 (넘으면 건너뜀)
+OVERRUN_HISTORY = 100  # 보관할 최근 예산 초과 틱 수
+
+
+class SystemStats:
+    """시스템 하나의 누적 실행 시간"""
+
+    __slots__ = ("calls", "total", "worst")
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.calls if self.calls else 0.0
+
+
+class Overrun(NamedTuple):
+    tick: int
+    elapsed: float  # 틱 전체 소요 시간 (초)
+    systems: Tuple[Tuple[str, float], ...]  # 시스템별 소요 시간, 오래 걸린 순
+
+
+class TickLoop:
+    """고정 간격 틱 루프 (시스템은 틱 번호를 받는 함수)"""
+
+    def __init__(self, interval: float = TICK_SECONDS, budget: Optional[float] = None):
+        self.interval = interval
+        self.budget = budget if budget is not None else interval  # 한 틱에 쓸 수 있는 시간 (초)
+        self.tick_count = 0
+        self.skipped = 0  # 너무 늦어서 건너뛴 틱 수
+        self.systems: List[Tuple[str, Callable[[int], object]]] = []
+        self.stats: Dict[str, SystemStats] = {}
+        self.overruns: RingBuffer[Overrun] = RingBuffer(OVERRUN_HISTORY)
+        self.overrun_count = 0
+        self.on_overrun: Optional[Callable[[Overrun], None]] = None
+
+    def add_system(self, name: str, system: Callable[[int], object]):
+        """틱마다 실행할 시스템 추가 (추가한 순서대로 실행)"""
+        self.systems.append((name, system))
+        self.stats[name] = SystemStats()
+
+    def tick(self):
+        """한 틱 실행: 시스템별 시간을 재고 예산을 넘으면 기록"""
+        self.tick_count += 1
+        timings = []
+        tick_start = time.perf_counter()
+        for name, system in self.systems:
+            start = time.perf_counter()
+            system(self.tick_count)
+            elapsed = time.perf_counter() - start
+            stats = self.stats[name]
+            stats.calls += 1
+            stats.total += elapsed
+            if elapsed > stats.worst:
+                stats.worst = elapsed
+            timings.append((name, elapsed))
+        elapsed = time.perf_counter() - tick_start
+        if elapsed > self.budget:
+            overrun = Overrun(self.tick_count, elapsed, tuple(sorted(timings, key=lambda timing: -timing[1])))
+            self.overruns.append(overrun)
+            self.overrun_count += 1
+            if self.on_overrun is not None:
+                self.on_overrun(overrun)
+
+    async def run(self):
+        """asyncio에서 interval초마다 tick() (늦으면 MAX_CATCH_UP틱까지 몰아서 실행, 취소될 때까지)"""
+        loop = asyncio.get_running_loop()
+        next_time = loop.time()
+        while True:
+            next_time += self.interval
+            await asyncio.sleep(max(0.0, next_time - loop.time()))
+            behind = int((loop.time() - next_time) / self.interval)
+            if behind > MAX_CATCH_UP:
+                self.skipped += behind - MAX_CATCH_UP
+                next_time += (behind - MAX_CATCH_UP) * self.interval
+                behind = MAX_CATCH_UP
+            for _ in range(behind + 1):
+                self.tick()
+            next_time += behind * self.interval
+
+    def report(self) -> List[str]:
+        """시스템별 평균/최대 시간과 예산 초과 요약"""
+        lines = [f"틱 {self.tick_count:,}회 (간격 {self.interval * 1e3:.0f}ms, 예산 {self.budget * 1e3:.1f}ms), "
+                 f"예산 초과 {self.overrun_count:,}회, 건너뜀 {self.skipped:,}회"]
+        for name, stats in self.stats.items():
+            lines.append(f"  {name:<10} 평균 {stats.average * 1e3:7.3f}ms, 최대 {stats.worst * 1e3:7.3f}ms")
+        if self.overruns:
+            worst = max(self.overruns, key=lambda overrun: overrun.elapsed)
+            name, elapsed = worst.systems[0]
+            lines.append(f"  최근 최악: 틱 {worst.tick:,}, {worst.elapsed * 1e3:.1f}ms ({name} {elapsed * 1e3:.1f}ms)")
+        return lines
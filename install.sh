@@ -10,7 +10,11 @@ echo "📋 Python 버전 확인 중..."
 python3 --version
 if [ $? -ne 0 ]; then
     echo "❌ Python 3이 설치되어 있지 않습니다."
-    echo "Python 3.8 이상을 설치해주세요."
+    echo "Python 3.10 이상을 설치해주세요."
+    exit 1
+fi
+if ! python3 -c 'import sys; sys.exit(sys.version_info < (3, 10))'; then
+    echo "❌ Python 3.10 이상이 필요합니다."
     exit 1
 fi
 
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 인벤토리
+같은 아이템은 개수만 늘려 한 칸에 쌓고, 이름/종류 색인으로 찾기·추가·제거를 O(1)에 처리
+플레이어 인벤토리와 방에 놓인 아이템(플레이어별 사본)이 함께 사용
+"""
+
+from itertools import islice
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from game_core import Item, ItemType
+
+
+class Inventory:
+    """아이템 템플릿별 개수 (넣은 순서대로 번호가 매겨짐)"""
+
+    __slots__ = ("_counts", "_by_name", "_by_type", "_total", "last_added")
+
+    def __init__(self):
+        self._counts: Dict["Item", int] = {}
+        self._by_name: Dict[str, List["Item"]] = {}  # 이름별 아이템 (넣은 순, 이름이 같은 다른 아이템은 n번째로 지정)
+        self._by_type: Dict["ItemType", Dict["Item", None]] = {}  # 종류별 순서 있는 집합
+        self._total = 0
+        self.last_added: Optional["Item"] = None
+
+    @classmethod
+    def of(cls, items: Iterable["Item"]) -> "Inventory":
+        """아이템 목록(중복은 개수로 합침)으로 생성"""
+        inventory = cls()
+        for item in items:
+            inventory.add(item)
+        inventory.last_added = None
+        return inventory
+
+    def __len__(self) -> int:
+        """아이템 총 개수 (쌓인 개수 포함)"""
+        return self._total
+
+    def __contains__(self, item: "Item") -> bool:
+        return item in self._counts
+
+    def __iter__(self) -> Iterator["Item"]:
+        """들어 있는 아이템 종류 (칸 순서)"""
+        return iter(self._counts)
+
+    def __repr__(self) -> str:
+        return f"Inventory({', '.join(f'{item.name}x{count}' for item, count in self._counts.items())})"
+
+    def count(self, item: "Item") -> int:
+        return self._counts.get(item, 0)
+
+    def stacks(self) -> List[Tuple["Item", int]]:
+        """(아이템, 개수) 목록"""
+        return list(self._counts.items())
+
+    def summary(self) -> str:
+        """"금화 x3, 체력 물약" 형식의 내용 요약"""
+        return ", ".join(f"{item.name} x{count}" if count > 1 else item.name for item, count in self._counts.items())
+
+    def by_type(self, item_type: "ItemType") -> List["Item"]:
+        return list(self._by_type.get(item_type, ()))
+
+    def add(self, item: "Item", count: int = 1):
+        counts = self._counts
+        if item in counts:
+            counts[item] += count
+        else:
+            counts[item] = count
+            self._by_name.setdefault(item.name, []).append(item)
+            self._by_type.setdefault(item.item_type, {})[item] = None
+        self._total += count
+        self.last_added = item
+
+    def remove(self, item: "Item", count: int = 1) -> bool:
+        """count개 제거 (부족하면 아무것도 하지 않고 False)"""
+        have = self._counts.get(item, 0)
+        if have < count:
+            return False
+        self._total -= count
+        if have > count:
+            self._counts[item] = have - count
+            return True
+        del self._counts[item]
+        of_type = self._by_type[item.item_type]
+        del of_type[item]
+        if not of_type:
+            del self._by_type[item.item_type]
+        named = self._by_name[item.name]
+        named.remove(item)  # 이름이 같은 아이템 수만큼만 (보통 하나)
+        if not named:
+            del self._by_name[item.name]
+        return True
+
+    def find(self, query: str) -> Optional["Item"]:
+        """이름, "n.이름"(이름이 같은 것 중 n번째) 또는 칸 번호(1부터)로 아이템 찾기"""
+        named = self._by_name.get(query)
+        if named is not None:
+            return named[0]
+        number, dot, name = query.partition(".")
+        if dot and number.isdigit():
+            named = self._by_name.get(name)
+            index = int(number) - 1
+            return named[index] if named is not None and 0 <= index < len(named) else None
+        if query.isdigit():
+            index = int(query) - 1
+            if 0 <= index < len(self._counts):
+                return next(islice(self._counts, index, None))  # 칸 번호는 C 수준 반복으로 건너뜀
+        return None
+
+    def first(self) -> Optional["Item"]:
+        return next(iter(self._counts), None)
+
+    def take_all(self) -> List[Tuple["Item", int]]:
+        """모든 아이템을 꺼내고 (아이템, 개수) 목록 반환"""
+        stacks = list(self._counts.items())
+        self.clear()
+        return stacks
+
+    def add_stacks(self, stacks: Iterable[Tuple["Item", int]]):
+        """(아이템, 개수) 목록을 한 번에 추가 (아이템 종류 수에 비례)"""
+        for item, count in stacks:
+            self.add(item, count)
+
+    def clear(self):
+        self._counts.clear()
+        self._by_name.clear()
+        self._by_type.clear()
+        self._total = 0
+        self.last_added = None
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 명령어 지연 측정
+명령어 종류별로 단계(dispatch: 파싱, logic: 핸들러, render: 화면 갱신)마다 지연 히스토그램을 모아
+'통계' 명령어로 보여주고 종료할 때 JSON으로 저장한다
+GameState.metrics가 None이면(기본값) 측정하지 않으므로 꺼져 있을 때 비용은 속성 조회 한 번
+"""
+
+import os
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+STATS_ENV = "MUD_STATS"  # 설정하면 측정을 켜고 종료 시 이 경로에 JSON 저장
+PHASES = ("dispatch", "logic", "render")
+BUCKETS = 28  # 1µs부터 2배씩, 마지막 칸은 2**26µs(약 67초) 이상
+
+
+class LatencyHistogram:
+    """2배 간격 로그 버킷 지연 히스토그램 (기록 O(1), 백분위는 버킷 상한으로 근사)"""
+
+    __slots__ = ("counts", "count", "total", "worst")
+
+    def __init__(self):
+        self.counts = [0] * BUCKETS
+        self.count = 0
+        self.total = 0.0
+        self.worst = 0.0
+
+    def record(self, seconds: float):
+        self.counts[min(int(seconds * 1e6).bit_length(), BUCKETS - 1)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.worst:
+            self.worst = seconds
+
+    def percentile(self, fraction: float) -> float:
+        """fraction(0~1) 백분위 지연 (초, 해당 버킷의 상한)"""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return min((1 << index) / 1e6, self.worst)
+        return self.worst
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "avg_us": round(self.average * 1e6, 2),
+            "p50_us": round(self.percentile(0.5) * 1e6, 2),
+            "p95_us": round(self.percentile(0.95) * 1e6, 2),
+            "p99_us": round(self.percentile(0.99) * 1e6, 2),
+            "max_us": round(self.worst * 1e6, 2),
+            "buckets": {f"<{1 << index}us": count for index, count in enumerate(self.counts) if count},
+        }
+
+
+class CommandMetrics:
+    """명령어 이름 × 단계별 지연 히스토그램 모음"""
+
+    def __init__(self, path: Optional[Union[str, "Path"]] = None):
+        self.path = path  # 종료 시 dump()할 경로
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    @classmethod
+    def from_env(cls) -> Optional["CommandMetrics"]:
+        """환경 변수 MUD_STATS가 있으면 그 경로로 측정 시작, 없으면 None"""
+        path = os.environ.get(STATS_ENV)
+        return cls(path) if path else None
+
+    def record(self, command: str, phase: str, seconds: float):
+        histogram = self.histograms.get((command, phase))
+        if histogram is None:
+            histogram = self.histograms[command, phase] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, object]]]:
+        commands: Dict[str, Dict[str, Dict[str, object]]] = {}
+        for (command, phase), histogram in sorted(self.histograms.items()):
+            commands.setdefault(command, {})[phase] = histogram.to_dict()
+        return commands
+
+    def report(self) -> List[str]:
+        """명령어별 단계 지연 요약 (느린 명령어부터)"""
+        if not self.histograms:
+            return ["아직 측정된 명령어가 없습니다."]
+        totals: Dict[str, float] = {}
+        for (command, _), histogram in self.histograms.items():
+            totals[command] = totals.get(command, 0.0) + histogram.average
+        lines = [f"{'명령어':<8} {'단계':<8} {'횟수':>6} {'p50':>9} {'p95':>9} {'최대':>9}"]
+        for command in sorted(totals, key=totals.get, reverse=True):
+            for phase in PHASES:
+                histogram = self.histograms.get((command, phase))
+                if histogram is not None:
+                    lines.append(f"{command:<8} {phase:<8} {histogram.count:>6} {format_us(histogram.percentile(0.5))} "
+                                 f"{format_us(histogram.percentile(0.95))} {format_us(histogram.worst)}")
+        return lines
+
+    def dump(self, path: Optional[Union[str, "Path"]] = None) -> Optional["Path"]:
+        """히스토그램을 JSON으로 저장 (경로가 없으면 건너뜀), 저장한 경로 반환"""
+        import json  # 저장할 때만 필요 (엔진/워커 시작 시 가져오기 비용 절약)
+        from pathlib import Path
+
+        path = path if path is not None else self.path
+        if path is None:
+            return None
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=2), encoding="utf-8")
+        return path
+
+
+def format_us(seconds: float) -> str:
+    return f"{seconds * 1e6:7.0f}µs" if seconds < 0.01 else f"{seconds * 1e3:7.1f}ms"
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 몬테카를로 플레이 시뮬레이터
+시드를 고정한 봇 플레이를 샤드로 나눠 프로세스 풀에서 실제 게임 로직(check_room_events, attack_monster,
+flee_combat)으로 실행하고, 몬스터/레벨별 전투 결과, 레벨 도달 걸음 수, 골드 곡선을 모은다
+
+    python montecarlo.py --runs 10000 [--workers N] [--seed 0] [--dragon-level 3] [--world 파일 --boss-room 방]
+                         [--json stats.json]
+
+런 i의 시드는 (기본 시드, i)로만 정해지고 샤드 결과는 합산만 하므로, 워커 수와 관계없이 같은 결과가 나온다
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from game_core import GameState, ItemType, World
+
+
+OUTCOMES = ("win", "fled", "defeated")
+DRAGON_ROOM = "dragon_lair"  # 기본 월드의 보스 방
+SHARD_SIZE = 250  # 샤드 하나(워커 작업 단위)의 런 수
+MAX_STEPS = 3000  # 런 하나의 최대 행동 수
+CURVE_EVERY = 100  # 골드 곡선 기록 간격 (걸음)
+REST_HP = 5  # 안전한 방에서 한 걸음 쉴 때 회복하는 체력
+
+
+@dataclass(frozen=True)
+class BotPolicy:
+    """봇 행동 규칙 (체력 기준은 최대 체력에 대한 비율)"""
+    dragon_level: int = 3  # 이 레벨부터 보스 방에 도전
+    boss_room: str = DRAGON_ROOM  # 도전할 보스 방 id (사냥터에서 제외, 월드에 있어야 함)
+    potion_below: float = 0.4  # 전투 중 체력이 이보다 낮으면 물약 사용
+    flee_below: float = 0.25  # 물약이 없고 체력이 이보다 낮으면 도망
+    rest_below: float = 0.6  # 전투 밖에서 체력이 이보다 낮으면 마을로 돌아가 쉼
+    max_steps: int = MAX_STEPS
+
+
+@dataclass
+class MonteCarloStats:
+    """샤드별로 모아 합치는 통계 (모두 합계라 합치는 순서와 무관)"""
+    runs: int = 0
+    steps: int = 0
+    dragon_slain: int = 0
+    # (몬스터 이름, 전투 시작 레벨) → [승리, 도망, 패배] 횟수
+    fights: Dict[Tuple[str, int], List[int]] = field(default_factory=dict)
+    # 레벨 → 처음 도달한 걸음 수 분포
+    level_steps: Dict[int, Counter] = field(default_factory=dict)
+    # CURVE_EVERY 걸음마다 골드 합계 (일찍 끝난 런은 마지막 골드로 채움)
+    gold_curve: List[int] = field(default_factory=list)
+
+    def record_fight(self, monster: str, level: int, outcome: str):
+        counts = self.fights.get((monster, level))
+        if counts is None:
+            counts = self.fights[monster, level] = [0] * len(OUTCOMES)
+        counts[OUTCOMES.index(outcome)] += 1
+
+    def merge(self, other: "MonteCarloStats"):
+        self.runs += other.runs
+        self.steps += other.steps
+        self.dragon_slain += other.dragon_slain
+        for key, counts in other.fights.items():
+            mine = self.fights.setdefault(key, [0] * len(OUTCOMES))
+            for index, count in enumerate(counts):
+                mine[index] += count
+        for level, steps in other.level_steps.items():
+            self.level_steps.setdefault(level, Counter()).update(steps)
+        if len(other.gold_curve) > len(self.gold_curve):
+            self.gold_curve.extend([0] * (len(other.gold_curve) - len(self.gold_curve)))
+        for index, gold in enumerate(other.gold_curve):
+            self.gold_curve[index] += gold
+
+    def win_rate(self, monster: str, level: int) -> Optional[float]:
+        """monster와 level에서 시작한 전투 중 이긴 비율 (전투가 없으면 None)"""
+        counts = self.fights.get((monster, level))
+        return counts[0] / sum(counts) if counts else None
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "runs": self.runs,
+            "steps": self.steps,
+            "dragon_slain": self.dragon_slain,
+            "fights": {f"{monster}@{level}": dict(zip(OUTCOMES, counts))
+                       for (monster, level), counts in sorted(self.fights.items())},
+            "level_steps": {level: {"reached": sum(steps.values()), "p50": percentile(steps, 0.5),
+                                    "p90": percentile(steps, 0.9)}
+                            for level, steps in sorted(self.level_steps.items())},
+            "gold_curve": {index * CURVE_EVERY: gold / self.runs for index, gold in enumerate(self.gold_curve)}
+            if self.runs else {},
+        }
+
+
+class Shard(NamedTuple):
+    index: int
+    first_run: int
+    runs: int
+    seed: int
+    policy: BotPolicy
+    world_path: Optional[str] = None
+
+
+def run_seed(base_seed: int, run: int) -> int:
+    """런 번호별 시드 (기본 시드와 런 번호로만 정해짐)"""
+    return (base_seed << 32) | run
+
+
+def shards(runs: int, seed: int, policy: BotPolicy, shard_size: int = SHARD_SIZE,
+           world_path: Optional[str] = None) -> Iterator[Shard]:
+    for index, first in enumerate(range(0, runs, shard_size)):
+        yield Shard(index, first, min(shard_size, runs - first), seed, policy, world_path)
+
+
+class Bot:
+    """GameState 하나를 정책대로 플레이하며 통계에 기록"""
+
+    def __init__(self, game: GameState, policy: BotPolicy, stats: MonteCarloStats):
+        self.game = game
+        self.policy = policy
+        self.stats = stats
+        self.steps = 0
+        self.fight_level = 0  # 지금 전투를 시작한 레벨
+        self.gold_curve: List[int] = []
+        self.hunt: Optional[str] = None  # 사냥하러 가는 방 (도착하면 다시 고름)
+        self.monster_rooms = [room_id for room_id, room in game.world.rooms.items()
+                              if room.monsters and room_id != policy.boss_room]
+
+    def play(self) -> bool:
+        """max_steps 동안 또는 보스를 쓰러뜨릴 때까지 플레이, 보스를 쓰러뜨렸으면 True"""
+        game = self.game
+        self.stats.level_steps.setdefault(game.player_level, Counter())[0] += 1
+        while self.steps < self.policy.max_steps:
+            if game.in_combat:
+                if self.fight() and game.current_room_id == self.policy.boss_room:
+                    return True
+            else:
+                self.explore()
+        return False
+
+    def step(self):
+        self.steps += 1
+        if self.steps % CURVE_EVERY == 0:
+            self.gold_curve.append(self.game.player_gold)
+
+    def fight(self) -> bool:
+        """전투 한 걸음, 몬스터를 쓰러뜨렸으면 True"""
+        game = self.game
+        policy = self.policy
+        monster = game.current_monster
+        potions = game.inventory.by_type(ItemType.POTION)
+        if game.player_hp < game.player_max_hp * policy.potion_below and potions:
+            game.use_item(potions[0])
+            self.step()
+            return False
+        if game.player_hp < game.player_max_hp * policy.flee_below:
+            game.flee_combat()
+            self.step()
+            if not game.in_combat:
+                self.stats.record_fight(monster.name, self.fight_level, "fled")
+                self.hunt = None  # 이기지 못한 사냥터는 다시 고름
+            return False
+
+        level = game.player_level
+        game.attack_monster()
+        self.step()
+        if game.in_combat:
+            return False
+        won = monster.hp <= 0
+        self.stats.record_fight(monster.name, self.fight_level, "win" if won else "defeated")
+        for reached in range(level + 1, game.player_level + 1):
+            self.stats.level_steps.setdefault(reached, Counter())[self.steps] += 1
+        if won and game.current_room_id == self.policy.boss_room:
+            self.stats.dragon_slain += 1
+        return won
+
+    def explore(self):
+        """전투 밖 한 걸음: 아이템 줍기/장착, 쉬기, 보스 도전, 사냥터로 이동"""
+        game = self.game
+        policy = self.policy
+        start_room_id = game.world.start_room_id
+        if game.get_room_items():
+            game.pick_up_all()
+            self.equip_best()
+            self.step()
+        elif game.player_hp < game.player_max_hp * policy.rest_below:
+            if game.get_current_room().is_safe or game.current_room_id == start_room_id:
+                game.regenerate(REST_HP)
+                self.step()
+            else:
+                self.walk_toward(start_room_id)
+        elif game.player_level >= policy.dragon_level or not self.monster_rooms:
+            self.walk_toward(policy.boss_room)  # 사냥터가 없는 월드는 바로 보스에 도전
+        else:
+            if self.hunt is None or self.hunt == game.current_room_id:
+                self.hunt = game.rng.choice(self.monster_rooms)
+            if not self.walk_toward(self.hunt):
+                self.hunt = None  # 갈 수 없는 사냥터는 다시 고름
+
+    def walk_toward(self, destination: str) -> bool:
+        """destination 쪽으로 한 칸 이동 (이미 있으면 그 방의 몬스터를 찾음)
+
+        가는 길이 없으면 움직이지 않고 지금 방의 몬스터를 찾은 뒤 False
+        """
+        game = self.game
+        reachable = True
+        if game.current_room_id != destination:
+            direction = game.world.routes.next_hop(game.current_room_id, destination)
+            if direction is None:
+                reachable = False
+            else:
+                game.move(direction)
+        if game.check_room_events():
+            self.fight_level = game.player_level
+        self.step()
+        return reachable
+
+    def equip_best(self):
+        game = self.game
+        weapons = game.inventory.by_type(ItemType.WEAPON)
+        if weapons:
+            best = max(weapons, key=lambda item: item.attack)
+            if best is not game.equipped_weapon:
+                game.use_item(best)
+        armors = game.inventory.by_type(ItemType.ARMOR)
+        if armors:
+            best = max(armors, key=lambda item: item.defense)
+            if best is not game.equipped_armor:
+                game.use_item(best)
+
+
+def play(world: World, seed: int, policy: BotPolicy, stats: MonteCarloStats) -> GameState:
+    """시드 하나로 한 번 플레이하고 stats에 더함"""
+    game = GameState(world, seed)
+    bot = Bot(game, policy, stats)
+    bot.play()
+    curve = bot.gold_curve
+    points = policy.max_steps // CURVE_EVERY
+    curve.extend([game.player_gold] * (points - len(curve)))
+    if len(stats.gold_curve) < points:
+        stats.gold_curve.extend([0] * (points - len(stats.gold_curve)))
+    for index, gold in enumerate(curve):
+        stats.gold_curve[index] += gold
+    stats.runs += 1
+    stats.steps += bot.steps
+    return game
+
+
+def run_shard(shard: Shard) -> MonteCarloStats:
+    """샤드 하나 실행 (워커 프로세스에서 호출, 월드는 프로세스마다 한 번 읽음)"""
+    if shard.world_path:
+        from world_data import load_world
+        world = load_world(shard.world_path)
+    else:
+        world = World.default()
+    if shard.policy.boss_room not in world:
+        raise ValueError(f"월드에 보스 방이 없습니다: {shard.policy.boss_room!r} (--boss-room으로 지정)")
+    stats = MonteCarloStats()
+    for run in range(shard.first_run, shard.first_run + shard.runs):
+        play(world, run_seed(shard.seed, run), shard.policy, stats)
+    return stats
+
+
+def simulate(runs: int, seed: int = 0, policy: BotPolicy = BotPolicy(), workers: Optional[int] = None,
+             shard_size: int = SHARD_SIZE, world_path: Optional[str] = None) -> MonteCarloStats:
+    """runs번 플레이를 샤드로 나눠 workers개 프로세스에서 실행하고 합친 통계 반환 (workers=1이면 현재 프로세스)"""
+    jobs = list(shards(runs, seed, policy, shard_size, world_path))
+    total = MonteCarloStats()
+    if workers == 1:
+        for stats in map(run_shard, jobs):
+            total.merge(stats)
+        return total
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for stats in pool.map(run_shard, jobs):
+            total.merge(stats)
+    return total
+
+
+def percentile(counter: Counter, fraction: float) -> Optional[int]:
+    """값 → 횟수 분포의 fraction 백분위 값"""
+    total = sum(counter.values())
+    if not total:
+        return None
+    seen = 0
+    for value in sorted(counter):
+        seen += counter[value]
+        if seen >= fraction * total:
+            return value
+    return None
+
+
+def report(stats: MonteCarloStats, policy: BotPolicy) -> List[str]:
+    """드래곤 도전 결과, 몬스터별 승률, 레벨 도달 걸음 수, 골드 곡선 요약"""
+    runs = stats.runs
+    if not runs:
+        return ["실행한 플레이가 없습니다."]
+    lines = [f"플레이 {runs:,}회, 평균 {stats.steps / runs:,.0f}걸음, 보스 처치 {stats.dragon_slain / runs:.1%} "
+             f"({policy.boss_room}, 레벨 {policy.dragon_level}부터 도전)", "",
+             f"{'몬스터':<6} {'레벨':>4} {'전투':>8} {'승리':>7} {'도망':>7} {'패배':>7}"]
+    for (monster, level), counts in sorted(stats.fights.items(), key=lambda fight: (fight[0][0], fight[0][1])):
+        fights = sum(counts)
+        rates = " ".join(f"{count / fights:7.1%}" for count in counts)
+        lines.append(f"{monster:<6} {level:>4} {fights:>8,} {rates}")
+
+    lines += ["", f"{'레벨':>4} {'도달':>7} {'p50 걸음':>9} {'p90 걸음':>9}"]
+    for level, steps in sorted(stats.level_steps.items()):
+        lines.append(f"{level:>4} {sum(steps.values()) / runs:7.1%} {percentile(steps, 0.5):>9,} "
+                     f"{percentile(steps, 0.9):>9,}")
+
+    curve = stats.gold_curve
+    every = max(1, len(curve) // 10)
+    marks = range(every - 1, len(curve), every)
+    lines += ["", "평균 골드: " + ", ".join(f"{(index + 1) * CURVE_EVERY}걸음 {curve[index] / runs:,.0f}"
+                                         for index in marks)]
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description="몬테카를로 플레이 시뮬레이터")
+    parser.add_argument("--runs", type=int, default=10_000, help="플레이 횟수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="워커 프로세스 수 (1이면 현재 프로세스)")
+    parser.add_argument("--seed", type=int, default=0, help="기본 시드 (런 i의 시드는 (seed << 32) | i)")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="샤드 하나의 플레이 수")
+    parser.add_argument("--max-steps", type=int, default=MAX_STEPS, help="플레이 하나의 최대 걸음 수")
+    parser.add_argument("--dragon-level", type=int, default=BotPolicy.dragon_level, help="보스 방에 도전하는 레벨")
+    parser.add_argument("--boss-room", default=BotPolicy.boss_room, help="도전할 보스 방 id (--world를 쓰면 그 월드의 방)")
+    parser.add_argument("--flee-below", type=float, default=BotPolicy.flee_below, help="도망치는 체력 비율")
+    parser.add_argument("--world", help="월드 파일 (기본값: data/world.json)")
+    parser.add_argument("--json", help="통계를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    policy = BotPolicy(dragon_level=args.dragon_level, boss_room=args.boss_room, flee_below=args.flee_below,
+                       max_steps=args.max_steps)
+    start = time.perf_counter()
+    try:
+        stats = simulate(args.runs, args.seed, policy, args.workers, args.shard_size, args.world)
+    except ValueError as e:
+        parser.error(str(e))
+    elapsed = time.perf_counter() - start
+
+    print("\n".join(report(stats, policy)))
+    print(f"\n{elapsed:.2f}초, 워커 {args.workers}개 ({stats.runs / elapsed:,.0f} 플레이/초, "
+          f"{stats.steps / elapsed:,.0f} 걸음/초)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(stats.to_dict(), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 세션 기록 재실행
+시드와 명령어 목록으로 기록된 세션을 렌더링 없이 다시 실행하고 최종 상태 해시를 비교
+
+    python replay.py sessions.jsonl [--world data/world.json] [--fail-fast]
+
+기록 파일은 한 줄에 세션 하나: {"seed": 1, "commands": ["북", "공격"], "hash": "..."}
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+from commands import COMMANDS, CommandTable
+from game_core import GameState, World
+from save import snapshot_state
+
+
+def state_hash(game: GameState) -> str:
+    """게임 상태 해시 (난수 내부 상태 제외, 같은 진행이면 프로세스가 달라도 같은 값)"""
+    data = snapshot_state(game)
+    del data["rng"]
+    return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class Recording:
+    seed: int
+    commands: List[str]
+    hash: str = ""  # 기록 당시 최종 상태 해시
+
+
+def run(seed: int, commands: Iterable[str], world: Optional[World] = None,
+        table: CommandTable = COMMANDS) -> GameState:
+    """명령어 목록을 새 세션에서 순서대로 실행"""
+    game = GameState(world, seed)
+    dispatch = table.dispatch
+    for command in commands:
+        dispatch(game, command)
+    return game
+
+
+def record(seed: int, commands: List[str], world: Optional[World] = None) -> Recording:
+    """명령어 목록을 실행해 최종 해시와 함께 기록"""
+    return Recording(seed, list(commands), state_hash(run(seed, commands, world)))
+
+
+def from_session(session) -> Recording:
+    """기록 모드 엔진(Engine(record=True))의 세션으로 Recording 생성
+
+    공유 몬스터 스폰(Engine(spawns=...))이 있는 세션은 다른 세션과 월드 틱에 따라 결과가 달라져 재실행할 수 없으므로 ValueError
+    """
+    if session.game.spawns is not None:
+        raise ValueError("공유 몬스터 스폰이 있는 엔진의 세션은 기록해 재실행할 수 없습니다 (Engine(spawns=None)으로 기록)")
+    return Recording(session.game.seed, list(session.history), state_hash(session.game))
+
+
+def verify(recording: Recording, world: Optional[World] = None) -> bool:
+    """재실행한 최종 상태가 기록과 같은지 확인"""
+    return state_hash(run(recording.seed, recording.commands, world)) == recording.hash
+
+
+def save_recordings(path: Union[str, Path], recordings: Iterable[Recording]):
+    with open(path, "w", encoding="utf-8") as f:
+        for recording in recordings:
+            f.write(json.dumps(asdict(recording), ensure_ascii=False) + "\n")
+
+
+def load_recordings(path: Union[str, Path]) -> Iterator[Recording]:
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield Recording(**json.loads(line))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="세션 기록 재실행 및 검증")
+    parser.add_argument("recordings", help="기록 파일 (JSON Lines)")
+    parser.add_argument("--world", help="월드 파일 (기본값: data/world.json)")
+    parser.add_argument("--fail-fast", action="store_true", help="첫 불일치에서 중단")
+    args = parser.parse_args()
+
+    world = None
+    if args.world:
+        from world_data import load_world
+        world = load_world(args.world)
+
+    sessions = commands = 0
+    mismatches: List[int] = []
+    start = time.perf_counter()
+    for index, recording in enumerate(load_recordings(args.recordings), 1):
+        sessions += 1
+        commands += len(recording.commands)
+        if not verify(recording, world):
+            mismatches.append(index)
+            print(f"불일치: {index}번째 세션 (seed={recording.seed}, 명령어 {len(recording.commands)}개)")
+            if args.fail_fast:
+                break
+    elapsed = time.perf_counter() - start
+
+    print(f"세션 {sessions:,}개, 명령어 {commands:,}개를 {elapsed:.2f}초에 재실행 "
+          f"({commands / elapsed if elapsed else 0:,.0f} 명령어/초), 불일치 {len(mismatches)}개")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
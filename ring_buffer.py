@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 원형 버퍼
+용량이 고정된 줄 목록, 가득 차면 가장 오래된 줄을 덮어씀 (추가와 인덱스 조회 모두 O(1))
+"""
+
+from typing import Generic, Iterable, Iterator, List, TypeVar
+
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """최근 capacity개 항목만 보관하는 원형 버퍼"""
+
+    __slots__ = ("capacity", "_items", "_start", "_size")
+
+    def __init__(self, capacity: int):
+        if capacity < 1:
+            raise ValueError("capacity는 1 이상이어야 합니다")
+        self.capacity = capacity
+        self._items: List[T] = []  # 가득 찰 때까지는 그냥 늘어나는 리스트
+        self._start = 0  # 가장 오래된 항목의 위치
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError(index)
+        index += self._start
+        if index >= self.capacity:
+            index -= self.capacity
+        return self._items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        items, start = self._items, self._start
+        yield from items[start:]
+        yield from items[:start]
+
+    def append(self, item: T):
+        if self._size < self.capacity:
+            self._items.append(item)
+            self._size += 1
+        else:
+            self._items[self._start] = item
+            self._start = (self._start + 1) % self.capacity
+
+    def extend(self, items: Iterable[T]):
+        items = list(items)
+        capacity = self.capacity
+        if len(items) >= capacity:
+            # 새 항목만으로 가득 차면 이전 내용은 모두 버림
+            self._items = items[-capacity:]
+            self._start = 0
+            self._size = capacity
+            return
+        room = capacity - self._size
+        if room:
+            self._items.extend(items[:room])
+            self._size += min(room, len(items))
+            items = items[room:]
+        if items:
+            # 가득 찬 상태: 가장 오래된 항목부터 덮어씀 (최대 두 구간)
+            start = self._start
+            end = start + len(items)
+            if end <= capacity:
+                self._items[start:end] = items
+            else:
+                split = capacity - start
+                self._items[start:] = items[:split]
+                self._items[:end - capacity] = items[split:]
+            self._start = end % capacity
+
+    def tail(self, count: int) -> List[T]:
+        """가장 최근 count개 항목 (오래된 것부터)"""
+        count = min(count, self._size)
+        return [self[i] for i in range(self._size - count, self._size)]
+
+    def clear(self):
+        self._items = []
+        self._start = 0
+        self._size = 0
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 경로 색인
+목적지마다 역방향 BFS로 "다음에 갈 방향" 테이블을 만들어 두고 한 걸음당 O(1)로 조회
+출구가 바뀌면 영향을 받는 테이블만 고치거나 버린다
+"""
+
+from collections import OrderedDict, deque
+from typing import Dict, List, Optional, Tuple
+
+from game_core import EXIT_DIRECTIONS, NO_EXIT, Direction, World
+
+
+class RouteTable:
+    """목적지 하나에 대한 방 → (다음 방향, 남은 거리) 테이블"""
+
+    __slots__ = ("destination", "next_hop", "distance")
+
+    def __init__(self, destination: str):
+        self.destination = destination
+        self.next_hop: Dict[str, Direction] = {}
+        self.distance: Dict[str, int] = {destination: 0}
+
+
+class RouteIndex:
+    """월드의 출구 그래프에 대한 목적지별 다음 칸 테이블 캐시"""
+
+    def __init__(self, world: World, max_tables: int = 64):
+        self.world = world
+        self.max_tables = max_tables
+        self._tables: "OrderedDict[str, RouteTable]" = OrderedDict()
+        self._incoming: Optional[Dict[str, List[Tuple[str, Direction]]]] = None
+
+    def _incoming_edges(self) -> Dict[str, List[Tuple[str, Direction]]]:
+        """방마다 들어오는 출구 목록 (처음 필요할 때 한 번 구성)"""
+        if self._incoming is None:
+            room_ids = self.world.exit_table.room_ids
+            incoming: Dict[str, List[Tuple[str, Direction]]] = {room_id: [] for room_id in room_ids}
+            width = len(EXIT_DIRECTIONS)
+            for slot, target in enumerate(self.world.exit_table.targets):
+                if target != NO_EXIT:
+                    incoming[room_ids[target]].append((room_ids[slot // width], EXIT_DIRECTIONS[slot % width]))
+            self._incoming = incoming
+        return self._incoming
+
+    def table(self, destination: str) -> RouteTable:
+        """목적지 테이블 (없으면 역방향 BFS로 생성, 최근 사용 순으로 max_tables개 유지)"""
+        table = self._tables.get(destination)
+        if table is not None:
+            self._tables.move_to_end(destination)
+            return table
+
+        table = RouteTable(destination)
+        self._propagate(table, deque([destination]))
+        self._tables[destination] = table
+        if len(self._tables) > self.max_tables:
+            self._tables.popitem(last=False)
+        return table
+
+    def _propagate(self, table: RouteTable, queue: deque):
+        """queue의 방들에서 역방향으로 더 짧아진 거리를 퍼뜨림"""
+        incoming = self._incoming_edges()
+        distance, next_hop = table.distance, table.next_hop
+        while queue:
+            room_id = queue.popleft()
+            step = distance[room_id] + 1
+            for source, direction in incoming[room_id]:
+                if step < distance.get(source, step + 1):
+                    distance[source] = step
+                    next_hop[source] = direction
+                    queue.append(source)
+
+    def next_hop(self, room_id: str, destination: str) -> Optional[Direction]:
+        """room_id에서 destination으로 가려면 다음에 갈 방향 (길이 없거나 이미 도착했으면 None)"""
+        return self.table(destination).next_hop.get(room_id)
+
+    def path(self, source: str, destination: str) -> Optional[List[Direction]]:
+        """source → destination 방향 목록 (길이 없으면 None)"""
+        table = self.table(destination)
+        if source not in table.distance:
+            return None
+        path: List[Direction] = []
+        room_id = source
+        while room_id != destination:
+            direction = table.next_hop[room_id]
+            path.append(direction)
+            room_id = self.world[room_id].exits[direction]
+        return path
+
+    def exit_added(self, room_id: str, direction: Direction, target: str):
+        """출구 추가 반영: 거리가 줄어드는 테이블만 그 부분부터 다시 퍼뜨림"""
+        if self._incoming is not None:
+            self._incoming[target].append((room_id, direction))
+        for table in self._tables.values():
+            if target not in table.distance:
+                continue
+            step = table.distance[target] + 1
+            if step < table.distance.get(room_id, step + 1):
+                table.distance[room_id] = step
+                table.next_hop[room_id] = direction
+                self._propagate(table, deque([room_id]))
+
+    def exit_removed(self, room_id: str, direction: Direction, target: str):
+        """출구 제거 반영: 그 출구를 경로로 쓰던 테이블만 버림 (다음 조회 때 다시 생성)"""
+        if self._incoming is not None:
+            self._incoming[target].remove((room_id, direction))
+        stale = [destination for destination, table in self._tables.items()
+                 if table.next_hop.get(room_id) is direction]
+        for destination in stale:
+            del self._tables[destination]
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 저장/불러오기
+GameState를 작은 바이너리 스냅샷(marshal)으로 저장하고, 그 뒤에 실행한 명령어는 추가 전용 저널에 기록한다
+불러올 때는 마지막 스냅샷을 복원한 뒤 저널의 나머지 명령어를 다시 실행한다
+게임에 자기 몬스터 스폰이 붙어 있으면 스폰 상태도 스냅샷에 넣고, 저널에는 명령어를 실행한 월드 틱을 함께 적어
+다시 실행할 때 그 틱까지 월드를 진행한다 (리스폰/배회, 체력 회복이 같은 시점에 일어남)
+
+    <경로>.snap     스냅샷 (원자적 교체)
+    <경로>.journal  "순번\\t명령어" 또는 "순번@월드틱\\t명령어" 줄 목록 (스냅샷을 저장하면 비움)
+"""
+
+import marshal
+import os
+import random
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+
+from commands import COMMANDS, CommandTable
+from game_core import GameState, Monster, World
+from inventory import Inventory
+from spawns import MonsterSpawns, attach_spawns
+
+
+DEFAULT_SAVE_PATH = Path(__file__).resolve().parent / "saves" / "player"
+MAGIC = b"MUDS"
+SNAPSHOT_VERSION = 6  # 스냅샷 형식이 바뀌면 올린다
+PLAYER_FIELDS = (
+    "player_level", "player_hp", "player_max_hp", "player_exp", "player_exp_needed",
+    "player_attack", "player_defense", "player_gold",
+)
+
+
+class SaveDataError(ValueError):
+    """스냅샷을 읽을 수 없음 (손상, 다른 버전, 다른 월드)"""
+
+
+class JournalRecord(NamedTuple):
+    """저널 한 줄 (tick은 명령어를 실행한 월드 틱 GameState.world_ticks, 틱 없이 기록한 줄이면 None)"""
+    seq: int
+    command: str
+    tick: Optional[int] = None
+
+
+def snapshot_state(game: GameState, seq: int = 0) -> Dict[str, Any]:
+    """GameState를 marshal로 저장할 수 있는 기본 타입 데이터로 변환"""
+    key_of = game.world.key_of
+    monster = game.current_monster
+    return {
+        "seq": seq,
+        "player": tuple(getattr(game, field) for field in PLAYER_FIELDS),
+        "room": game.current_room_id,
+        "inventory": [(key_of(item), count) for item, count in game.inventory.stacks()],
+        "weapon": key_of(game.equipped_weapon) if game.equipped_weapon else None,
+        "armor": key_of(game.equipped_armor) if game.equipped_armor else None,
+        "room_items": {room_id: [(key_of(item), count) for item, count in items.stacks()]
+                       for room_id, items in game.room_items.items()},
+        "in_combat": game.in_combat,
+        "monster": (key_of(monster.template), monster.hp) if monster else None,
+        "seed": game.seed,
+        "world_ticks": game.world_ticks,
+        "rng": game._rng.getstate() if game._rng is not None else None,
+        "spawns": game.spawns.snapshot() if game.spawns is not None else None,
+    }
+
+
+def restore_state(data: Dict[str, Any], world: Optional[World] = None) -> GameState:
+    """snapshot_state 데이터로 GameState 복원"""
+    game = GameState(world, data["seed"])
+    game.world_ticks = data["world_ticks"]
+    if data["rng"] is not None:
+        version, internal, gauss = data["rng"]
+        game._rng = random.Random()
+        game._rng.setstate((version, tuple(internal), gauss))
+    items, monsters = game.world.items, game.world.monsters
+    try:
+        for field, value in zip(PLAYER_FIELDS, data["player"]):
+            setattr(game, field, value)
+        if data["room"] not in game.world:
+            raise KeyError(data["room"])
+        game.current_room_id = data["room"]
+        for key, count in data["inventory"]:
+            game.inventory.add(items[key], count)
+        game.equipped_weapon = items[data["weapon"]] if data["weapon"] else None
+        game.equipped_armor = items[data["armor"]] if data["armor"] else None
+        for room_id, stacks in data["room_items"].items():
+            game.room_items[room_id] = room_items = Inventory()
+            room_items.add_stacks((items[key], count) for key, count in stacks)
+        game.in_combat = data["in_combat"]
+        if data["monster"] is not None:
+            key, hp = data["monster"]
+            game.current_monster = Monster(monsters[key], hp)
+        if data["spawns"] is not None:
+            game.spawns = MonsterSpawns.restore(game.world, data["spawns"])
+    except KeyError as e:
+        raise SaveDataError(f"월드에 없는 데이터 키: {e.args[0]!r}") from None
+    return game
+
+
+def dump_snapshot(game: GameState, seq: int = 0) -> bytes:
+    return MAGIC + bytes([SNAPSHOT_VERSION]) + marshal.dumps(snapshot_state(game, seq))
+
+
+def load_snapshot(raw: bytes, world: Optional[World] = None) -> Tuple[GameState, int]:
+    """스냅샷 바이트로 (GameState, 순번) 복원"""
+    if raw[:4] != MAGIC or raw[4:5] != bytes([SNAPSHOT_VERSION]):
+        raise SaveDataError("스냅샷 형식이 아니거나 다른 버전입니다")
+    try:
+        data = marshal.loads(raw[5:])
+    except (EOFError, ValueError, TypeError):
+        raise SaveDataError("스냅샷이 손상되었습니다") from None
+    return restore_state(data, world), data["seq"]
+
+
+class SaveFile:
+    """스냅샷 + 명령어 저널 한 쌍 (플레이어 한 명의 저장 슬롯)"""
+
+    def __init__(self, path: Union[str, Path], checkpoint_every: int = 100,
+                 commands: Optional[CommandTable] = None):
+        path = Path(path)
+        self.snapshot_path = path.with_name(path.name + ".snap")
+        self.journal_path = path.with_name(path.name + ".journal")
+        self.checkpoint_every = checkpoint_every
+        self.commands = commands if commands is not None else COMMANDS
+        self.seq = 0  # 지금까지 적용한 명령어 수
+        self.snapshot_seq = 0  # 마지막 스냅샷 시점의 seq
+        self._journal = None
+
+    def load(self, world: Optional[World] = None, spawns: bool = False) -> GameState:
+        """마지막 스냅샷 복원 후 저널 재실행 (저장된 것이 없으면 새 게임)
+
+        spawns가 True면 게임에 자기 몬스터 스폰을 붙이고 (스냅샷에 있으면 그 상태로) 저널의 월드 틱을 따라 진행
+        """
+        try:
+            game, self.seq = load_snapshot(self.snapshot_path.read_bytes(), world)
+            snapshot_found = True
+        except FileNotFoundError:
+            game, self.seq = GameState(world), 0
+            snapshot_found = False
+        self.snapshot_seq = self.seq
+        if spawns and game.spawns is None:
+            attach_spawns(game)
+        for seq, command, tick in self.read_journal():
+            if seq > self.seq:
+                while tick is not None and game.world_ticks < tick:
+                    game.world_tick()
+                self.commands.dispatch(game, command)
+                self.seq = seq
+        if not snapshot_found:
+            self.checkpoint(game)  # 새 게임의 시드를 저장해야 저널을 같은 난수로 다시 실행할 수 있음
+        return game
+
+    def read_journal(self) -> List[JournalRecord]:
+        """저널 기록 목록 (마지막 줄이 쓰다 만 줄이면 무시)"""
+        try:
+            text = self.journal_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in text.split("\n")[:-1]:
+            seq, _, command = line.partition("\t")
+            seq, _, tick = seq.partition("@")
+            records.append(JournalRecord(int(seq), command, int(tick) if tick else None))
+        return records
+
+    def record(self, game: GameState, command: str):
+        """적용한 명령어를 저널에 추가, checkpoint_every개마다 스냅샷 저장"""
+        self.seq += 1
+        if self._journal is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal.write(f"{self.seq}@{game.world_ticks}\t{command}\n")
+        self._journal.flush()
+        if self.seq - self.snapshot_seq >= self.checkpoint_every:
+            self.checkpoint(game)
+
+    def checkpoint(self, game: GameState):
+        """스냅샷 저장 후 저널 비우기"""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(dump_snapshot(game, self.seq))
+        os.replace(tmp_path, self.snapshot_path)
+        self.snapshot_seq = self.seq
+        # 비우기 전에 중단되어도 스냅샷 순번 이하의 기록은 불러올 때 건너뛴다
+        if self._journal is not None:
+            self._journal.seek(0)
+            self._journal.truncate()
+        elif self.journal_path.exists():
+            self.journal_path.write_bytes(b"")
+
+    def close(self):
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
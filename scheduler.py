@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 월드 틱 스케줄러
+계층형 타이밍 휠: 타이머 등록/취소 O(1), 틱마다 드는 비용은 전체 타이머 수가 아니라 만기된 타이머 수에 비례
+"""
+
+from operator import attrgetter
+from typing import Any, Callable, List
+
+
+TICK_SECONDS = 0.1  # 월드 틱 간격 (초당 10틱)
+WHEEL_BITS = 8  # 단계마다 칸 수 2**8 = 256
+WHEEL_LEVELS = 4  # 256**4 틱(약 13.6년)까지 한 휠에 담음
+
+_by_seq = attrgetter("seq")
+
+
+class Timer:
+    """등록된 타이머 (cancel()로 취소, 취소된 타이머는 만기 때 건너뜀)"""
+
+    __slots__ = ("due", "seq", "callback", "args", "cancelled")
+
+    def __init__(self, due: int, seq: int, callback: Callable[..., Any], args: tuple):
+        self.due = due
+        self.seq = seq  # 등록 순번 (같은 틱에 만기되면 먼저 등록한 것부터 실행)
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class TimerWheel:
+    """틱 단위 계층형 타이밍 휠
+
+    0단계는 앞으로 256틱 안에 만기될 타이머를 틱별 칸에, 위 단계는 256배씩 넓은 칸에 담는다.
+    0단계가 한 바퀴 돌 때마다 윗단계의 다음 칸을 아래로 내려 다시 나눈다 (타이머당 최대 단계 수만큼).
+    """
+
+    def __init__(self):
+        self.now = 0
+        self._size = 1 << WHEEL_BITS
+        self._mask = self._size - 1
+        self._wheels: List[List[List[Timer]]] = [[[] for _ in range(self._size)] for _ in range(WHEEL_LEVELS)]
+        self._count = 0  # 등록된 타이머 수 (취소된 것 포함, 만기 때 빠짐)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, delay: int, callback: Callable[..., Any], *args) -> Timer:
+        """delay틱 뒤에 callback(*args) 실행 예약 (1틱 미만은 다음 틱)"""
+        self._seq += 1
+        timer = Timer(self.now + max(1, delay), self._seq, callback, args)
+        self._insert(timer)
+        self._count += 1
+        return timer
+
+    def _insert(self, timer: Timer):
+        level = min(((timer.due - self.now) | 1).bit_length() - 1, WHEEL_BITS * WHEEL_LEVELS - 1) // WHEEL_BITS
+        self._wheels[level][(timer.due >> (WHEEL_BITS * level)) & self._mask].append(timer)
+
+    def _cascade(self, level: int):
+        """level단계의 지금 칸을 비우고 타이머를 아래 단계로 다시 나눔"""
+        if level + 1 < WHEEL_LEVELS and not (self.now >> (WHEEL_BITS * level)) & self._mask:
+            self._cascade(level + 1)
+        slot = self._wheels[level]
+        index = (self.now >> (WHEEL_BITS * level)) & self._mask
+        timers, slot[index] = slot[index], []
+        for timer in timers:
+            self._insert(timer)
+
+    def tick(self) -> int:
+        """한 틱 진행 후 만기된 타이머 실행, 실행한 수 반환"""
+        self.now += 1
+        if not self.now & self._mask:
+            self._cascade(1)
+        slot = self._wheels[0]
+        index = self.now & self._mask
+        due, slot[index] = slot[index], []
+        self._count -= len(due)
+        if len(due) > 1:
+            # 칸 안의 순서는 어느 단계에서 내려왔는지에 따라 다르므로 등록 순서로 맞춤 (저장 후 복원해도 같은 순서)
+            due.sort(key=_by_seq)
+        fired = 0
+        for timer in due:
+            if not timer.cancelled:
+                timer.callback(*timer.args)
+                fired += 1
+        return fired
+
+    def pending(self) -> List[Timer]:
+        """취소되지 않은 대기 타이머 (등록 순)"""
+        timers = [timer for wheel in self._wheels for slot in wheel for timer in slot if not timer.cancelled]
+        return sorted(timers, key=_by_seq)
+
+    def advance(self, ticks: int = 1) -> int:
+        """ticks만큼 진행, 실행한 타이머 수 반환"""
+        return sum(self.tick() for _ in range(ticks))
+
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 멀티플레이어 서버
+asyncio 기반 줄 단위(텔넷 호환) TCP 서버, 접속마다 독립된 세션
+
+    python server.py [--host 127.0.0.1] [--port 4000]
+"""
+
+import argparse
+import asyncio
+from typing import Dict, List, Optional
+
+from engine import Engine, Event
+from game_core import World
+from game_loop import TickLoop
+from metrics import CommandMetrics
+from spawns import MonsterSpawns
+
+
+ENCODING = "utf-8"
+NEWLINE = "\r\n"
+PROMPT = b"> "
+MAX_LINE_BYTES = 4096  # 명령어 한 줄 최대 길이 (넘으면 접속을 끊음)
+MAX_BUFFERED_BYTES = 256 * 1024  # 다른 플레이어 알림이 이만큼 쌓여도 못 받는 느린 접속은 끊음
+LINE_TOO_LONG = "입력 줄이 너무 깁니다. 접속을 끊습니다."
+WELCOME = [
+    "환상의 세계 MUD에 오신 것을 환영합니다!",
+    "도움말을 보려면 '도움말'을 입력하세요.",
+]
+
+IAC = 255  # 텔넷 명령 시작 바이트
+SB, SE = 250, 240  # 하위 협상 시작/끝
+WILL, WONT, DO, DONT = 251, 252, 253, 254
+
+
+def strip_telnet(data: bytes) -> bytes:
+    """텔넷 협상 바이트 제거"""
+    if IAC not in data:
+        return data
+    out = bytearray()
+    i = 0
+    while i < len(data):
+        byte = data[i]
+        if byte != IAC:
+            out.append(byte)
+            i += 1
+            continue
+        command = data[i + 1] if i + 1 < len(data) else None
+        if command == IAC:
+            out.append(IAC)
+            i += 2
+        elif command in (WILL, WONT, DO, DONT):
+            i += 3
+        elif command == SB:
+            end = data.find(bytes([IAC, SE]), i + 2)
+            i = len(data) if end == -1 else end + 2
+        else:
+            i += 2
+    return bytes(out)
+
+
+def encode_lines(lines: List[str]) -> bytes:
+    """메시지 줄 목록과 프롬프트를 전송용 바이트로 변환"""
+    if not lines:
+        return PROMPT
+    return (NEWLINE.join(lines) + NEWLINE).encode(ENCODING) + PROMPT
+
+
+class MUDServer:
+    """접속마다 Engine 세션을 하나씩 만드는 TCP 서버"""
+
+    def __init__(self, engine: Optional[Engine] = None, host: str = "127.0.0.1", port: int = 4000):
+        self.engine = engine if engine is not None else Engine()
+        self.host = host
+        self.port = port
+        self.server: Optional[asyncio.AbstractServer] = None
+        self.writers: Dict[int, asyncio.StreamWriter] = {}
+        self.ticks = TickLoop()
+        self._ticker: Optional[asyncio.Task] = None
+        if self.engine.spawns is not None:
+            # 월드 틱: 리스폰/배회로 생긴 알림은 틱마다 전송
+            wheel = self.engine.spawns.wheel
+            self.ticks.add_system("spawns", lambda tick: wheel.tick())
+            self.ticks.add_system("deliver", lambda tick: self.deliver_pending())
+
+    async def start(self) -> asyncio.AbstractServer:
+        """서버 시작 (port=0이면 임의 포트, 실제 포트는 self.port에 기록)"""
+        self.server = await asyncio.start_server(self.handle_client, self.host, self.port, backlog=4096,
+                                                 limit=MAX_LINE_BYTES)
+        self.port = self.server.sockets[0].getsockname()[1]
+        if self.ticks.systems:
+            self._ticker = asyncio.create_task(self.ticks.run())
+        return self.server
+
+    async def stop(self):
+        """서버 종료"""
+        if self._ticker is not None:
+            self._ticker.cancel()
+            self._ticker = None
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+
+    async def serve_forever(self):
+        if self.server is None:
+            await self.start()
+        async with self.server:
+            await self.server.serve_forever()
+
+    def deliver_pending(self):
+        """다른 플레이어의 행동으로 생긴 이벤트를 해당 접속자에게 전송
+
+        틱/다른 접속의 처리 중에 보내므로 drain을 기다리지 않고, 보내지 못한 데이터가
+        MAX_BUFFERED_BYTES를 넘은 접속은 끊는다 (끊긴 접속의 handle_client가 세션을 정리)
+        """
+        for other, events in self.engine.drain_pending():
+            writer = self.writers.get(other.session_id)
+            if writer is None or writer.is_closing():
+                continue
+            writer.write(encode_lines([event.text for event in events]))
+            if writer.transport.get_write_buffer_size() > MAX_BUFFERED_BYTES:
+                writer.transport.abort()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """클라이언트 한 명의 명령어 루프"""
+        session = self.engine.create_session()
+        self.writers[session.session_id] = writer
+        try:
+            writer.write(encode_lines(WELCOME))
+            await writer.drain()
+            while not session.closed:
+                try:
+                    data = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):  # MAX_LINE_BYTES를 넘는 줄
+                    writer.write(encode_lines([LINE_TOO_LONG]))
+                    await writer.drain()
+                    break
+                if not data:
+                    break
+                line = strip_telnet(data).decode(ENCODING, errors="replace")
+                events: List[Event] = self.engine.step(session, line)
+                writer.write(encode_lines([event.text for event in events]))
+                self.deliver_pending()
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.writers.pop(session.session_id, None)
+            if not session.closed:
+                self.engine.close_session(session)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="환상의 세계 MUD 멀티플레이어 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4000)
+    args = parser.parse_args()
+
+    spawns = MonsterSpawns(World.default())
+    spawns.start_wandering()
+    metrics = CommandMetrics.from_env()
+    server = MUDServer(Engine(spawns=spawns, metrics=metrics), host=args.host, port=args.port)
+    print(f"환상의 세계 MUD 서버: {args.host}:{args.port}")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print("\n".join(server.ticks.report()))
+        if metrics is not None:
+            print(f"명령어 통계: {metrics.dump()}")
+        print("서버를 종료합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 몬스터 스폰과 배회
+여러 세션이 공유하는 월드의 살아 있는 몬스터: 처치되면 스폰 지점에서 리스폰 타이머를 돌리고,
+일부 몬스터는 주기적으로 이웃 방으로 옮겨 다닌다 (모두 TimerWheel 타이머로 처리)
+혼자 하는 저장 게임은 게임마다 자기 스폰을 붙이고 스냅샷에 함께 저장한다 (attach_spawns, snapshot/restore)
+"""
+
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from game_core import GameState, MonsterTemplate, World
+from scheduler import Timer, TimerWheel
+
+
+RESPAWN_TICKS = 300  # 처치 후 리스폰까지 (30초)
+WANDER_TICKS = (200, 600)  # 배회 몬스터가 다음 방으로 옮기기까지 (20 ~ 60초)
+WANDER_CHANCE = 0.25  # 스폰 지점 중 배회하는 비율
+
+
+class Spawn:
+    """스폰 지점 하나에서 나온 몬스터 (room_id가 None이면 처치되어 리스폰 대기 중)"""
+
+    __slots__ = ("template", "home", "room_id", "wanders", "timer")
+
+    def __init__(self, template: MonsterTemplate, home: str, wanders: bool = False):
+        self.template = template
+        self.home = home
+        self.room_id: Optional[str] = home
+        self.wanders = wanders
+        self.timer: Optional[Timer] = None  # 배회 타이머
+
+
+class MonsterSpawns:
+    """월드 공유 몬스터 상태 (방 몬스터는 처음 바뀔 때만 월드 데이터에서 복사)"""
+
+    def __init__(self, world: World, wheel: Optional[TimerWheel] = None, seed: int = 0,
+                 respawn_ticks: int = RESPAWN_TICKS, wander_chance: float = WANDER_CHANCE):
+        self.world = world
+        self.wheel = wheel if wheel is not None else TimerWheel()
+        self.rng = random.Random(seed)
+        self.respawn_ticks = respawn_ticks
+        self.wander_chance = wander_chance
+        self._rooms: Dict[str, List[Spawn]] = {}
+        # 몬스터가 나타나거나 떠날 때 알림 (방 id, 메시지), 엔진은 같은 방 세션에, TUI는 로그에 전달
+        self.on_event: Optional[Callable[[str, str], None]] = None
+
+    def monsters(self, room_id: str) -> Sequence[MonsterTemplate]:
+        """방에 지금 있는 몬스터 템플릿"""
+        spawns = self._rooms.get(room_id)
+        if spawns is None:
+            return self.world[room_id].monsters
+        return tuple(spawn.template for spawn in spawns)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """marshal로 저장할 수 있는 상태 (틱, 난수, 복사한 방의 몬스터 순서, 대기 중인 리스폰/배회 타이머)"""
+        key_of = self.world.key_of
+        numbers: Dict[int, int] = {}
+        spawns = []
+
+        def number(spawn: Spawn) -> int:
+            if id(spawn) not in numbers:
+                numbers[id(spawn)] = len(spawns)
+                spawns.append((key_of(spawn.template), spawn.home, spawn.wanders))
+            return numbers[id(spawn)]
+
+        rooms = {room_id: [number(spawn) for spawn in room] for room_id, room in self._rooms.items()}
+        # 처치된 몬스터는 리스폰 타이머에만 남아 있음, 타이머는 등록 순이라 복원해도 같은 순서로 실행
+        timers = [(number(timer.args[0]), timer.due) for timer in self.wheel.pending()
+                  if timer.callback == self._wander or timer.callback == self._respawn]
+        return {"now": self.wheel.now, "rng": self.rng.getstate(), "spawns": spawns, "rooms": rooms, "timers": timers}
+
+    @classmethod
+    def restore(cls, world: World, data: Dict[str, Any], **options) -> "MonsterSpawns":
+        """snapshot 데이터로 새 휠 위에 스폰 상태 복원 (월드에 없는 키는 KeyError)"""
+        spawns = cls(world, **options)
+        spawns.wheel.now = data["now"]
+        version, internal, gauss = data["rng"]
+        spawns.rng.setstate((version, tuple(internal), gauss))
+        for room_id in {home for _, home, _ in data["spawns"]}.union(data["rooms"]):
+            if room_id not in world:
+                raise KeyError(room_id)
+        restored = []
+        for key, home, wanders in data["spawns"]:
+            spawn = Spawn(world.monsters[key], home, wanders)
+            spawn.room_id = None
+            restored.append(spawn)
+        for room_id, numbers in data["rooms"].items():
+            spawns._rooms[room_id] = room = [restored[number] for number in numbers]
+            for spawn in room:
+                spawn.room_id = room_id
+        for number, due in data["timers"]:
+            spawn = restored[number]
+            if spawn.room_id is None:
+                spawns.wheel.schedule(due - spawns.wheel.now, spawns._respawn, spawn)
+            else:
+                spawn.timer = spawns.wheel.schedule(due - spawns.wheel.now, spawns._wander, spawn)
+        return spawns
+
+    def _own(self, room_id: str) -> List[Spawn]:
+        spawns = self._rooms.get(room_id)
+        if spawns is None:
+            spawns = self._rooms[room_id] = [Spawn(template, room_id) for template in self.world[room_id].monsters]
+        return spawns
+
+    def start_wandering(self) -> int:
+        """스폰 지점 중 wander_chance 비율을 배회 몬스터로 정하고 첫 이동 타이머 등록, 등록한 수 반환"""
+        started = 0
+        for room_id, room in self.world.rooms.items():
+            if not room.monsters or room.is_safe:
+                continue
+            for spawn in self._own(room_id):
+                if not spawn.wanders and self.rng.random() < self.wander_chance:
+                    spawn.wanders = True
+                    self._schedule_wander(spawn)
+                    started += 1
+        return started
+
+    def _schedule_wander(self, spawn: Spawn):
+        spawn.timer = self.wheel.schedule(self.rng.randint(*WANDER_TICKS), self._wander, spawn)
+
+    def _wander(self, spawn: Spawn):
+        room_id = spawn.room_id
+        targets = [target for target in self.world[room_id].exits.values() if not self.world[target].is_safe]
+        if targets:
+            target = self.rng.choice(targets)
+            self._own(room_id).remove(spawn)
+            self._own(target).append(spawn)
+            spawn.room_id = target
+            self._notify(room_id, f"{spawn.template.name}이(가) 다른 곳으로 떠났습니다.")
+            self._notify(target, f"{spawn.template.name}이(가) 나타났습니다.")
+        self._schedule_wander(spawn)
+
+    def killed(self, room_id: str, template: MonsterTemplate) -> bool:
+        """방의 template 몬스터 하나를 처치 처리하고 리스폰 예약 (이미 없으면 False)"""
+        if template not in self.monsters(room_id):
+            return False
+        spawns = self._own(room_id)
+        for spawn in spawns:
+            if spawn.template is template:
+                spawns.remove(spawn)
+                spawn.room_id = None
+                if spawn.timer is not None:
+                    spawn.timer.cancel()  # 리스폰하면 다시 배회
+                    spawn.timer = None
+                self.wheel.schedule(self.respawn_ticks, self._respawn, spawn)
+                return True
+        return False
+
+    def _respawn(self, spawn: Spawn):
+        spawn.room_id = spawn.home
+        self._own(spawn.home).append(spawn)
+        self._notify(spawn.home, f"{spawn.template.name}이(가) 다시 나타났습니다.")
+        if spawn.wanders:
+            self._schedule_wander(spawn)
+
+    def _notify(self, room_id: str, message: str):
+        if self.on_event is not None:
+            self.on_event(room_id, message)
+
+
+def attach_spawns(game: GameState) -> MonsterSpawns:
+    """혼자 하는 게임에 자기 몬스터 스폰을 붙이고 배회 시작 (게임 시드로 배회를 정함)"""
+    game.spawns = MonsterSpawns(game.world, seed=game.seed)
+    game.spawns.start_wandering()
+    return game.spawns
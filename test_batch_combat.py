@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 일괄 전투 계산기 테스트
+"""
+
+import itertools
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from batch_combat import resolve_grid
+from game_core import GameState, Item, ItemType
+
+
+def simulate(attack, defense, hp, weapon, armor, monster_key):
+    """실제 GameState.attack_monster로 한 번의 전투를 끝까지 진행"""
+    game = GameState()
+    game.player_attack, game.player_defense, game.player_hp = attack, defense, hp
+    game.player_exp_needed = 10 ** 9  # 레벨업으로 체력이 회복되지 않도록
+    game.equipped_weapon = Item("검", ItemType.WEAPON, attack=weapon)
+    game.equipped_armor = Item("갑옷", ItemType.ARMOR, defense=armor)
+    game.start_combat(game.monsters_database[monster_key].spawn())
+    turns = 0
+    while game.in_combat:
+        game.attack_monster()
+        turns += 1
+    return turns, game.player_hp, game.player_exp, game.player_gold
+
+
+def test_grid_matches_attack_monster():
+    cases = list(itertools.product([1, 12, 45], [0, 7, 50], [1, 40, 100], [0, 5], [0, 3]))
+    attack, defense, hp, weapon, armor = (np.array(column) for column in zip(*cases))
+    database = GameState().monsters_database
+    keys, outcome = resolve_grid(attack, defense, hp, database, weapon_attack=weapon, armor_defense=armor)
+
+    assert outcome.turns.shape == (len(cases), len(keys))
+    for row, case in enumerate(cases):
+        for col, key in enumerate(keys):
+            turns, final_hp, exp, gold = simulate(*case, key)
+            assert outcome.turns[row, col] == turns
+            assert outcome.final_hp[row, col] == final_hp
+            assert outcome.exp[row, col] == exp
+            assert outcome.gold[row, col] == gold
+            assert outcome.survived[row, col] == (exp > 0)
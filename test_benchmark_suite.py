@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 벤치마크 회귀 검사 테스트
+"""
+
+import json
+
+import pytest
+
+from benchmarks import suite
+
+
+@pytest.fixture
+def quick(monkeypatch):
+    """반복 시간을 줄여 실제 벤치마크 하나를 빠르게 실행"""
+    monkeypatch.setattr(suite, "MIN_RUN_SECONDS", 0.001)
+    monkeypatch.setattr(suite, "REPEAT", 2)
+
+
+def write_baseline(path, results):
+    path.write_text(json.dumps({"environment": suite.environment(), "results": results}), encoding="utf-8")
+
+
+@pytest.mark.parametrize("baseline_seconds, exit_code", [(1e-12, 1), (1.0, 0)])
+def test_gate_fails_only_when_slower_than_baseline(tmp_path, quick, baseline_seconds, exit_code):
+    baseline = tmp_path / "baseline.json"
+    write_baseline(baseline, {"game_state.new": baseline_seconds, "save.dump_load": 1e-12})
+    output = tmp_path / "results.json"
+
+    argv = ["-k", "game_state.new", "--baseline", str(baseline), "--threshold", "0.3", "-o", str(output)]
+    assert suite.main(argv) == exit_code
+    # -k로 고른 항목만 실행하고 비교 (다른 기준값 항목은 회귀로 치지 않음)
+    assert list(json.loads(output.read_text(encoding="utf-8"))["results"]) == ["game_state.new"]
+
+
+def test_save_baseline_keeps_unfiltered_entries(tmp_path, quick):
+    baseline = tmp_path / "baseline.json"
+    write_baseline(baseline, {"game_state.new": 1e-12, "save.dump_load": 0.5})
+
+    assert suite.main(["-k", "game_state.new", "--baseline", str(baseline), "--save-baseline"]) == 0
+    results = json.loads(baseline.read_text(encoding="utf-8"))["results"]
+    assert results["save.dump_load"] == 0.5 and results["game_state.new"] > 1e-12
+    assert suite.main(["-k", "game_state.new", "--baseline", str(baseline), "--threshold", "100"]) == 0
+
+
+def test_measure_reads_repeat_at_call_time(quick, monkeypatch):
+    calls = []
+    monkeypatch.setattr(suite, "MIN_RUN_SECONDS", 0.0)  # 반복마다 한 번만 실행
+    suite.measure(lambda: calls.append(1))
+    assert len(calls) == 2  # quick의 REPEAT = 2
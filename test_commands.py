@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 명령어 테이블 테스트
+"""
+
+import pytest
+
+from commands import COMMANDS, Command, CommandTable
+from game_core import GameState
+
+
+def test_aliases_resolve_to_commands():
+    """모든 별칭이 하나의 명령어로 연결되는지 확인"""
+    expected = {
+        "북": "north", "n": "north", "south": "south", "동": "east", "w": "west",
+        "공격": "attack", "f": "flee", "look": "look", "줍기": "get",
+        "i": "inventory", "사용": "use", "?": "help", "exit": "quit",
+    }
+    for alias, name in expected.items():
+        assert COMMANDS.lookup(alias).name == name
+
+
+def test_parse_splits_arguments():
+    command, args = COMMANDS.parse("  USE 체력 물약 ")
+    assert command.name == "use"
+    assert args == ["체력", "물약"]
+    assert COMMANDS.parse("   ") == (None, [])
+
+
+def test_dispatch_unknown_command():
+    command, messages = COMMANDS.dispatch(GameState(), "춤추기 빠르게")
+    assert command is None
+    assert messages == ["알 수 없는 명령어: 춤추기 빠르게"]
+
+
+def test_move_triggers_encounter():
+    game = GameState()
+    command, messages = COMMANDS.dispatch(game, "n")
+    assert command.name == "north"
+    assert messages[0] == "북쪽으로 이동했습니다."
+    assert game.in_combat
+    assert messages[1] == f"!!! {game.current_monster.name}이(가) 나타났습니다! !!!"
+
+    _, messages = COMMANDS.dispatch(game, "서")
+    assert messages == ["서쪽으로 갈 수 없습니다."]
+
+
+def test_get_and_use_item():
+    game = GameState()
+    _, messages = COMMANDS.dispatch(game, "g")
+    assert messages == ["체력 물약을(를) 획득했습니다!"]
+    _, messages = COMMANDS.dispatch(game, "g")
+    assert messages == ["줍을 아이템이 없습니다."]
+    _, messages = COMMANDS.dispatch(game, "u")
+    assert messages == ["체력 물약을(를) 사용하여 체력을 회복했습니다!"]
+    assert len(game.inventory) == 0
+
+
+def test_duplicate_alias_rejected():
+    table = CommandTable()
+    table.add(Command("a", ("x",), lambda game, args: []))
+    with pytest.raises(ValueError):
+        table.add(Command("b", ("x",), lambda game, args: []))
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 헤드리스 엔진 테스트
+"""
+
+from engine import OUTBOX_LIMIT, Engine, Event
+
+
+def test_step_returns_events():
+    engine = Engine()
+    session = engine.create_session("tester")
+    assert engine.step(session, "  ") == []
+    assert engine.step(session, "줍기") == [Event("get", "체력 물약을(를) 획득했습니다!")]
+    assert engine.step(session, "춤") == [Event("unknown", "알 수 없는 명령어: 춤")]
+    assert session.commands_run == 2
+
+
+def test_sessions_are_independent():
+    engine = Engine()
+    first = engine.create_session()
+    second = engine.create_session()
+    engine.step(first, "북")
+    assert first.game.current_room_id == "north_forest"
+    assert second.game.current_room_id == "start_village"
+
+
+def test_quit_closes_session():
+    engine = Engine()
+    session = engine.create_session()
+    events = engine.step(session, "q")
+    assert events == [Event("quit", "게임을 종료합니다.")]
+    assert session.closed
+    assert session.session_id not in engine.sessions
+    assert engine.step(session, "주변") == []
+
+
+def test_room_broadcasts_reach_only_occupants():
+    engine = Engine()
+    mover = engine.create_session("용사")
+    watcher = engine.create_session()
+    engine.step(mover, "북")
+    assert engine.drain(watcher) == [Event("leave", "용사이(가) 북쪽으로 떠났습니다.")]
+    assert engine.occupancy.count("start_village") == 1
+    assert engine.occupancy.count("north_forest") == 1
+
+    engine.step(watcher, "줍기")  # 아무도 없는 방에서의 행동은 방송되지 않는다
+    engine.step(watcher, "북")
+    assert engine.drain(mover) == [Event("arrive", "모험가2이(가) 남쪽에서 왔습니다.")]
+    assert engine.drain(watcher) == []
+    assert engine.drain_pending() == []
+
+
+def test_close_session_leaves_room():
+    engine = Engine()
+    first = engine.create_session()
+    second = engine.create_session()
+    engine.close_session(first)
+    assert list(engine.occupancy.occupants("start_village")) == [second]
+    engine.step(second, "줍기")
+    assert first.outbox == []
+
+
+def test_outbox_is_bounded():
+    engine = Engine()
+    talker = engine.create_session()
+    idle = engine.create_session()
+    for i in range(OUTBOX_LIMIT + 5):
+        engine.broadcast("start_village", Event("say", str(i)), talker)
+    events = engine.drain(idle)
+    assert len(events) == OUTBOX_LIMIT
+    assert events[-1].text == str(OUTBOX_LIMIT + 4)
+
+
+def test_notify_rooms_off_skips_broadcasts():
+    engine = Engine(notify_rooms=False)
+    first = engine.create_session()
+    second = engine.create_session()
+    engine.step(first, "줍기")
+    engine.step(first, "북")
+    assert engine.drain(second) == []
+    assert engine.occupancy.count("north_forest") == 1
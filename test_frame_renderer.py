@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 터미널 프레임 렌더러 테스트
+"""
+
+import io
+
+from demo import game_frame
+from commands import COMMANDS
+from frame_renderer import CLEAR_BELOW, CLEAR_LINE, CLEAR_SCREEN, FrameRenderer, fit, move_to, wrap
+from game_core import GameState
+from ring_buffer import RingBuffer
+
+
+def test_only_changed_lines_are_written():
+    out = io.StringIO()
+    renderer = FrameRenderer(out, height=50)
+    renderer.render(["a", "b", "c"])
+    assert out.getvalue().startswith(CLEAR_SCREEN)
+
+    assert renderer.frame_diff(["a", "B", "c"]) == move_to(1) + "B" + CLEAR_LINE + move_to(3) + CLEAR_BELOW
+    # 줄 수가 줄면 남은 줄은 아래를 지우는 것으로 처리
+    assert renderer.frame_diff(["a"]) == move_to(1) + CLEAR_BELOW
+
+
+def test_full_redraw_when_frame_does_not_fit():
+    renderer = FrameRenderer(io.StringIO(), height=3)
+    renderer.render(["a", "b", "c"])
+    assert renderer.frame_diff(["a", "b", "c"]).startswith(CLEAR_SCREEN)
+
+
+def test_demo_frame_changes_after_command():
+    game = GameState()
+    log = RingBuffer(100)
+    renderer = FrameRenderer(io.StringIO(), height=100)
+    first = game_frame(game, log)
+    renderer.render(first)
+    game.player_gold = 50
+    diff = renderer.frame_diff(game_frame(game, log))
+    assert diff.count(CLEAR_LINE) == 1
+    assert "골드: 50" in diff
+
+
+def test_fit_and_wrap_count_wide_characters():
+    assert fit("골드: 50", 10) == "골드: 50  "
+    assert fit("드래곤의 둥지", 7) == "드래곤 "  # 2칸 글자가 걸치면 자르고 공백으로 채움
+    assert wrap("당신이 고블린에게", 8) == ["당신이 ", "고블린에", "게"]
+
+
+def test_demo_frame_fits_a_24_row_terminal():
+    game = GameState(seed=0)
+    log = RingBuffer(100)
+    renderer = FrameRenderer(io.StringIO(), height=24)
+    renderer.render(game_frame(game, log, renderer.screen_height()))
+    for command in ["북", "공격", "공격", "남"]:
+        _, messages = COMMANDS.dispatch(game, command)
+        log.extend(messages)
+        frame = game_frame(game, log, 24)
+        assert len(frame) + 1 <= 24  # 입력 줄까지 화면 안
+        assert not renderer.frame_diff(frame).startswith(CLEAR_SCREEN)
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 게임 코어 테스트
+"""
+
+import dataclasses
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from game_core import Direction, GameState, Monster, World
+from world_data import load_world
+
+
+def test_templates_are_immutable():
+    template = GameState().monsters_database["orc"]
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        template.max_hp = 1
+
+
+def test_spawns_do_not_share_hp():
+    game = GameState()
+    template = game.monsters_database["troll"]
+    first, second = template.spawn(), template.spawn()
+    first.hp -= 50
+    assert second.hp == template.max_hp == 100
+    assert isinstance(first, Monster) and not hasattr(first, "__dict__")
+    assert (first.name, first.attack, first.defense) == ("트롤", 25, 10)
+
+
+def test_killed_monster_respawns_on_next_encounter():
+    game = GameState()
+    game.player_attack = 1000
+    game.move(Direction.EAST)
+    game.check_room_events()
+    killed = game.current_monster
+    game.attack_monster()
+    assert killed.hp <= 0 and not game.in_combat
+
+    game.move(Direction.EAST)
+    game.check_room_events()
+    assert game.current_monster is not killed
+    assert game.current_monster.hp == game.current_monster.max_hp
+
+
+def test_sessions_share_world_but_not_loot():
+    first, second = GameState(), GameState()
+    assert first.world is second.world is World.default()
+    assert first.room_items == {}
+
+    potion = first.get_room_items().first()
+    first.pick_up_item(potion)
+    assert len(first.get_room_items()) == 0
+    assert second.get_room_items().stacks() == [(potion, 1)]
+    assert World.default()["start_village"].items == (potion,)
+
+
+def test_custom_world():
+    world = load_world(use_cache=False)
+    game = GameState(world)
+    assert game.world is world is not World.default()
+    assert game.items_database is world.items
+
+
+def test_headless_import_skips_textual():
+    """게임 로직과 mud_game 모듈은 TUI를 시작하기 전까지 Textual/rich를 불러오지 않음"""
+    code = ("import sys, game_core, commands, engine, mud_game; "
+            "print(sorted({name.split('.')[0] for name in sys.modules} & {'textual', 'rich'}))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=Path(__file__).resolve().parent,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 고정 간격 게임 루프 테스트
+"""
+
+import asyncio
+import time
+
+from game_core import REGEN_TICKS, GameState
+from game_loop import TickLoop
+
+
+def test_systems_run_in_order_with_timing():
+    ticks, calls = TickLoop(budget=0.005), []
+    ticks.add_system("fast", lambda tick: calls.append(("fast", tick)))
+    ticks.add_system("slow", lambda tick: tick == 2 and time.sleep(0.01))
+    overruns = []
+    ticks.on_overrun = overruns.append
+
+    for _ in range(3):
+        ticks.tick()
+    assert calls == [("fast", 1), ("fast", 2), ("fast", 3)]
+    assert ticks.stats["slow"].calls == 3 and ticks.stats["slow"].worst >= 0.01
+    assert [overrun.tick for overrun in overruns] == [2] and ticks.overrun_count == 1
+    assert overruns[0].systems[0][0] == "slow"
+    report = ticks.report()
+    assert "예산 초과 1회" in report[0] and "(slow" in report[-1]
+
+
+def test_run_on_asyncio_catches_up():
+    ticks = TickLoop(interval=0.001)
+    ticks.add_system("stall", lambda tick: tick == 1 and time.sleep(0.05))
+
+    async def run():
+        task = asyncio.create_task(ticks.run())
+        while ticks.tick_count < 10:
+            await asyncio.sleep(0.001)
+        task.cancel()
+
+    asyncio.run(asyncio.wait_for(run(), 5))
+    assert ticks.skipped > 0
+
+
+def test_regenerate_outside_combat():
+    game = GameState()
+    game.player_hp = 99
+    assert game.regenerate(5) and game.player_hp == 100
+    assert not game.regenerate()
+    game.player_hp, game.in_combat = 50, True
+    assert not game.regenerate()
+
+
+def test_world_tick_without_spawns_regenerates_every_regen_ticks():
+    game = GameState()
+    game.player_hp = 50
+    healed = [game.world_tick() for _ in range(REGEN_TICKS * 3)]
+    assert healed.count(True) == 3 and game.player_hp == 53
+    assert game.world_ticks == REGEN_TICKS * 3
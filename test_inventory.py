@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 인벤토리 테스트
+"""
+
+from commands import COMMANDS
+from game_core import GameState, Item, ItemType
+from inventory import Inventory
+
+
+def test_stacks_and_indexes():
+    items = GameState().items_database
+    inventory = Inventory()
+    for _ in range(3):
+        inventory.add(items["gold_coin"])
+    inventory.add(items["health_potion"], 2)
+    inventory.add(items["rusty_sword"])
+
+    assert len(inventory) == 6
+    assert inventory.stacks()[0] == (items["gold_coin"], 3)
+    assert inventory.find("체력 물약") is items["health_potion"]
+    assert inventory.find("3") is items["rusty_sword"]
+    assert inventory.find("4") is None
+    assert inventory.by_type(ItemType.WEAPON) == [items["rusty_sword"]]
+
+    assert inventory.remove(items["rusty_sword"])
+    assert not inventory.remove(items["rusty_sword"])
+    assert inventory.by_type(ItemType.WEAPON) == []
+    assert inventory.find("녹슨 검") is None
+    assert not inventory.remove(items["gold_coin"], 4)
+    assert inventory.count(items["gold_coin"]) == 3
+
+
+def test_numbered_name_targets_same_named_items():
+    first, second = Item("물약", ItemType.POTION, heal=10), Item("물약", ItemType.POTION, heal=50)
+    inventory = Inventory.of([first, second, second])
+    assert inventory.find("물약") is first
+    assert inventory.find("2.물약") is second
+    assert inventory.find("3.물약") is None and inventory.find("1.검") is None
+
+    assert inventory.remove(first)
+    assert inventory.find("물약") is second and inventory.find("1.물약") is second
+    assert inventory.remove(second, 2)
+    assert inventory.find("물약") is None
+
+
+def test_targeted_use_and_drop_commands():
+    game = GameState()
+    items = game.items_database
+    game.inventory.add(items["health_potion"], 2)
+    game.inventory.add(items["iron_sword"])
+    game.player_hp = 10
+
+    _, messages = COMMANDS.dispatch(game, "인벤토리")
+    assert messages[1] == "1. 체력 물약 x2 - 체력을 회복시킵니다."
+    _, messages = COMMANDS.dispatch(game, "사용 2")
+    assert messages == ["철검을(를) 장착했습니다!"]
+    _, messages = COMMANDS.dispatch(game, "사용 health_potion")
+    assert game.inventory.count(items["health_potion"]) == 1
+
+    _, messages = COMMANDS.dispatch(game, "버리기 철검")
+    assert messages == ["철검을(를) 버렸습니다."]
+    assert game.equipped_weapon is None
+    assert items["iron_sword"] in game.get_room_items()
+    _, messages = COMMANDS.dispatch(game, "줍기 철검")
+    assert messages == ["철검을(를) 획득했습니다!"]
+    _, messages = COMMANDS.dispatch(game, "사용 드래곤")
+    assert messages == ["드래곤을(를) 가지고 있지 않습니다."]
+
+
+def test_get_all_moves_room_stacks_at_once():
+    game = GameState()
+    items = game.items_database
+    game.current_room_id = "dragon_lair"
+    game.inventory.add(items["gold_coin"], 500)
+    for _ in range(500):
+        game.drop_item(items["gold_coin"])
+    assert game.get_room_items().stacks() == [(items["gold_coin"], 502)]
+
+    _, messages = COMMANDS.dispatch(game, "줍기 모두")
+    assert messages == ["금화 x502을(를) 획득했습니다!"]
+    assert game.inventory.count(items["gold_coin"]) == 502
+    assert len(game.get_room_items()) == 0
+    _, messages = COMMANDS.dispatch(game, "get all")
+    assert messages == ["줍을 아이템이 없습니다."]
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 명령어 지연 측정 테스트
+"""
+
+import json
+
+from commands import COMMANDS
+from engine import Engine
+from game_core import GameState
+from metrics import CommandMetrics, LatencyHistogram
+
+
+def test_histogram_percentiles():
+    histogram = LatencyHistogram()
+    for seconds in [0.000_010] * 90 + [0.001] * 9 + [0.5]:
+        histogram.record(seconds)
+    assert histogram.count == 100
+    assert 0.000_010 <= histogram.percentile(0.5) <= 0.000_016
+    assert 0.001 <= histogram.percentile(0.95) <= 0.001_024
+    assert histogram.percentile(1.0) == histogram.worst == 0.5
+
+
+def test_dispatch_records_phases_and_stats_command(tmp_path):
+    game = GameState()
+    _, messages = COMMANDS.dispatch(game, "통계")
+    assert "MUD_STATS" in messages[0]
+
+    engine = Engine(metrics=CommandMetrics(tmp_path / "stats.json"))
+    session = engine.create_session()
+    engine.run_script(session, ["주변", "주변", "북", "춤추기"])
+    stats = engine.step(session, "stats")
+    assert stats[0].text.split() == ["명령어", "단계", "횟수", "p50", "p95", "최대"]
+    assert any(line.text.startswith("look") and " 2 " in line.text for line in stats)
+
+    data = json.loads(engine.metrics.dump().read_text(encoding="utf-8"))
+    assert data["look"]["logic"]["count"] == 2
+    assert set(data["look"]) == {"dispatch", "logic"}
+    assert data["unknown"]["dispatch"]["count"] == 1
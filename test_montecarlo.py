@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 몬테카를로 플레이 시뮬레이터 테스트
+"""
+
+import json
+
+import pytest
+
+from game_core import Direction, Room, World
+from montecarlo import CURVE_EVERY, BotPolicy, MonteCarloStats, play, simulate
+from world_data import world_to_data
+from worldgen import generate_world
+
+
+POLICY = BotPolicy(max_steps=400)
+
+
+def test_results_depend_only_on_seed():
+    expected = simulate(24, seed=3, policy=POLICY, workers=1, shard_size=24).to_dict()
+    assert simulate(24, seed=3, policy=POLICY, workers=1, shard_size=5).to_dict() == expected
+    assert simulate(24, seed=3, policy=POLICY, workers=2, shard_size=5).to_dict() == expected
+    assert simulate(24, seed=4, policy=POLICY, workers=1).to_dict() != expected
+
+
+def test_stats_cover_every_run():
+    stats = simulate(20, seed=0, policy=POLICY, workers=1, shard_size=6)
+    assert stats.runs == 20
+    assert stats.level_steps[1][0] == 20  # 모두 레벨 1, 0걸음에서 시작
+    assert len(stats.gold_curve) == POLICY.max_steps // CURVE_EVERY
+    assert all(later >= earlier for earlier, later in zip(stats.gold_curve, stats.gold_curve[1:]))
+    assert sum(sum(counts) for (monster, _), counts in stats.fights.items() if monster == "고블린") > 0
+    assert stats.win_rate("드래곤", 1) is None  # 레벨 1에는 드래곤에 도전하지 않음
+
+
+def test_merge_adds_counts():
+    first, second = MonteCarloStats(), MonteCarloStats()
+    first.record_fight("드래곤", 3, "fled")
+    second.record_fight("드래곤", 3, "win")
+    second.gold_curve = [5, 10]
+    first.merge(second)
+    assert first.fights[("드래곤", 3)] == [1, 1, 0]
+    assert first.win_rate("드래곤", 3) == 0.5
+    assert first.gold_curve == [5, 10]
+
+
+def test_generated_world_with_boss_room(tmp_path):
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(world_to_data(generate_world(64, seed=2)), ensure_ascii=False), encoding="utf-8")
+    with pytest.raises(ValueError):
+        simulate(4, policy=POLICY, workers=1, world_path=str(path))  # 기본 보스 방(dragon_lair)이 없는 월드
+
+    stats = simulate(6, policy=BotPolicy(boss_room="r63", max_steps=400), workers=1, world_path=str(path))
+    assert stats.runs == 6 and stats.fights
+
+
+def test_unreachable_or_missing_hunting_rooms():
+    base = World.default()
+
+    def room(name, exits, monsters=(), is_safe=False):
+        return Room(name, "", exits, (), monsters, (), is_safe)
+
+    rooms = {
+        "camp": room("야영지", {Direction.NORTH: "lair"}, is_safe=True),
+        "lair": room("둥지", {Direction.SOUTH: "camp"}, (base.monsters["dragon"],)),
+    }
+    policy = BotPolicy(boss_room="lair", max_steps=200)
+
+    # 갈 수 없는 사냥터만 있으면 야영지에서 움직이지 않고 걸음만 씀
+    island = World({**rooms, "island": room("외딴 섬", {}, (base.monsters["goblin"],))}, base.items, base.monsters, "camp")
+    stats = MonteCarloStats()
+    assert play(island, 1, policy, stats).current_room_id == "camp"
+    assert stats.steps == policy.max_steps and not stats.fights
+
+    # 사냥터가 없으면 바로 보스에 도전
+    stats = MonteCarloStats()
+    play(World(rooms, base.items, base.monsters, "camp"), 1, policy, stats)
+    assert stats.win_rate("드래곤", 1) is not None
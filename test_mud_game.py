@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - Textual UI 테스트 (헤드리스)
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("textual")
+
+from mud_game import MUDGame  # noqa: E402
+
+
+def label_text(panel, label_id: str) -> str:
+    return str(panel.labels[label_id].render())
+
+
+def test_panels_follow_game_state():
+    async def run():
+        app = MUDGame()
+        async with app.run_test() as pilot:
+            assert label_text(app.room_panel, "room-items-label") == "아이템: 체력 물약"
+            app.process_command("줍기")
+            await pilot.pause()
+            assert label_text(app.room_panel, "room-items-label") == "아이템: 없음"
+
+            # 명령어를 거치지 않은 상태 변경도 다음 갱신에 반영된다
+            app.game_state.player_gold = 77
+            app.game_state.start_combat(app.game_state.monsters_database["goblin"].spawn())
+            app.update_ui()
+            await pilot.pause()
+            assert label_text(app.character_panel, "gold-label") == "골드: 77"
+            assert label_text(app.combat_panel, "combat-status-label") == "고블린 (HP: 30/30)"
+            assert app.combat_panel.has_class("visible")
+    asyncio.run(run())
+
+
+def test_unchanged_state_skips_label_updates():
+    async def run():
+        app = MUDGame()
+        async with app.run_test() as pilot:
+            updates = []
+            for label in app.character_panel.labels.values():
+                label.update = lambda text, label=label: updates.append(label.id)
+            app.process_command("인벤토리")
+            await pilot.pause()
+            assert updates == []
+            app.game_state.player_hp -= 10
+            app.update_ui()
+            assert updates == ["hp-label"]
+    asyncio.run(run())
+
+
+def test_game_log_keeps_recent_lines_and_renders_visible_ones():
+    from textual.app import App
+
+    from mud_game import GameLog
+
+    class LogApp(App):
+        def compose(self):
+            yield GameLog(max_lines=100)
+
+    async def run():
+        app = LogApp()
+        async with app.run_test(size=(40, 30)) as pilot:
+            log = app.query_one(GameLog)
+            log.add_messages(f"줄 {i}" for i in range(250))
+            log.add_messages(["첫째\n둘째"])
+            await pilot.pause()
+            assert len(log.lines) == 100
+            assert log.lines.tail(2) == ["첫째", "둘째"]
+            assert log.lines[0] == "줄 152"
+            # 끝까지 스크롤된 상태이므로 마지막 줄이 화면 맨 아래에 보인다
+            assert log.render_line(log.size.height - 1).text.rstrip() == "둘째"
+    asyncio.run(run())
+
+
+def test_ctrl_q_saves_and_dumps_metrics(tmp_path):
+    """종료 명령어 대신 Ctrl+Q로 끝내도 스냅샷과 명령어 지표를 남김"""
+    import json
+
+    from metrics import CommandMetrics
+
+    async def run():
+        app = MUDGame(save_path=tmp_path / "slot", metrics=CommandMetrics(tmp_path / "stats.json"))
+        async with app.run_test() as pilot:
+            app.process_command("줍기")
+            await pilot.press("ctrl+q")
+            await pilot.pause()
+    asyncio.run(run())
+
+    stats = json.loads((tmp_path / "stats.json").read_text(encoding="utf-8"))
+    assert "render" in stats["get"]
+    assert (tmp_path / "slot.snap").exists() and (tmp_path / "slot.journal").read_bytes() == b""
+
+
+def test_world_systems_are_timed_separately():
+    """몬스터 타이머와 체력 회복은 틱 루프에서 따로 측정되고, 회복은 게임의 월드 틱 수를 따름"""
+    async def run():
+        app = MUDGame()
+        async with app.run_test():
+            game = app.game_state
+            game.player_hp = 50
+            for _ in range(20):
+                app.ticks.tick()
+            assert [name for name, _ in app.ticks.systems] == ["spawns", "regen"]
+            assert app.ticks.stats["spawns"].calls == app.ticks.stats["regen"].calls >= 20
+            assert game.world_ticks == game.spawns.wheel.now >= 20
+            assert game.player_hp > 50
+    asyncio.run(run())
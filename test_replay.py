@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 시드 난수와 세션 재실행 테스트
+"""
+
+import random
+
+import pytest
+
+from engine import Engine
+from game_core import GameState
+from replay import Recording, from_session, load_recordings, record, save_recordings, verify
+from save import dump_snapshot, load_snapshot
+from spawns import MonsterSpawns
+
+
+SCRIPT = ["북", "도망", "도망", "도망", "공격", "남", "동", "공격", "도망", "줍기"]
+
+
+def flee_results(game: GameState, count: int = 20):
+    results = []
+    for _ in range(count):
+        game.start_combat(game.monsters_database["goblin"].spawn())
+        results.append(game.flee_combat())
+    return results
+
+
+def test_seeded_sessions_are_reproducible_and_isolated():
+    first, second = GameState(seed=7), GameState(seed=7)
+    expected = flee_results(first)
+    random.random()  # 전역 random은 세션 난수에 영향을 주지 않는다
+    assert flee_results(second) == expected
+
+
+def test_snapshot_keeps_rng_position():
+    game = GameState(seed=3)
+    flee_results(game, 5)
+    restored, _ = load_snapshot(dump_snapshot(game))
+    assert flee_results(restored) == flee_results(game)
+
+
+def test_recording_round_trip(tmp_path):
+    recording = record(42, SCRIPT)
+    assert verify(recording)
+    assert not verify(Recording(42, ["줍기"] + SCRIPT, recording.hash))
+
+    path = tmp_path / "sessions.jsonl"
+    save_recordings(path, [recording])
+    assert list(load_recordings(path)) == [recording]
+
+
+def test_engine_session_recording():
+    engine = Engine(record=True)
+    session = engine.create_session(seed=5)
+    engine.run_script(session, ["  북 ", "", "공격"] + SCRIPT)
+    assert session.history[:2] == ["북", "공격"]
+    assert verify(from_session(session))
+
+
+def test_shared_spawn_sessions_are_rejected():
+    engine = Engine(record=True, spawns=MonsterSpawns(GameState().world))
+    session = engine.create_session(seed=5)
+    engine.run_script(session, SCRIPT)
+    with pytest.raises(ValueError):
+        from_session(session)
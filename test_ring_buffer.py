@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 원형 버퍼 테스트
+"""
+
+from collections import deque
+
+import pytest
+
+from ring_buffer import RingBuffer
+
+
+def test_matches_bounded_deque():
+    buffer, expected = RingBuffer(5), deque(maxlen=5)
+    for batch in ([1, 2], [3], [4, 5, 6, 7], [], [8, 9, 10, 11, 12, 13], [14]):
+        buffer.extend(batch)
+        expected.extend(batch)
+        assert list(buffer) == list(expected)
+        assert [buffer[i] for i in range(len(buffer))] == list(expected)
+    buffer.append(15)
+    assert buffer.tail(2) == [14, 15]
+    assert buffer[-1] == 15
+
+
+def test_index_out_of_range():
+    buffer = RingBuffer(3)
+    buffer.append("a")
+    with pytest.raises(IndexError):
+        buffer[1]
+    with pytest.raises(ValueError):
+        RingBuffer(0)
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 경로 색인과 가기 명령어 테스트
+"""
+
+from collections import deque
+
+from commands import COMMANDS
+from game_core import Direction, GameState
+from routing import RouteIndex
+from world_data import load_world
+from worldgen import generate_world
+
+
+def bfs_distance(world, source, destination):
+    seen = {source: 0}
+    queue = deque([source])
+    while queue:
+        room_id = queue.popleft()
+        for target in world[room_id].exits.values():
+            if target not in seen:
+                seen[target] = seen[room_id] + 1
+                queue.append(target)
+    return seen.get(destination)
+
+
+def test_paths_are_shortest():
+    world = generate_world(400, seed=5)
+    routes = RouteIndex(world)
+    for source, destination in [("r0", "r399"), ("r123", "r7"), ("r250", "r251")]:
+        path = routes.path(source, destination)
+        assert len(path) == bfs_distance(world, source, destination)
+        room_id = source
+        for direction in path:
+            room_id = world[room_id].exits[direction]
+        assert room_id == destination
+
+
+def test_exit_changes_update_tables():
+    world = load_world(use_cache=False)
+    routes = world.routes
+    assert routes.path("dark_cave", "dragon_lair") == [Direction.SOUTH, Direction.SOUTH, Direction.EAST,
+                                                        Direction.EAST, Direction.NORTH]
+    # 지름길 추가: 기존 테이블을 버리지 않고 그 자리에서 갱신
+    table = routes.table("dragon_lair")
+    world.set_exit("dark_cave", Direction.EAST, "dragon_lair")
+    assert routes.table("dragon_lair") is table
+    assert routes.path("dark_cave", "dragon_lair") == [Direction.EAST]
+    assert routes.path("north_forest", "dragon_lair") == [Direction.NORTH, Direction.EAST]
+
+    # 지름길 제거: 그 출구를 쓰던 테이블만 다시 만든다
+    world.set_exit("dark_cave", Direction.EAST, None)
+    assert routes.path("dark_cave", "dragon_lair") == [Direction.SOUTH, Direction.SOUTH, Direction.EAST,
+                                                        Direction.EAST, Direction.NORTH]
+    world.set_exit("mountain_pass", Direction.NORTH, None)
+    assert routes.path("start_village", "dragon_lair") is None
+
+
+def test_goto_command_stops_on_encounter():
+    game = GameState(load_world(use_cache=False))
+    _, messages = COMMANDS.dispatch(game, "가기 어두운 동굴")
+    assert messages[0] == "이동 경로: 북 (1칸)"
+    assert messages[1] == "북쪽 숲에서 멈췄습니다."
+    assert game.current_room_id == "north_forest" and game.in_combat
+
+    _, messages = COMMANDS.dispatch(game, "goto dark_cave")
+    assert messages == ["전투 중에는 이동할 수 없습니다."]
+    game.in_combat = False
+    game.current_monster = None
+
+
+def test_goto_command_arrives():
+    world = load_world(use_cache=False)
+    world.rooms["north_forest"].monsters = ()
+    world.rooms["dark_cave"].monsters = ()
+    game = GameState(world)
+    _, messages = COMMANDS.dispatch(game, "가기 어두운 동굴")
+    assert messages == ["이동 경로: 북 → 북 (2칸)", "어두운 동굴에 도착했습니다."]
+    assert COMMANDS.dispatch(game, "가기 dark_cave")[1] == ["이미 그곳에 있습니다."]
+    assert COMMANDS.dispatch(game, "가기 달나라")[1] == ["알 수 없는 장소: 달나라"]
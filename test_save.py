@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 저장/불러오기 테스트
+"""
+
+import pytest
+
+import demo
+
+from commands import COMMANDS
+from game_core import Direction, GameState
+from replay import state_hash
+from save import SaveDataError, SaveFile, dump_snapshot, load_snapshot
+
+
+def test_snapshot_round_trip():
+    game = GameState()
+    game.pick_up_item(game.get_room_items().first())
+    game.use_item(game.items_database["iron_sword"])
+    game.player_gold = 123
+    game.move(Direction.NORTH)
+    game.start_combat(game.monsters_database["goblin"].spawn())
+    game.current_monster.hp = 7
+
+    restored, seq = load_snapshot(dump_snapshot(game, seq=5))
+    assert seq == 5
+    assert restored.player_gold == 123
+    assert restored.current_room_id == "north_forest"
+    assert [(item.name, count) for item, count in restored.inventory.stacks()] == [("체력 물약", 1)]
+    assert restored.equipped_weapon is restored.items_database["iron_sword"]
+    assert len(restored.get_room_items("start_village")) == 0
+    assert restored.in_combat and restored.current_monster.hp == 7
+
+
+def test_snapshot_rejects_garbage():
+    with pytest.raises(SaveDataError):
+        load_snapshot(b"not a snapshot")
+
+
+def test_journal_replays_after_last_snapshot(tmp_path):
+    save = SaveFile(tmp_path / "slot", checkpoint_every=2)
+    game = save.load()
+    for command in ["줍기", "인벤토리", "사용 체력 물약"]:
+        COMMANDS.dispatch(game, command)
+        save.record(game, command)  # 두 번째 명령어 뒤에 스냅샷 저장
+    save.close()
+    assert save.read_journal() == [(3, "사용 체력 물약", 0)]
+
+    loaded = SaveFile(tmp_path / "slot").load()
+    assert len(loaded.inventory) == 0
+    assert len(loaded.get_room_items()) == 0
+
+
+def test_demo_loop_round_trip_on_eof(tmp_path, monkeypatch):
+    """데모 루프를 Ctrl-D(EOF)로 끝내도 스냅샷과 지표가 남고, 불러오면 같은 상태 (전투 조우도 명령어 안에서만 일어남)"""
+    commands = iter([""] + ["북"] + ["공격"] * 12)
+    shown = []
+
+    def fake_input(prompt=""):
+        try:
+            return next(commands)
+        except StopIteration:
+            raise EOFError from None
+
+    monkeypatch.setattr("builtins.input", fake_input)
+    monkeypatch.setattr(demo, "print_game_interface", lambda game, log, renderer=None: shown.append(game))
+    monkeypatch.setenv("MUD_STATS", str(tmp_path / "stats.json"))
+    demo.main(save_path=tmp_path / "slot")
+
+    live = shown[-1]
+    assert (tmp_path / "stats.json").exists()
+    assert (tmp_path / "slot.journal").read_bytes() == b""  # 종료 때 스냅샷으로 옮겨짐
+    restored = SaveFile(tmp_path / "slot").load()
+    assert (restored.player_exp, restored.in_combat) == (live.player_exp, live.in_combat)
+    assert state_hash(restored) == state_hash(live)
+
+
+def test_spawn_state_survives_snapshot_and_journal(tmp_path):
+    """처치한 몬스터의 리스폰 대기와 배회가 스냅샷/저널 복원 뒤에도 같음 (다시 싸워 경험치를 두 번 얻지 않음)"""
+    save = SaveFile(tmp_path / "slot", checkpoint_every=8)
+    game = save.load(spawns=True)
+    game.player_hp = game.player_max_hp = 10_000
+    for command in ["북"] + ["공격"] * 10 + ["남", "북"] + ["공격"] * 10:
+        for _ in range(3):
+            game.world_tick()
+        COMMANDS.dispatch(game, command)
+        save.record(game, command)  # 8번째 명령어마다 스냅샷, 나머지는 월드 틱과 함께 저널에
+    save.close()
+    assert all(tick is not None for _, _, tick in save.read_journal())
+
+    restored = SaveFile(tmp_path / "slot").load(spawns=True)
+    assert (restored.player_exp, restored.player_gold) == (game.player_exp, game.player_gold)
+    assert restored.get_room_monsters() == game.get_room_monsters()
+    assert state_hash(restored) == state_hash(game)
+
+
+def test_regeneration_follows_journaled_world_ticks(tmp_path):
+    """명령어 사이에 월드 틱으로 회복한 체력도 저널 재실행으로 같게 복원"""
+    save = SaveFile(tmp_path / "slot")
+    game = save.load(spawns=True)
+    game.player_hp = 40
+    save.checkpoint(game)
+    for _ in range(55):
+        game.world_tick()
+    COMMANDS.dispatch(game, "인벤토리")
+    save.record(game, "인벤토리")
+    save.close()
+    assert game.player_hp == 45
+
+    restored = SaveFile(tmp_path / "slot").load(spawns=True)
+    assert restored.player_hp == 45
+    assert state_hash(restored) == state_hash(game)
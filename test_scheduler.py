@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 월드 틱 스케줄러 테스트
+"""
+
+import random
+
+from scheduler import TimerWheel
+
+
+def test_timers_fire_on_due_tick_across_levels():
+    wheel, fired, expected = TimerWheel(), [], []
+    rng = random.Random(0)
+    for i in range(2_000):
+        delay = rng.choice((rng.randint(0, 300), rng.randint(0, 70_000), rng.randint(0, 300_000)))
+        expected.append((max(1, delay), i))
+        wheel.schedule(delay, lambda i=i: fired.append((wheel.now, i)))
+    assert len(wheel) == 2_000
+
+    wheel.advance(300_000)
+    assert fired == sorted(expected)  # 같은 틱이면 등록 순
+    assert len(wheel) == 0
+
+
+def test_cancel_and_schedule_from_callback():
+    wheel, fired = TimerWheel(), []
+    cancelled = wheel.schedule(5, fired.append, "취소됨")
+    wheel.schedule(3, lambda: wheel.schedule(600, fired.append, "연쇄"))
+    cancelled.cancel()
+    assert wheel.advance(10) == 1
+    assert fired == []
+    wheel.advance(600)
+    assert fired == ["연쇄"] and wheel.now == 610
+
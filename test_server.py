@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 멀티플레이어 서버 테스트
+"""
+
+import asyncio
+
+from server import LINE_TOO_LONG, MAX_BUFFERED_BYTES, MAX_LINE_BYTES, PROMPT, MUDServer, strip_telnet
+
+
+async def send(reader, writer, line: str) -> str:
+    writer.write(line.encode("utf-8") + b"\r\n")
+    return (await reader.readuntil(PROMPT)).decode("utf-8")
+
+
+async def talk():
+    server = MUDServer(port=0)
+    await server.start()
+    first = await asyncio.open_connection("127.0.0.1", server.port)
+    second = await asyncio.open_connection("127.0.0.1", server.port)
+    welcome = (await first[0].readuntil(PROMPT)).decode("utf-8")
+    await second[0].readuntil(PROMPT)
+    assert "환영합니다" in welcome
+
+    assert "체력 물약을(를) 획득했습니다!" in await send(*first, "줍기")
+    # 같은 방의 두 번째 접속자에게는 알림이 전달된다
+    notice = (await second[0].readuntil(PROMPT)).decode("utf-8")
+    assert "모험가1이(가) 체력 물약을(를) 주웠습니다." in notice
+    # 두 번째 접속자는 자신의 세션을 가진다
+    assert "인벤토리가 비어있습니다." in await send(*second, "인벤토리")
+    assert len(server.engine.sessions) == 2
+
+    assert "게임을 종료합니다." in await send(*first, "종료")
+    assert await first[0].read() == b""
+    await send(*second, "q")
+    assert await second[0].read() == b""
+    await server.stop()
+    assert server.engine.sessions == {}
+
+
+def test_sessions_per_connection():
+    asyncio.run(talk())
+
+
+def test_strip_telnet():
+    assert strip_telnet(b"\xff\xfb\x01look\r\n") == b"look\r\n"
+    assert strip_telnet(b"\xff\xfa\x18\x00xterm\xff\xf0n\r\n") == b"n\r\n"
+    assert strip_telnet("북".encode("utf-8")) == "북".encode("utf-8")
+
+
+def test_overlong_line_disconnects_cleanly():
+    async def run():
+        server = MUDServer(port=0)
+        await server.start()
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        await reader.readuntil(PROMPT)
+        writer.write(b"x" * (MAX_LINE_BYTES + 100) + b"\r\n")
+        assert LINE_TOO_LONG in (await reader.read()).decode("utf-8")
+        await asyncio.sleep(0)
+        assert server.engine.sessions == {} and server.writers == {}
+        writer.close()
+        await server.stop()
+    asyncio.run(asyncio.wait_for(run(), 5))
+
+
+def test_slow_client_is_dropped_instead_of_buffering():
+    class StalledTransport:
+        def __init__(self):
+            self.buffered, self.aborted = 0, False
+
+        def get_write_buffer_size(self):
+            return self.buffered
+
+        def abort(self):
+            self.aborted = True
+
+    class StalledWriter:
+        def __init__(self):
+            self.transport = StalledTransport()
+
+        def is_closing(self):
+            return self.transport.aborted
+
+        def write(self, data: bytes):
+            self.transport.buffered += len(data)  # 상대가 읽지 않아 그대로 쌓임
+
+    server = MUDServer()
+    talker, listener = server.engine.create_session(), server.engine.create_session()
+    writer = server.writers[listener.session_id] = StalledWriter()
+    while not writer.transport.aborted:
+        server.engine.step(talker, "줍기")
+        server.engine.step(talker, "버리기 체력 물약")
+        server.deliver_pending()
+    assert writer.transport.buffered > MAX_BUFFERED_BYTES
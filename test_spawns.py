@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 몬스터 스폰/배회 테스트
+"""
+
+from engine import Engine
+from game_core import GameState, World
+from spawns import MonsterSpawns
+
+
+def kill_current_monster(game: GameState):
+    game.player_attack = 10_000
+    game.attack_monster()
+
+
+def test_killed_monster_respawns_after_timer():
+    world = World.default()
+    spawns = MonsterSpawns(world, respawn_ticks=50)
+    game = GameState(world, seed=1)
+    game.spawns = spawns
+    game.current_room_id = "dragon_lair"
+
+    game.check_room_events()
+    kill_current_monster(game)
+    assert game.get_room_monsters() == ()
+    assert game.check_room_events() == []
+    assert world["dragon_lair"].monsters == (world.monsters["dragon"],)
+
+    spawns.wheel.advance(49)
+    assert game.get_room_monsters() == ()
+    spawns.wheel.advance(1)
+    assert game.get_room_monsters() == (world.monsters["dragon"],)
+
+
+def test_wandering_monsters_move_and_notify_room():
+    world = World.default()
+    spawns = MonsterSpawns(world, wander_chance=1.0)
+    engine = Engine(spawns=spawns)
+    session = engine.create_session()
+    session.game.current_room_id = "mountain_pass"
+    engine.occupancy.move(session, "start_village", "mountain_pass")
+
+    started = spawns.start_wandering()
+    assert started == sum(len(room.monsters) for room in world.rooms.values() if not room.is_safe)
+    spawns.wheel.advance(1_000)
+    rooms = {room_id: spawns.monsters(room_id) for room_id in world.rooms}
+    assert sum(map(len, rooms.values())) == started
+    assert rooms != {room_id: room.monsters for room_id, room in world.rooms.items()}
+    assert not any(rooms[room_id] for room_id, room in world.rooms.items() if room.is_safe)
+    events = engine.drain(session)
+    assert events and all(event.kind == "world" for event in events)
+
+
+def test_snapshot_restore_continues_identically():
+    world = World.default()
+    spawns = MonsterSpawns(world, seed=3, respawn_ticks=50, wander_chance=0.5)
+    spawns.start_wandering()
+    spawns.wheel.advance(300)
+    assert spawns.killed("dragon_lair", world.monsters["dragon"])
+    spawns.wheel.advance(20)  # 리스폰 대기 중에 저장
+
+    restored = MonsterSpawns.restore(world, spawns.snapshot(), respawn_ticks=50)
+    assert restored.snapshot() == spawns.snapshot()
+    spawns.wheel.advance(2_000)
+    restored.wheel.advance(2_000)
+    assert restored.snapshot() == spawns.snapshot()
+    assert all(restored.monsters(room_id) == spawns.monsters(room_id) for room_id in world.rooms)
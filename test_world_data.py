@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 월드 데이터 파일 테스트
+"""
+
+import json
+from collections import deque
+
+import pytest
+
+from game_core import Direction
+from world_data import DEFAULT_WORLD_PATH, WorldDataError, load_world, validate_world_data, world_to_data
+from worldgen import generate_world
+
+
+def default_data():
+    return json.loads(DEFAULT_WORLD_PATH.read_text(encoding="utf-8"))
+
+
+def test_default_world_file():
+    world = load_world(use_cache=False)
+    assert len(world) == 6
+    assert world.start_room_id == "start_village"
+    lair = world["dragon_lair"]
+    assert lair.exits == {Direction.SOUTH: "mountain_pass"}
+    assert lair.items[0] is lair.items[1] is world.items["gold_coin"]
+    assert lair.monsters == (world.monsters["dragon"],)
+
+
+def test_validation_errors():
+    data = default_data()
+    data["rooms"]["dark_cave"]["exits"]["east"] = "nowhere"
+    data["rooms"]["east_road"]["items"].append("magic_wand")
+    data["rooms"]["north_forest"]["monsters"].append("slime")
+    del data["rooms"]["dragon_lair"]["exits"]["south"]
+    errors = validate_world_data(data)
+    assert len(errors) == 4
+    assert any("nowhere" in error for error in errors)
+    assert any("magic_wand" in error for error in errors)
+    assert any("slime" in error for error in errors)
+    assert any("일방통행" in error for error in errors)
+    assert len(validate_world_data(data, allow_one_way=True)) == 3
+
+
+def test_invalid_file_raises(tmp_path):
+    data = default_data()
+    data["start_room"] = "castle"
+    path = tmp_path / "broken.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    with pytest.raises(WorldDataError) as excinfo:
+        load_world(path)
+    assert excinfo.value.errors == ["시작 방 'castle'이(가) 없습니다"]
+
+
+def test_cache_keyed_by_file_hash(tmp_path):
+    data = default_data()
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+
+    first = load_world(path, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+    cached = load_world(path, cache_dir=cache_dir)
+    assert cached is not first
+    assert cached["start_village"].name == first["start_village"].name
+    assert cached["dark_cave"].exits == first["dark_cave"].exits
+    assert cached["dark_cave"].exits._table is cached.exit_table
+
+    data["rooms"]["start_village"]["name"] = "새 마을"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert load_world(path, cache_dir=cache_dir)["start_village"].name == "새 마을"
+    assert len(list(cache_dir.iterdir())) == 2
+
+
+@pytest.mark.parametrize("stale", [
+    b"cno_such_module\nWorld\n)R.",  # 없어진 모듈 (ModuleNotFoundError)
+    b"cgame_core\nWorld\n)R.",  # 생성 인자가 바뀐 클래스 (TypeError)
+    b"cgame_core\nDirection\nX\x03\x00\x00\x00\xeb\xb6\x81\x85R.",  # World가 아닌 객체
+])
+def test_stale_cache_is_rebuilt(tmp_path, stale):
+    path = tmp_path / "world.json"
+    path.write_text(json.dumps(default_data()), encoding="utf-8")
+    cache_dir = tmp_path / "cache"
+    load_world(path, cache_dir=cache_dir)
+    cache_path, = cache_dir.iterdir()
+    cache_path.write_bytes(stale)
+
+    assert load_world(path, cache_dir=cache_dir)["start_village"].name == "시작의 마을"
+    assert load_world(path, cache_dir=cache_dir)["start_village"].name == "시작의 마을"  # 다시 쓴 캐시에서
+
+
+def test_generated_world_is_connected_and_valid():
+    world = generate_world(500, seed=3)
+    assert len(world) == 500
+    assert validate_world_data(world_to_data(world)) == []
+
+    seen = {world.start_room_id}
+    queue = deque(seen)
+    while queue:
+        for target in world[queue.popleft()].exits.values():
+            if target not in seen:
+                seen.add(target)
+                queue.append(target)
+    assert len(seen) == 500
+
+
+def test_exits_share_one_table():
+    world = load_world(use_cache=False)
+    village = world["start_village"]
+    assert not hasattr(village, "__dict__")
+    assert world.exit_table.room_ids[village.exits.index] == "start_village"
+    assert Direction.NORTH in village.exits and Direction.WEST not in village.exits
+    assert village.exits.get(Direction.WEST) is None
+
+    world.set_exit("start_village", Direction.WEST, "dragon_lair")
+    assert village.exits[Direction.WEST] == "dragon_lair"
+    assert list(village.exits)[-1] is Direction.WEST
+    world.set_exit("start_village", Direction.WEST, None)
+    with pytest.raises(KeyError):
+        village.exits[Direction.WEST]
+    with pytest.raises(KeyError):
+        world.set_exit("start_village", Direction.WEST, "nowhere")
+    assert len(village.exits) == len(default_data()["rooms"]["start_village"]["exits"])
+
+
+def test_generated_world_is_seeded():
+    first = world_to_data(generate_world(200, seed=7))
+    assert first == world_to_data(generate_world(200, seed=7))
+    assert first != world_to_data(generate_world(200, seed=8))
+
+
+def test_world_to_data_round_trip():
+    assert world_to_data(load_world(use_cache=False)) == default_data()
@@ -0,0 +1,383 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - Textual 화면
+mud_game.py가 TUI를 시작할 때만 불러오므로 게임 로직만 쓰는 곳은 Textual을 불러오지 않는다
+"""
+
+import time
+from typing import Dict, Iterable, List, Optional
+
+from textual.app import App, ComposeResult
+from textual.containers import Container, Horizontal, Vertical
+from textual.widgets import Header, Footer, Static, Button, Input, Label
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from rich.cells import cell_len
+from rich.segment import Segment
+
+from game_core import World, GameState
+from commands import COMMANDS, HELP_TEXT
+from save import SaveFile
+from game_loop import Overrun, TickLoop
+from metrics import CommandMetrics
+from spawns import attach_spawns
+from ring_buffer import RingBuffer
+
+
+LOG_MAX_LINES = 10_000  # 게임 로그에 보관할 최대 줄 수
+
+
+class StatePanel(Static):
+    """게임 상태 패널 (라벨 참조는 구성할 때 보관하고, 보여줄 값이 바뀐 라벨만 갱신)"""
+
+    def __init__(self, game_state: GameState):
+        super().__init__()
+        self.game_state = game_state
+        self.labels: Dict[str, Label] = {}
+        self._shown: Dict[str, str] = {}  # 라벨별 마지막으로 표시한 문자열
+        self._last_state = None  # 마지막으로 그린 상태 (같으면 포맷팅도 건너뜀)
+
+    def state_label(self, label_id: str, text: str = "") -> Label:
+        """갱신할 라벨 생성 후 참조 보관"""
+        label = self.labels[label_id] = Label(text, id=label_id)
+        self._shown[label_id] = text
+        return label
+
+    def set_label(self, label_id: str, text: str):
+        """표시 중인 문자열과 다를 때만 라벨 갱신"""
+        if self._shown.get(label_id) != text:
+            self._shown[label_id] = text
+            self.labels[label_id].update(text)
+
+    def is_dirty(self, state) -> bool:
+        """상태가 마지막으로 그린 것과 다른지 확인하고 기록"""
+        if state == self._last_state:
+            return False
+        self._last_state = state
+        return True
+
+
+class CharacterPanel(StatePanel):
+    """캐릭터 정보 패널"""
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="character-panel"):
+            yield Label("캐릭터 정보", classes="panel-title")
+            yield self.state_label("level-label")
+            yield self.state_label("hp-label")
+            yield self.state_label("exp-label")
+            yield self.state_label("attack-label")
+            yield self.state_label("defense-label")
+            yield self.state_label("gold-label")
+    
+    def update_stats(self):
+        """스탯 업데이트 (바뀐 스탯만)"""
+        game = self.game_state
+        state = (game.player_level, game.player_hp, game.player_max_hp, game.player_exp,
+                 game.player_exp_needed, game.total_attack, game.total_defense, game.player_gold)
+        if not self.is_dirty(state):
+            return
+        level, hp, max_hp, exp, exp_needed, attack, defense, gold = state
+        self.set_label("level-label", f"레벨: {level}")
+        self.set_label("hp-label", f"체력: {hp}/{max_hp}")
+        self.set_label("exp-label", f"경험치: {exp}/{exp_needed}")
+        self.set_label("attack-label", f"공격력: {attack}")
+        self.set_label("defense-label", f"방어력: {defense}")
+        self.set_label("gold-label", f"골드: {gold}")
+
+
+class RoomPanel(StatePanel):
+    """방 정보 패널"""
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="room-panel"):
+            yield Label("현재 위치", classes="panel-title")
+            yield self.state_label("room-name-label")
+            yield self.state_label("room-description-label")
+            yield self.state_label("room-exits-label")
+            yield self.state_label("room-items-label")
+            yield self.state_label("room-monsters-label")
+    
+    def update_room(self):
+        """방 정보 업데이트 (방, 출구, 방 아이템이 바뀐 경우만)"""
+        room = self.game_state.get_current_room()
+        room_items = self.game_state.get_room_items()
+        monsters = tuple(self.game_state.get_room_monsters())
+        if not self.is_dirty((self.game_state.current_room_id, tuple(room.exits), tuple(room_items.stacks()), monsters)):
+            return
+        self.set_label("room-name-label", f"장소: {room.name}")
+        self.set_label("room-description-label", f"설명: {room.description}")
+
+        exits_text = ", ".join([exit.value for exit in room.exits.keys()])
+        self.set_label("room-exits-label", f"출구: {exits_text}")
+
+        items_text = room_items.summary() if room_items else "없음"
+        self.set_label("room-items-label", f"아이템: {items_text}")
+
+        monsters_text = ", ".join([monster.name for monster in monsters]) if monsters else "없음"
+        self.set_label("room-monsters-label", f"몬스터: {monsters_text}")
+
+
+class CombatPanel(StatePanel):
+    """전투 패널"""
+    
+    def compose(self) -> ComposeResult:
+        with Container(classes="combat-panel"):
+            yield Label("전투", classes="panel-title")
+            yield self.state_label("combat-status-label")
+            yield Button("공격", id="attack-button", classes="combat-button")
+            yield Button("도망", id="flee-button", classes="combat-button")
+    
+    def update_combat(self):
+        """전투 상태 업데이트 (몬스터나 체력이 바뀐 경우만)"""
+        monster = self.game_state.current_monster if self.game_state.in_combat else None
+        if not self.is_dirty((monster, monster.hp) if monster else None):
+            return
+        if monster:
+            self.set_label("combat-status-label", f"{monster.name} (HP: {monster.hp}/{monster.max_hp})")
+        # 클래스 변경은 스타일 재계산을 일으키므로 보이기/숨기기가 바뀔 때만
+        if self.has_class("visible") != (monster is not None):
+            self.set_class(monster is not None, "visible")
+
+
+class GameLog(ScrollView):
+    """게임 로그 (최근 max_lines줄만 원형 버퍼에 보관하고 화면에 보이는 줄만 그림)"""
+
+    def __init__(self, max_lines: int = LOG_MAX_LINES):
+        super().__init__()
+        self.lines: RingBuffer[str] = RingBuffer(max_lines)
+        self._width = 0
+        self._follow_pending = False  # 화면 갱신 후 끝으로 스크롤 예약됨
+        self.styles.background = "black"
+        self.styles.color = "white"
+        self.styles.height = "20"
+
+    def add_message(self, message: str):
+        """메시지 추가"""
+        self.add_messages((message,))
+
+    def add_messages(self, messages: Iterable[str]):
+        """여러 메시지를 한 번에 추가 (화면 갱신도 한 번)"""
+        new_lines: List[str] = []
+        for message in messages:
+            new_lines.extend(message.split("\n"))
+        if not new_lines:
+            return
+        # 끝을 보고 있었으면 새 줄을 따라감 (스크롤바가 다시 계산된 뒤에 스크롤)
+        if not self._follow_pending and self.is_vertical_scroll_end:
+            self._follow_pending = True
+            self.call_after_refresh(self._follow_end)
+        self.lines.extend(new_lines)
+        self._width = max(self._width, max(map(cell_len, new_lines)))
+        self.virtual_size = Size(self._width, len(self.lines))
+        self.refresh()
+
+    def _follow_end(self):
+        self._follow_pending = False
+        self.scroll_end(animate=False, immediate=True, x_axis=False)
+
+    def clear(self):
+        self.lines.clear()
+        self._width = 0
+        self.virtual_size = Size(0, 0)
+        self.refresh()
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        index = scroll_y + y
+        width = self.size.width
+        style = self.rich_style
+        if index >= len(self.lines):
+            return Strip.blank(width, style)
+        strip = Strip([Segment(self.lines[index], style)])
+        return strip.crop_extend(scroll_x, scroll_x + width, style)
+
+
+class MUDGame(App):
+    """메인 MUD 게임 애플리케이션"""
+    
+    CSS = """
+    Screen {
+        background: $surface;
+    }
+    
+    .character-panel, .room-panel, .combat-panel {
+        background: $boost;
+        border: solid $accent;
+        height: auto;
+        padding: 1;
+    }
+
+    StatePanel {
+        height: auto;
+    }
+
+    CharacterPanel, .character-panel {
+        height: 100%;
+    }
+
+    CharacterPanel, #side-column {
+        width: 1fr;
+    }
+
+    #center-column {
+        width: 2fr;
+    }
+
+    .panel-title {
+        text-style: bold;
+        color: $accent;
+        margin-bottom: 1;
+    }
+    
+    .combat-button {
+        margin: 1;
+        width: 100%;
+    }
+    
+    .combat-panel {
+        display: none;
+    }
+    
+    CombatPanel.visible .combat-panel {
+        display: block;
+    }
+    
+    #game-log {
+        background: black;
+        color: white;
+        height: 20;
+        border: solid $accent;
+    }
+    
+    #command-input {
+        background: $boost;
+        border: solid $accent;
+        margin-top: 1;
+    }
+    """
+    
+    def __init__(self, world: Optional[World] = None, save_path=None, metrics: Optional[CommandMetrics] = None):
+        super().__init__()
+        # save_path가 있으면 저장된 게임을 불러오고 명령어마다 저널에 기록 (몬스터 스폰 상태도 함께 저장/복원)
+        self.save = SaveFile(save_path) if save_path is not None else None
+        if self.save:
+            self.game_state = self.save.load(world, spawns=True)
+        else:
+            self.game_state = GameState(world)
+            attach_spawns(self.game_state)
+        self.spawns = self.game_state.spawns
+        self.spawns.on_event = self.on_world_event
+        self.game_state.metrics = metrics
+        # 월드 시스템은 입력 처리와 별개로 고정 간격 틱에서 실행
+        self.ticks = TickLoop()
+        self.ticks.add_system("spawns", lambda tick: self.game_state.tick_spawns())
+        self.ticks.add_system("regen", self.regenerate)
+        self.ticks.on_overrun = self.on_tick_overrun
+        self.game_log = GameLog()
+        self.character_panel = CharacterPanel(self.game_state)
+        self.room_panel = RoomPanel(self.game_state)
+        self.combat_panel = CombatPanel(self.game_state)
+    
+    def compose(self) -> ComposeResult:
+        """UI 구성"""
+        yield Header(show_clock=True)
+        
+        with Container():
+            with Horizontal():
+                # 왼쪽 패널 - 캐릭터 정보
+                yield self.character_panel
+                
+                # 중앙 패널 - 게임 로그
+                with Vertical(id="center-column"):
+                    yield self.game_log
+                    yield Input(placeholder="명령어를 입력하세요...", id="command-input")
+                
+                # 오른쪽 패널 - 방 정보 및 전투
+                with Vertical(id="side-column"):
+                    yield self.room_panel
+                    yield self.combat_panel
+        
+        yield Footer()
+    
+    def on_mount(self) -> None:
+        """앱 마운트 시 초기화"""
+        self.game_log.add_messages([
+            "환상의 세계 MUD에 오신 것을 환영합니다!",
+            "도움말을 보려면 '도움말'을 입력하세요.",
+        ])
+        self.update_ui()
+        self.set_interval(self.ticks.interval, self.ticks.tick)
+
+    def on_unmount(self) -> None:
+        """앱 종료 시 (종료 명령어, Ctrl+Q 모두) 스냅샷 저장과 명령어 지표 기록"""
+        if self.save:
+            self.save.checkpoint(self.game_state)
+            self.save.close()
+        if self.game_state.metrics is not None:
+            self.game_state.metrics.dump()
+
+    def regenerate(self, tick: int):
+        """틱 시스템: REGEN_TICKS마다 체력 회복 (저널에 기록되는 게임의 월드 틱 수를 따름)"""
+        if self.game_state.regen_tick():
+            self.character_panel.update_stats()
+
+    def on_tick_overrun(self, overrun: Overrun):
+        """틱 예산 초과는 Textual 개발 로그에 남김 (textual console로 확인)"""
+        name, elapsed = overrun.systems[0]
+        self.log.warning(f"틱 {overrun.tick} 예산 초과: {overrun.elapsed * 1e3:.1f}ms ({name} {elapsed * 1e3:.1f}ms)")
+
+    def on_world_event(self, room_id: str, message: str):
+        """월드 틱에서 생긴 몬스터 알림 (현재 방 것만 표시)"""
+        if room_id == self.game_state.current_room_id:
+            self.game_log.add_message(message)
+            self.room_panel.update_room()
+    
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        """명령어 입력 처리"""
+        command = event.value.strip().lower()
+        event.input.value = ""
+        
+        if not command:
+            return
+        
+        self.process_command(command)
+    
+    def process_command(self, command: str):
+        """명령어 처리"""
+        cmd, messages = COMMANDS.dispatch(self.game_state, command)
+        if self.save:
+            self.save.record(self.game_state, command)
+        if cmd is not None and cmd.name == "quit":
+            self.exit()  # 저장과 지표 기록은 on_unmount에서 (Ctrl+Q로 끝내도 같음)
+
+        # 화면 반영 시간만 잼 (저널/스냅샷 디스크 쓰기 제외)
+        metrics = self.game_state.metrics
+        start = time.perf_counter()
+        self.game_log.add_messages(messages)
+        self.update_ui()
+        if metrics is not None:
+            metrics.record(cmd.name if cmd is not None else "unknown", "render", time.perf_counter() - start)
+    
+    def check_room_events(self):
+        """방 진입 시 이벤트 체크"""
+        self.game_log.add_messages(self.game_state.check_room_events())
+    
+    def show_help(self):
+        """도움말 표시"""
+        self.game_log.add_messages(HELP_TEXT.strip().split('\n'))
+    
+    def update_ui(self):
+        """UI 업데이트 (각 패널은 바뀐 부분만 다시 그림)"""
+        self.character_panel.update_stats()
+        self.room_panel.update_room()
+        self.combat_panel.update_combat()
+    
+    def on_button_pressed(self, event: Button.Pressed) -> None:
+        """버튼 클릭 처리"""
+        if event.button.id == "attack-button":
+            self.process_command("공격")
+        elif event.button.id == "flee-button":
+            self.process_command("도망")
+
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 월드 데이터 파일
+JSON 월드 파일을 한 번 검증한 뒤 파일 해시로 구분되는 바이너리 캐시로 저장하고,
+다음 실행부터는 캐시를 바로 읽어 World를 만든다
+"""
+
+import gc
+import hashlib
+import json
+import os
+import pickle
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from game_core import OPPOSITE_DIRECTION, Direction, Item, ItemType, MonsterTemplate, Room, World
+
+
+DEFAULT_WORLD_PATH = Path(__file__).resolve().parent / "data" / "world.json"
+CACHE_VERSION = 4  # 캐시 형식이나 World 구조가 바뀌면 올린다
+
+ITEM_FIELDS = ("attack", "defense", "heal", "value")
+MONSTER_FIELDS = ("max_hp", "attack", "defense", "exp_reward", "gold_reward")
+DIRECTIONS = {direction.name.lower(): direction for direction in Direction}
+
+
+class WorldDataError(ValueError):
+    """월드 데이터 검증 실패"""
+
+    def __init__(self, path: Union[str, Path], errors: List[str]):
+        self.path = str(path)
+        self.errors = errors
+        super().__init__(f"{self.path}: 월드 데이터 오류 {len(errors)}건\n  " + "\n  ".join(errors))
+
+
+def validate_world_data(data: Dict[str, Any], allow_one_way: bool = False) -> List[str]:
+    """월드 데이터 검증 후 오류 목록 반환 (빈 목록이면 정상)"""
+    errors: List[str] = []
+    items = data.get("items", {})
+    monsters = data.get("monsters", {})
+    rooms = data.get("rooms", {})
+
+    for key, item in items.items():
+        if "name" not in item:
+            errors.append(f"아이템 {key}: name이 없습니다")
+        if item.get("item_type") not in ItemType.__members__:
+            errors.append(f"아이템 {key}: 알 수 없는 item_type {item.get('item_type')!r}")
+
+    for key, monster in monsters.items():
+        for field in ("name",) + MONSTER_FIELDS:
+            if field not in monster:
+                errors.append(f"몬스터 {key}: {field}이(가) 없습니다")
+
+    start_room = data.get("start_room")
+    if start_room not in rooms:
+        errors.append(f"시작 방 {start_room!r}이(가) 없습니다")
+
+    for room_id, room in rooms.items():
+        for field in ("name", "description"):
+            if field not in room:
+                errors.append(f"방 {room_id}: {field}이(가) 없습니다")
+        for direction_name, target in room.get("exits", {}).items():
+            direction = DIRECTIONS.get(direction_name)
+            if direction is None:
+                errors.append(f"방 {room_id}: 알 수 없는 방향 {direction_name!r}")
+            elif target not in rooms:
+                errors.append(f"방 {room_id}: {direction_name} 출구가 없는 방 {target!r}을(를) 가리킵니다")
+            elif not allow_one_way:
+                back = rooms[target].get("exits", {}).get(OPPOSITE_DIRECTION[direction].name.lower())
+                if back != room_id:
+                    errors.append(f"방 {room_id}: {direction_name} 출구 → {target} 가 일방통행입니다")
+        for key in room.get("items", []):
+            if key not in items:
+                errors.append(f"방 {room_id}: 알 수 없는 아이템 {key!r}")
+        for key in room.get("monsters", []):
+            if key not in monsters:
+                errors.append(f"방 {room_id}: 알 수 없는 몬스터 {key!r}")
+
+    return errors
+
+
+def build_world(data: Dict[str, Any]) -> World:
+    """검증된 월드 데이터로 World 생성"""
+    items = {
+        key: Item(
+            item["name"], ItemType[item["item_type"]],
+            **{field: item.get(field, 0) for field in ITEM_FIELDS},
+            description=item.get("description", ""),
+        )
+        for key, item in data["items"].items()
+    }
+    monsters = {
+        key: MonsterTemplate(
+            monster["name"], *(monster[field] for field in MONSTER_FIELDS),
+            description=monster.get("description", ""),
+        )
+        for key, monster in data["monsters"].items()
+    }
+    rooms = {
+        room_id: Room(
+            name=room["name"],
+            description=sys.intern(room["description"]),  # 생성된 월드는 설명문이 몇 종류뿐이라 공유
+            exits={DIRECTIONS[name]: target for name, target in room.get("exits", {}).items()},
+            items=tuple(items[key] for key in room.get("items", ())),
+            monsters=tuple(monsters[key] for key in room.get("monsters", ())),
+            npcs=tuple(room.get("npcs", ())),
+            is_safe=room.get("is_safe", False),
+        )
+        for room_id, room in data["rooms"].items()
+    }
+    return World(rooms, items, monsters, data["start_room"])
+
+
+def world_to_data(world: World) -> Dict[str, Any]:
+    """World를 월드 파일 형식의 데이터로 변환 (build_world의 역변환)"""
+    return {
+        "start_room": world.start_room_id,
+        "items": {
+            key: {
+                "name": item.name, "item_type": item.item_type.name,
+                **{field: getattr(item, field) for field in ITEM_FIELDS if getattr(item, field)},
+                "description": item.description,
+            }
+            for key, item in world.items.items()
+        },
+        "monsters": {
+            key: {
+                "name": monster.name,
+                **{field: getattr(monster, field) for field in MONSTER_FIELDS},
+                "description": monster.description,
+            }
+            for key, monster in world.monsters.items()
+        },
+        "rooms": {
+            room_id: {
+                "name": room.name,
+                "description": room.description,
+                "exits": {direction.name.lower(): target for direction, target in room.exits.items()},
+                "items": [world.key_of(item) for item in room.items],
+                "monsters": [world.key_of(monster) for monster in room.monsters],
+                "npcs": list(room.npcs),
+                "is_safe": room.is_safe,
+            }
+            for room_id, room in world.rooms.items()
+        },
+    }
+
+
+def cache_path_for(path: Path, digest: str, cache_dir: Optional[Path] = None) -> Path:
+    """월드 파일과 해시에 해당하는 캐시 파일 경로"""
+    directory = cache_dir if cache_dir is not None else path.parent / "__pycache__"
+    return directory / f"{path.stem}.{digest[:16]}.world.pickle"
+
+
+def load_world(path: Union[str, Path] = DEFAULT_WORLD_PATH, use_cache: bool = True,
+               cache_dir: Optional[Union[str, Path]] = None, allow_one_way: bool = False) -> World:
+    """월드 파일 읽기 (캐시가 있으면 파싱과 검증을 건너뜀)"""
+    path = Path(path)
+    raw = path.read_bytes()
+    hasher = hashlib.sha256(raw)
+    hasher.update(f"v{CACHE_VERSION}:{allow_one_way}".encode())
+    cache_path = cache_path_for(path, hasher.hexdigest(), Path(cache_dir) if cache_dir else None)
+
+    if use_cache:
+        world = read_cache(cache_path)
+        if world is not None:
+            return world
+
+    data = json.loads(raw)
+    errors = validate_world_data(data, allow_one_way)
+    if errors:
+        raise WorldDataError(path, errors)
+    world = build_world(data)
+
+    if use_cache:
+        write_cache(world, cache_path)
+    return world
+
+
+def read_cache(cache_path: Path) -> Optional[World]:
+    """캐시 읽기 (없거나, 손상되었거나, 클래스가 바뀐 예전 캐시면 None → 다시 만듦)"""
+    # 많은 객체를 한꺼번에 만드는 동안 순환 GC가 반복 실행되지 않도록 잠시 끈다
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        with open(cache_path, "rb") as f:
+            world = pickle.load(f)
+    except Exception:  # 예전 클래스/모듈을 가리키는 캐시는 ImportError, TypeError 등 무엇이든 낼 수 있음
+        return None
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return world if isinstance(world, World) else None
+
+
+def write_cache(world: World, cache_path: Path):
+    """캐시 저장 (쓰기 권한이 없으면 조용히 건너뜀)"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump(world, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+환상의 세계 MUD - 절차적 월드 생성기
+시드 기반으로 1천 ~ 1백만 개 방의 격자형 월드를 생성 (확장성 측정용)
+
+    python worldgen.py --rooms 10000 --seed 1 -o big_world.json
+"""
+
+import argparse
+import json
+import random
+from typing import Dict, List, Optional
+
+from game_core import OPPOSITE_DIRECTION, Direction, Room, World
+
+
+REGIONS = ["초원", "숲", "늪지", "동굴", "폐허", "산길", "사막", "설원"]
+DESCRIPTIONS = [
+    "바람 소리만 들리는 조용한 곳입니다.",
+    "어디선가 짐승의 울음소리가 들립니다.",
+    "발밑에 오래된 발자국이 남아 있습니다.",
+    "안개가 짙게 깔려 있습니다.",
+    "무언가가 지켜보는 느낌이 듭니다.",
+]
+
+
+def room_id(index: int) -> str:
+    return f"r{index}"
+
+
+def generate_world(rooms: int, seed: int = 0, base: Optional[World] = None,
+                   loop_chance: float = 0.3, item_chance: float = 0.2,
+                   monster_chance: float = 0.35) -> World:
+    """격자 위에 무작위 신장 트리 + 추가 통로를 깔아 연결된 월드 생성
+
+    모든 출구는 양방향이며, 아이템/몬스터 템플릿은 base 월드(기본값: 기본 월드)의 것을 공유한다.
+    """
+    if rooms < 1:
+        raise ValueError("rooms는 1 이상이어야 합니다")
+    base = base if base is not None else World.default()
+    rng = random.Random(seed)
+    width = max(1, int(rooms ** 0.5))
+    item_templates = list(base.items.values())
+    monster_templates = list(base.monsters.values())
+
+    ids = [room_id(i) for i in range(rooms)]  # 출구마다 같은 문자열 객체를 공유
+    exits: List[Dict[Direction, str]] = [{} for _ in range(rooms)]
+
+    def connect(a: int, b: int, direction: Direction):
+        exits[a][direction] = ids[b]
+        exits[b][OPPOSITE_DIRECTION[direction]] = ids[a]
+
+    for i in range(1, rooms):
+        west = i - 1 if i % width else None
+        north = i - width if i >= width else None
+        # 각 방을 서쪽 또는 북쪽 방 중 하나와 반드시 연결해 전체가 이어지도록 한다 (이진 트리 미로)
+        if west is not None and (north is None or rng.random() < 0.5):
+            connect(i, west, Direction.WEST)
+            if north is not None and rng.random() < loop_chance:
+                connect(i, north, Direction.NORTH)
+        else:
+            connect(i, north, Direction.NORTH)
+            if west is not None and rng.random() < loop_chance:
+                connect(i, west, Direction.WEST)
+
+    world_rooms: Dict[str, Room] = {}
+    for i in range(rooms):
+        region = REGIONS[(i // width // 8 + i % width // 8) % len(REGIONS)]
+        items = (rng.choice(item_templates),) if item_templates and rng.random() < item_chance else ()
+        monsters = (rng.choice(monster_templates),) if monster_templates and rng.random() < monster_chance else ()
+        world_rooms[ids[i]] = Room(
+            name=f"{region} {i}",
+            description=rng.choice(DESCRIPTIONS),
+            exits=exits[i],
+            items=items,
+            monsters=monsters if i else (),
+            npcs=(),
+            is_safe=i == 0,
+        )
+    return World(world_rooms, base.items, base.monsters, ids[0])
+
+
+def main():
+    from world_data import world_to_data
+
+    parser = argparse.ArgumentParser(description="절차적 월드 생성기")
+    parser.add_argument("--rooms", type=int, default=1_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", required=True, help="저장할 JSON 파일")
+    args = parser.parse_args()
+
+    world = generate_world(args.rooms, args.seed)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(world_to_data(world), f, ensure_ascii=False)
+    print(f"방 {len(world):,}개를 {args.output}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()